@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Drop-off check-in benchmark: a start + check-in request pair per QR scan vs. one batch request
+Books N children across a few franchises, then checks them all in through the
+API both ways (fresh app each time) and reports wall time and requests sent.
+Prints one JSON object.
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+from benchmarks.datasets import BASE_DAY, make_franchises
+from src.api.config import AppConfig
+from src.api.main import create_app
+
+def booked_client(config: AppConfig, scans: int, franchise_count: int):
+    client = TestClient(create_app(config))
+    client.__enter__()
+    container = client.app.state.container
+    franchises = make_franchises(franchise_count, max_capacity=scans)
+    for franchise in franchises:
+        container.franchise_repo.save(franchise)
+    start = BASE_DAY + timedelta(hours=8)
+    bookings = [{
+        "franchise_id": franchises[i % franchise_count].id,
+        "start_datetime": start.isoformat(),
+        "end_datetime": (start + timedelta(hours=8)).isoformat(),
+        "customer_name": f"Parent {i}",
+        "customer_email": f"parent{i}@example.com",
+        "customer_phone": "+1-555-0100",
+        "child_name": f"Child {i}",
+        "child_age": 4
+    } for i in range(scans)]
+    results = client.post("/api/v1/bookings/bulk", json={"bookings": bookings}).json()["results"]
+    qr_codes = [base64.b64encode(result["booking_id"].encode()).decode() for result in results]
+    return client, qr_codes
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scans", type=int, default=200)
+    parser.add_argument("--franchises", type=int, default=4)
+    parser.add_argument("--backend", choices=("memory", "sqlite"), default="memory")
+    args = parser.parse_args()
+    
+    def config() -> AppConfig:
+        if args.backend == "sqlite":
+            return AppConfig(storage_backend="sqlite", sqlite_path=tempfile.mktemp(suffix=".db"))
+        return AppConfig()
+    
+    client, qr_codes = booked_client(config(), args.scans, args.franchises)
+    started = time.perf_counter()
+    for qr_data in qr_codes:
+        response = client.post("/api/v1/admin/sessions", json={"qr_data": qr_data, "staff_id": "staff-1"})
+        session_id = response.json()["session_id"]
+        client.post(f"/api/v1/admin/sessions/{session_id}/checkin", json={"photo_data": "photo"})
+    one_by_one_seconds = time.perf_counter() - started
+    client.__exit__(None, None, None)
+    
+    client, qr_codes = booked_client(config(), args.scans, args.franchises)
+    started = time.perf_counter()
+    response = client.post("/api/v1/admin/sessions/batch", json={
+        "staff_id": "staff-1",
+        "scans": [{"qr_data": qr_data, "photo_data": "photo"} for qr_data in qr_codes]
+    }).json()
+    batch_seconds = time.perf_counter() - started
+    client.__exit__(None, None, None)
+    
+    print(json.dumps({
+        "benchmark": "batch_checkin",
+        "backend": args.backend,
+        "scans": args.scans,
+        "checked_in": response["started"],
+        "one_by_one_requests": 2 * args.scans,
+        "one_by_one_ms": round(one_by_one_seconds * 1000, 2),
+        "batch_requests": 1,
+        "batch_ms": round(batch_seconds * 1000, 2),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Bulk booking benchmark: create_booking in a loop vs. one create_bookings batch
+Imports N bookings spread over a few franchises and 30 days into fresh
+in-memory repositories both ways, with capacity low enough that some are
+rejected, and checks that both ways accept the same bookings.
+Prints one JSON object.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises
+from src.application.services.booking_service import BookingApplicationService, NewBooking
+from src.domain.value_objects.child_info import ChildInfo
+from src.domain.value_objects.customer_info import CustomerInfo
+from src.infrastructure.events.event_publisher import EventPublisher
+from src.infrastructure.events.event_store import EventStore
+from src.infrastructure.repositories.booking_repository import BookingRepository
+from src.infrastructure.repositories.franchise_repository import FranchiseRepository
+from src.infrastructure.repositories.payment_repository import PaymentRepository
+
+def build_service(franchises) -> BookingApplicationService:
+    franchise_repo = FranchiseRepository()
+    for franchise in franchises:
+        franchise_repo.save(franchise)
+    return BookingApplicationService(BookingRepository(), franchise_repo, PaymentRepository(),
+                                     EventPublisher(EventStore()))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bookings", type=int, default=10000)
+    parser.add_argument("--franchises", type=int, default=5)
+    parser.add_argument("--capacity", type=int, default=20)
+    args = parser.parse_args()
+    
+    rng = random.Random(11)
+    franchises = make_franchises(args.franchises, max_capacity=args.capacity)
+    batch = []
+    for i in range(args.bookings):
+        start = BASE_DAY + timedelta(days=rng.randrange(30), minutes=rng.randrange(7 * 60, 16 * 60, 15))
+        batch.append(NewBooking(
+            franchise_id=franchises[i % len(franchises)].id,
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=rng.randrange(60, 181, 15)),
+            customer_info=CustomerInfo(f"Parent {i}", f"parent{i}@example.com", "+1-555-0100"),
+            child_info=ChildInfo(f"Child {i}", rng.randrange(1, 10))
+        ))
+    
+    service = build_service(franchises)
+    started = time.perf_counter()
+    one_by_one = []
+    for item in batch:
+        try:
+            service.create_booking(item.franchise_id, item.start_datetime, item.end_datetime,
+                                   item.customer_info, item.child_info)
+            one_by_one.append(True)
+        except ValueError:
+            one_by_one.append(False)
+    loop_seconds = time.perf_counter() - started
+    
+    service = build_service(franchises)
+    service.create_bookings(batch[:1])  # warm up: imports NumPy
+    service = build_service(franchises)
+    started = time.perf_counter()
+    results = service.create_bookings(batch)
+    batch_seconds = time.perf_counter() - started
+    
+    print(json.dumps({
+        "benchmark": "bulk_booking",
+        "bookings": args.bookings,
+        "franchises": args.franchises,
+        "capacity": args.capacity,
+        "created": sum(1 for result in results if result.booking),
+        "one_by_one_ms": round(loop_seconds * 1000, 2),
+        "bulk_ms": round(batch_seconds * 1000, 2),
+        "mismatches": sum((result.booking is not None) != accepted for result, accepted in zip(results, one_by_one)),
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the API
+Reports `python -X importtime` for src.api.main (total, and the modules with
+the most self time) and the wall time from launching uvicorn to the first
+successful response.
+Prints one JSON object.
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+def import_times(runs: int, top: int) -> dict:
+    totals, slowest = [], {}
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import src.api.main"],
+                                cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cumulative_us, module = line[len("import time:"):].split("|")
+            module_name = module.strip()
+            if module_name == "src.api.main":
+                totals.append(int(cumulative_us))
+            slowest[module_name] = max(slowest.get(module_name, 0), int(self_us))
+    return {
+        "import_ms": round(min(totals) / 1000, 1),
+        "slowest_modules_self_ms": {name: round(us / 1000, 1) for name, us
+                               in sorted(slowest.items(), key=lambda item: -item[1])[:top]},
+    }
+
+def first_response_ms(seed: bool, timeout: float = 30.0) -> float:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    env = dict(os.environ, SEED_DEMO_DATA="1" if seed else "0")
+    started = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "src.api.main:app", "--port", str(port),
+                               "--log-level", "warning"], cwd=PROJECT_DIR, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/v1/franchises", timeout=1) as response:
+                    if response.status == 200:
+                        return round((time.perf_counter() - started) * 1000, 1)
+            except OSError:
+                time.sleep(0.005)
+        raise TimeoutError("API did not respond")
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="best of N for each measurement")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    args = parser.parse_args()
+    
+    result = {"benchmark": "cold_start", **import_times(args.runs, args.top)}
+    result["first_response_ms"] = min(first_response_ms(seed=False) for _ in range(args.runs))
+    result["first_response_seeded_ms"] = min(first_response_ms(seed=True) for _ in range(args.runs))
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
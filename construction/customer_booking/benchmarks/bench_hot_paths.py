@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Hot path suite: per-call latency of the booking and session commands at several data sizes
+For every combination of --bookings and --franchises, preloads in-memory
+repositories with that many bookings spread over a year, then times --ops
+calls each of: pricing, availability check, create_booking, process_payment,
+the full session lifecycle (start, check-in, overtime, check-out, complete)
+and cancel_booking, in that order, on the bookings the run created.
+Each size is run --repeat times from scratch and the best of each statistic is
+kept. Prints one JSON object (also written to --output). With --baseline, each
+scenario is compared with the same scenario in an earlier output and the
+script exits non-zero if any slowed by more than --threshold (median latency by
+default, since the mean includes one-off work such as building a franchise day's
+occupancy timeline on its first check).
+"""
+
+import argparse
+import base64
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises, make_bookings
+from src.application.services.booking_service import BookingApplicationService
+from src.application.services.session_service import SessionManagementService
+from src.domain.entities.payment import PaymentMethod
+from src.domain.value_objects.child_info import ChildInfo
+from src.domain.value_objects.customer_info import CustomerInfo
+from src.infrastructure.events.event_publisher import EventPublisher
+from src.infrastructure.events.event_store import EventStore
+from src.infrastructure.repositories.booking_repository import BookingRepository
+from src.infrastructure.repositories.franchise_repository import FranchiseRepository
+from src.infrastructure.repositories.payment_repository import PaymentRepository
+from src.infrastructure.repositories.session_repository import BookingSessionRepository
+
+DAYS = 365
+
+def timed(calls) -> dict:
+    """Run each zero-argument callable once; latency summary in microseconds.
+    The garbage collector is paused, as in timeit, so its pauses do not land on random calls."""
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for call in calls:
+            started = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - started)
+    finally:
+        gc.enable()
+    timings.sort()
+    return {
+        "ops": len(timings),
+        "mean_us": round(statistics.fmean(timings) * 1e6, 2),
+        "p50_us": round(timings[len(timings) // 2] * 1e6, 2),
+        "p95_us": round(timings[int(len(timings) * 0.95)] * 1e6, 2),
+        "ops_per_sec": round(len(timings) / sum(timings), 1),
+    }
+
+def run_size(booking_count: int, franchise_count: int, ops: int, seed: int) -> list:
+    rng = random.Random(seed)
+    franchises = make_franchises(franchise_count)
+    franchise_repo, booking_repo = FranchiseRepository(), BookingRepository()
+    for franchise in franchises:
+        franchise_repo.save(franchise)
+    booking_repo.save_all(make_bookings(franchises, booking_count, days=DAYS, seed=seed))
+    event_publisher = EventPublisher(EventStore())
+    booking_service = BookingApplicationService(booking_repo, franchise_repo, PaymentRepository(), event_publisher)
+    session_service = SessionManagementService(BookingSessionRepository(), booking_repo, event_publisher)
+    
+    def window():
+        start = BASE_DAY + timedelta(days=rng.randrange(DAYS), hours=rng.randrange(8, 16),
+                                     minutes=rng.choice((0, 15, 30, 45)))
+        return rng.choice(franchises), start, start + timedelta(minutes=rng.randrange(60, 181, 15))
+    
+    windows = [window() for _ in range(ops)]
+    booking_ids = []
+    
+    def create(i: int):
+        franchise, start, end = windows[i]
+        customer = CustomerInfo(f"Parent {i}", f"parent{i}@example.com", "+1-555-0100")
+        return lambda: booking_ids.append(
+            booking_service.create_booking(franchise.id, start, end, customer, ChildInfo(f"Child {i}", 4)))
+    
+    def session_lifecycle(booking_id: str):
+        def run():
+            session_id = session_service.start_session(base64.b64encode(booking_id.encode()).decode(), "staff-1")
+            session_service.check_in_child(session_id, "photo")
+            session_service.apply_overtime_charge(session_id, 10)
+            session_service.check_out_child(session_id, "Picked up")
+            session_service.complete_session(session_id)
+        return run
+    
+    pricing, availability = booking_service.pricing_service, booking_service.availability_service
+    scenarios = [
+        ("pricing.calculate_booking_cost", lambda: [
+            lambda w=w: pricing.calculate_booking_cost(*w) for w in windows]),
+        ("availability.check_availability", lambda: [
+            lambda w=w: availability.check_availability(*w) for w in windows]),
+        ("booking.create_booking", lambda: [create(i) for i in range(ops)]),
+        ("booking.process_payment", lambda: [
+            lambda b=b: booking_service.process_payment(b, PaymentMethod.CREDIT_CARD) for b in booking_ids]),
+        ("session.lifecycle", lambda: [session_lifecycle(b) for b in booking_ids]),
+        ("booking.cancel_booking", lambda: [
+            lambda b=b: booking_service.cancel_booking(b, "Benchmark") for b in booking_ids]),
+    ]
+    results = []
+    for name, calls in scenarios:
+        results.append({"scenario": name, "bookings": booking_count, "franchises": franchise_count,
+                        **timed(calls())})
+    return results
+
+def best_of(runs: tuple) -> dict:
+    """One scenario's results from repeated runs, keeping the best value of each statistic"""
+    best = dict(runs[0])
+    for key in ("mean_us", "p50_us", "p95_us"):
+        best[key] = min(run[key] for run in runs)
+    best["ops_per_sec"] = max(run["ops_per_sec"] for run in runs)
+    return best
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: list, baseline_path: str, metric: str, threshold: float) -> list:
+    """Annotate results with the baseline's metric and the ratio to it; return the scenarios that regressed"""
+    with open(baseline_path) as f:
+        baseline = {(r["scenario"], r["bookings"], r["franchises"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        before = baseline.get((result["scenario"], result["bookings"], result["franchises"]))
+        if before is None:
+            continue
+        result["baseline_" + metric] = before[metric]
+        result["ratio"] = round(result[metric] / before[metric], 3)
+        if result["ratio"] > threshold:
+            regressions.append(result)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bookings", default="1000,100000",
+                        help="comma-separated preloaded booking counts, e.g. 1000,100000,1000000")
+    parser.add_argument("--franchises", default="10,1000", help="comma-separated franchise counts")
+    parser.add_argument("--ops", type=int, default=2000, help="timed calls per scenario")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh runs per size; each statistic is the best of them")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    parser.add_argument("--baseline", help="JSON output of an earlier run to compare with")
+    parser.add_argument("--metric", choices=("p50_us", "mean_us"), default="p50_us", help="statistic compared")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+    
+    results = []
+    for booking_count in (int(n) for n in args.bookings.split(",")):
+        for franchise_count in (int(n) for n in args.franchises.split(",")):
+            runs = [run_size(booking_count, franchise_count, args.ops, args.seed) for _ in range(args.repeat)]
+            results.extend(best_of(scenario_runs) for scenario_runs in zip(*runs))
+    
+    report = {
+        "benchmark": "hot_paths",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    regressions = compare(results, args.baseline, args.metric, args.threshold) if args.baseline else []
+    if args.baseline:
+        report["baseline"] = args.baseline
+        report["regressions"] = [r["scenario"] + f" ({r['bookings']} bookings, {r['franchises']} franchises)"
+                                 for r in regressions]
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
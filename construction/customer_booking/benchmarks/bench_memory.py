@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: bytes per booking, session and event
+Allocations are measured with tracemalloc while N objects are built and kept
+alive. Strings shared with other objects (booking ids referenced by sessions
+and events) are built beforehand, so each figure is what one more object costs.
+Prints one JSON object.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import make_franchises, make_bookings
+from src.domain.entities.booking_session import BookingSession
+from src.domain.events.booking_events import BookingCreated, PaymentProcessed
+from src.domain.events.admin_events import ChildCheckedIn
+from src.domain.value_objects.admin_value_objects import ParentPhoto, AdditionalCharge, SessionNotes
+from src.infrastructure.repositories.booking_repository import BookingRepository
+
+def measure(build, count: int):
+    """Return (bytes per item, items) for build(), which must return the live items"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    items = build()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return round(used / count, 1), items
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+    count = args.count
+    
+    franchises = make_franchises(10)
+    booking_bytes, bookings = measure(lambda: make_bookings(franchises, count), count)
+    checked_in = datetime(2030, 1, 7, 9, 0)
+    
+    def build_sessions():
+        sessions = []
+        for booking in bookings:
+            session = BookingSession(booking.id, "staff-1")
+            session.check_in_child(ParentPhoto("photo-ref", checked_in, "staff-1"))
+            session.add_charge(AdditionalCharge("overtime", 5.0, "Overtime: 10 minutes", checked_in))
+            session.check_out_child(SessionNotes("Picked up on time", "staff-1", checked_in + timedelta(hours=3)))
+            sessions.append(session)
+        return sessions
+    session_bytes, sessions = measure(build_sessions, count)
+    
+    def build_events():
+        events = []
+        for booking, session in zip(bookings, sessions):
+            customer, child = booking.customer_info, booking.child_info
+            events.append(BookingCreated(
+                booking_id=booking.id, franchise_id=booking.franchise_id,
+                start_datetime=booking.start_datetime, end_datetime=booking.end_datetime,
+                customer_email=customer.email, child_name=child.name, customer_name=customer.name,
+                customer_phone=customer.phone, child_age=child.age, total_amount=36.0,
+                reference_number=booking.reference_number
+            ))
+            events.append(PaymentProcessed(booking_id=booking.id, payment_id=session.id, amount=36.0,
+                                           payment_method="CREDIT_CARD"))
+            events.append(ChildCheckedIn(session_id=session.id, booking_id=booking.id, child_name=child.name,
+                                         check_in_time=session.check_in_time, staff_member_id="staff-1"))
+        return events
+    event_bytes, events = measure(build_events, 3 * count)
+    
+    def build_repository():
+        repository = BookingRepository()
+        for booking in bookings:
+            repository.save(booking)
+        return repository
+    repository_bytes, repository = measure(build_repository, count)
+    
+    print(json.dumps({
+        "benchmark": "memory",
+        "count": count,
+        "bytes_per_booking": booking_bytes,
+        "bytes_per_session": session_bytes,
+        "bytes_per_event": event_bytes,
+        "repository_index_bytes_per_booking": repository_bytes,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Partitioned engine benchmark: booking throughput vs. number of partitions
+Builds a container with PARTITIONS=0 (everything in this process), 1, 2, 4,
+..., then has a pool of threads create bookings across many franchises
+through container.booking_service, as concurrent API requests would. Each
+run checks that no franchise went over capacity. Throughput can only scale
+up to the number of CPUs reported.
+Prints one JSON object.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises
+from src.api.config import AppConfig
+from src.api.dependencies import build_container
+from src.domain.value_objects.child_info import ChildInfo
+from src.domain.value_objects.customer_info import CustomerInfo
+
+def run(partitions: int, args) -> dict:
+    container = build_container(AppConfig(partitions=partitions, cache_enabled=False))
+    try:
+        franchises = make_franchises(args.franchises, max_capacity=args.capacity)
+        for franchise in franchises:
+            container.franchise_repo.save(franchise)
+        rng = random.Random(3)
+        requests = []
+        for i in range(args.bookings):
+            start = BASE_DAY + timedelta(days=rng.randrange(5), minutes=rng.randrange(9 * 60, 11 * 60, 15))
+            requests.append((franchises[i % len(franchises)].id, start, start + timedelta(hours=2),
+                             CustomerInfo(f"Parent {i}", "parent@example.com", "+1-555-0100"),
+                             ChildInfo(f"Child {i}", 4)))
+        
+        def book(request) -> bool:
+            try:
+                container.booking_service.create_booking(*request)
+                return True
+            except ValueError:
+                return False
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            created = sum(pool.map(book, requests))
+        seconds = time.perf_counter() - started
+        
+        peak = 0
+        for franchise in franchises:
+            bookings = container.booking_repo.find_by_franchise(franchise.id, BASE_DAY, BASE_DAY + timedelta(days=6))
+            for day in range(5):
+                noon = BASE_DAY + timedelta(days=day, hours=10, minutes=59)
+                peak = max(peak, sum(1 for b in bookings if b.start_datetime <= noon < b.end_datetime))
+        return {
+            "partitions": partitions,
+            "bookings": args.bookings,
+            "created": created,
+            "bookings_per_second": round(args.bookings / seconds),
+            "peak_occupancy": peak,
+            "overbooked": peak > args.capacity,
+        }
+    finally:
+        container.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--partitions", default="0,1,2,4", help="comma-separated partition counts; 0 is in-process")
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--franchises", type=int, default=32)
+    parser.add_argument("--capacity", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+    
+    runs = [run(int(count), args) for count in args.partitions.split(",")]
+    print(json.dumps({
+        "benchmark": "partitions",
+        "cpus": os.cpu_count(),
+        "threads": args.threads,
+        "runs": runs,
+    }, indent=2))
+    if any(result["overbooked"] for result in runs):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Pricing benchmark: per-booking pricing vs. one batch quote
+Prices N random candidate windows for one franchise with
+PricingService.calculate_booking_cost in a loop and with
+PricingEngine.quote in a single vectorized call, and checks they agree, also
+for the same windows given with a UTC offset. Prints one JSON object.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import timedelta, timezone
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises
+from src.domain.services.pricing_engine import PricingEngine
+from src.domain.services.pricing_service import PricingService
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--windows", type=int, default=10000)
+    args = parser.parse_args()
+    
+    rng = random.Random(5)
+    franchise = make_franchises(1)[0]
+    windows = []
+    for _ in range(args.windows):
+        start = BASE_DAY + timedelta(days=rng.randrange(30), minutes=rng.randrange(6 * 60, 18 * 60, 15))
+        windows.append((start, start + timedelta(minutes=rng.randrange(30, 10 * 60, 15))))
+    engine = PricingEngine()
+    pricing = PricingService(engine)
+    engine.quote(franchise, windows[:1])  # warm up: imports NumPy and compiles the rate schedule
+    
+    started = time.perf_counter()
+    scalar = [pricing.calculate_booking_cost(franchise, start, end) for start, end in windows]
+    scalar_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    batch = engine.quote(franchise, windows)
+    batch_seconds = time.perf_counter() - started
+    
+    mismatches = sum(int(money.amount * 100) != cents for money, cents in zip(scalar, batch.tolist()))
+    # Offset timestamps are priced by their wall-clock time on both paths
+    offset = timezone(timedelta(hours=2))
+    aware = [(start.replace(tzinfo=offset), end.replace(tzinfo=offset)) for start, end in windows]
+    aware_batch = engine.quote(franchise, aware).tolist()
+    mismatches += sum(engine.price_cents(franchise, start, end) != cents
+                      for (start, end), cents in zip(aware, aware_batch))
+    print(json.dumps({
+        "benchmark": "pricing",
+        "windows": args.windows,
+        "per_booking_ms": round(scalar_seconds * 1000, 2),
+        "batch_quote_ms": round(batch_seconds * 1000, 2),
+        "mismatches": mismatches,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
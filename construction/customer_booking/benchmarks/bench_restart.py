@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Restart benchmark: snapshot + tail replay vs. data size
+Builds N bookings in the in-memory repositories, snapshots them, publishes a
+tail of newer events to a segmented event store, then times a cold restore.
+Prints one JSON object per size.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import make_franchises, make_bookings
+from src.domain.entities.payment import PaymentMethod
+from src.domain.value_objects.child_info import ChildInfo
+from src.domain.value_objects.customer_info import CustomerInfo
+from src.infrastructure.repositories.booking_repository import BookingRepository
+from src.infrastructure.repositories.franchise_repository import FranchiseRepository
+from src.infrastructure.repositories.payment_repository import PaymentRepository
+from src.infrastructure.repositories.session_repository import BookingSessionRepository
+from src.infrastructure.events.segmented_event_store import SegmentedEventStore
+from src.infrastructure.events.event_publisher import EventPublisher
+from src.infrastructure.snapshots.snapshot_store import SnapshotStore
+from src.infrastructure.snapshots.repository_snapshotter import RepositorySnapshotter
+from src.application.services.booking_service import BookingApplicationService
+
+def build_repositories():
+    return FranchiseRepository(), BookingRepository(), PaymentRepository(), BookingSessionRepository()
+
+def run(size: int, franchise_count: int, tail_events: int, workdir: str) -> dict:
+    franchise_repo, booking_repo, payment_repo, session_repo = build_repositories()
+    event_store = SegmentedEventStore(os.path.join(workdir, "events"))
+    snapshotter = RepositorySnapshotter(SnapshotStore(os.path.join(workdir, "snapshots")), event_store,
+                                        franchise_repo, booking_repo, payment_repo, session_repo)
+    
+    franchises = make_franchises(franchise_count)
+    for franchise in franchises:
+        franchise_repo.save(franchise)
+    started = time.perf_counter()
+    for booking in make_bookings(franchises, size):
+        booking_repo.save(booking)
+    load_seconds = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    snapshot_sequence = snapshotter.take_snapshot()
+    snapshot_seconds = time.perf_counter() - started
+    snapshot_bytes = sum(entry.stat().st_size for entry in os.scandir(os.path.join(workdir, "snapshots")))
+    
+    # Recent activity after the snapshot: new bookings, half of them paid
+    service = BookingApplicationService(booking_repo, franchise_repo, payment_repo, EventPublisher(event_store))
+    customer = CustomerInfo("Tail Parent", "tail@example.com", "+1-555-0199")
+    child = ChildInfo("Tail Child", 4)
+    for i in range(tail_events // 2):
+        start = booking_repo.get_all()[0].start_datetime if i == 0 else start + timedelta(days=1)
+        start = start.replace(hour=9, minute=0)
+        booking_id = service.create_booking(franchises[i % franchise_count].id, start, start + timedelta(hours=2),
+                                            customer, child)
+        service.process_payment(booking_id, PaymentMethod.CREDIT_CARD)
+    event_store.close()
+    del franchise_repo, booking_repo, payment_repo, session_repo, snapshotter, service
+    
+    started = time.perf_counter()
+    franchise_repo, booking_repo, payment_repo, session_repo = build_repositories()
+    event_store = SegmentedEventStore(os.path.join(workdir, "events"))
+    snapshotter = RepositorySnapshotter(SnapshotStore(os.path.join(workdir, "snapshots")), event_store,
+                                        franchise_repo, booking_repo, payment_repo, session_repo)
+    replayed = snapshotter.restore()
+    restart_seconds = time.perf_counter() - started
+    event_store.close()
+    
+    return {
+        "benchmark": "restart",
+        "bookings": size,
+        "franchises": franchise_count,
+        "initial_load_seconds": round(load_seconds, 3),
+        "snapshot_sequence": snapshot_sequence,
+        "snapshot_seconds": round(snapshot_seconds, 3),
+        "snapshot_bytes": snapshot_bytes,
+        "events_replayed": replayed,
+        "restart_seconds": round(restart_seconds, 3),
+        "restored_bookings": len(booking_repo.get_all()),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="100000,1000000", help="comma-separated booking counts")
+    parser.add_argument("--franchises", type=int, default=100)
+    parser.add_argument("--tail-events", type=int, default=2000, help="events published after the snapshot")
+    args = parser.parse_args()
+    
+    for size in (int(s) for s in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as workdir:
+            print(json.dumps(run(size, args.franchises, args.tail_events, workdir)), flush=True)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
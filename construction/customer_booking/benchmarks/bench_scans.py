@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Scan benchmark: object loops vs. the columnar booking mirror
+Times "confirmed bookings for one franchise next week" and the 31-day hourly
+occupancy report against BookingRepository with and without columns.
+Prints one JSON object.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises, make_bookings
+from src.domain.entities.booking import BookingStatus
+from src.domain.services.availability_service import AvailabilityService
+from src.infrastructure.repositories.booking_repository import BookingRepository
+
+def best_of(runs: int, fn) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return round(min(timings) * 1000, 3)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bookings", type=int, default=200000)
+    parser.add_argument("--franchises", type=int, default=20)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    
+    rng = random.Random(11)
+    franchises = make_franchises(args.franchises)
+    bookings = make_bookings(franchises, args.bookings, days=args.days)
+    for booking in bookings:
+        if rng.random() < 0.6:
+            booking.mark_paid()
+        elif rng.random() < 0.2:
+            booking.cancel_booking()
+    
+    franchise = franchises[0]
+    week_start = BASE_DAY + timedelta(days=args.days // 2)
+    report_start = week_start.date()
+    result = {"benchmark": "scans", "bookings": args.bookings, "franchises": args.franchises}
+    for label, columnar in (("objects", False), ("columns", True)):
+        repository = BookingRepository(columnar=columnar)
+        for booking in bookings:
+            repository.save(booking)
+        availability = AvailabilityService(repository)
+        result[label] = {
+            "confirmed_next_week_ms": best_of(args.runs, lambda: repository.find_by_franchise(
+                franchise.id, week_start, week_start + timedelta(days=7), BookingStatus.CONFIRMED)),
+            "confirmed_next_quarter_ms": best_of(args.runs, lambda: repository.find_by_franchise(
+                franchise.id, week_start, week_start + timedelta(days=91), BookingStatus.CONFIRMED)),
+            "hourly_occupancy_31_days_ms": best_of(args.runs, lambda: availability.get_hourly_occupancy(
+                franchise, report_start, report_start + timedelta(days=30))),
+        }
+        del repository, availability
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Bulk availability memory check: a batch's footprint must not grow with how far apart its windows are
+Runs check_availability_batch on two one-hour windows, first on consecutive
+days and then --years apart, and measures peak allocation of each with
+tracemalloc. Exits non-zero if the distant pair peaks above --max-ratio
+times the adjacent pair, or if the two batches disagree on availability.
+Prints one JSON object.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises, make_bookings
+from src.domain.services.availability_service import AvailabilityService
+from src.infrastructure.repositories.booking_repository import BookingRepository
+
+def peak_bytes(call) -> int:
+    tracemalloc.start()
+    try:
+        call()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=100)
+    parser.add_argument("--max-ratio", type=float, default=2.0)
+    args = parser.parse_args()
+    
+    franchise = make_franchises(1)[0]
+    booking_repo = BookingRepository()
+    booking_repo.save_all(make_bookings([franchise], 1000, days=30, seed=3))
+    service = AvailabilityService(booking_repo)
+    
+    def windows(gap: timedelta):
+        first = BASE_DAY + timedelta(hours=10)
+        # Same weekday at the far end, so both windows fall within opening hours
+        second = first + timedelta(days=1) if gap.days <= 1 else first + timedelta(weeks=gap.days // 7)
+        return [(first, first + timedelta(hours=1)), (second, second + timedelta(hours=1))]
+    
+    near, far = windows(timedelta(days=1)), windows(timedelta(days=365 * args.years))
+    service.check_availability_batch(franchise, near)  # warm up: imports NumPy and compiles the schedule
+    results = {}
+    near_peak = peak_bytes(lambda: results.setdefault("near", service.check_availability_batch(franchise, near)))
+    far_peak = peak_bytes(lambda: results.setdefault("far", service.check_availability_batch(franchise, far)))
+    
+    ratio = far_peak / near_peak
+    print(json.dumps({
+        "benchmark": "bulk_span_memory",
+        "years_apart": args.years,
+        "adjacent_peak_bytes": near_peak,
+        "distant_peak_bytes": far_peak,
+        "ratio": round(ratio, 2),
+        "available": {"adjacent": results["near"], "distant": results["far"]},
+    }, indent=2))
+    if ratio > args.max_ratio or results["near"][0] != results["far"][0]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Session memory regression check: a session's footprint must not grow with its transitions
+Starts S sessions, checks each child in once, then repeats the check-in N more
+times. Each repeat replaces the photo with one of the same size, so the only
+thing that could grow is the session's event buffer. Measures every session's
+deep size after the first check-in and after the last one, and exits non-zero
+if any session grew or still holds events that were already published.
+Prints one JSON object.
+"""
+
+import argparse
+import base64
+import gc
+import json
+import os
+import sys
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises
+from src.application.services.booking_service import BookingApplicationService
+from src.application.services.session_service import SessionManagementService
+from src.domain.value_objects.child_info import ChildInfo
+from src.domain.value_objects.customer_info import CustomerInfo
+from src.infrastructure.events.event_publisher import EventPublisher
+from src.infrastructure.events.event_store import EventStore
+from src.infrastructure.repositories.booking_repository import BookingRepository
+from src.infrastructure.repositories.franchise_repository import FranchiseRepository
+from src.infrastructure.repositories.payment_repository import PaymentRepository
+from src.infrastructure.repositories.session_repository import BookingSessionRepository
+
+def deep_size(root) -> int:
+    """Bytes of root and every object reachable from it, not counting classes and modules"""
+    seen, stack, total = set(), [root], 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type) or type(obj).__name__ == "module":
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--transitions", type=int, default=500)
+    args = parser.parse_args()
+    
+    franchise = make_franchises(1, max_capacity=args.sessions)[0]
+    franchise_repo, booking_repo, session_repo = FranchiseRepository(), BookingRepository(), BookingSessionRepository()
+    franchise_repo.save(franchise)
+    event_store = EventStore()
+    event_publisher = EventPublisher(event_store)
+    booking_service = BookingApplicationService(booking_repo, franchise_repo, PaymentRepository(), event_publisher)
+    session_service = SessionManagementService(session_repo, booking_repo, event_publisher)
+    
+    start = BASE_DAY + timedelta(hours=9)
+    session_ids = []
+    for i in range(args.sessions):
+        customer = CustomerInfo(f"Parent {i}", f"parent{i}@example.com", "+1-555-0100")
+        booking_id = booking_service.create_booking(franchise.id, start, start + timedelta(hours=3),
+                                                    customer, ChildInfo(f"Child {i}", 4))
+        session_id = session_service.start_session(base64.b64encode(booking_id.encode()).decode(), "staff-1")
+        session_service.check_in_child(session_id, "photo")
+        session_ids.append(session_id)
+    first = [deep_size(session_repo.get_by_id(session_id)) for session_id in session_ids]
+    
+    for _ in range(args.transitions):
+        for session_id in session_ids:
+            session_service.check_in_child(session_id, "photo")
+    sessions = [session_repo.get_by_id(session_id) for session_id in session_ids]
+    last = [deep_size(session) for session in sessions]
+    
+    growth = max(after - before for before, after in zip(first, last))
+    uncommitted = max(len(session.get_uncommitted_events()) for session in sessions)
+    print(json.dumps({
+        "benchmark": "session_memory",
+        "sessions": args.sessions,
+        "transitions_per_session": args.transitions + 2,
+        "events_published": event_store.next_sequence,
+        "bytes_per_session_first": round(sum(first) / len(first), 1),
+        "bytes_per_session_last": round(sum(last) / len(last), 1),
+        "max_growth_bytes": growth,
+        "max_uncommitted_events": uncommitted,
+    }, indent=2))
+    if growth > 0 or uncommitted:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
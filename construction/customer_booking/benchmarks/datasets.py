@@ -0,0 +1,47 @@
+"""Synthetic franchises and bookings shared by the benchmark scripts"""
+
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+from src.domain.entities.booking import Booking
+from src.domain.entities.franchise import Franchise
+from src.domain.value_objects.child_info import ChildInfo
+from src.domain.value_objects.customer_info import CustomerInfo
+from src.domain.value_objects.money import Money
+
+BASE_DAY = datetime(2030, 1, 7)  # a Monday
+
+def make_franchises(count: int, max_capacity: int = 1_000_000) -> List[Franchise]:
+    return [
+        Franchise(
+            name=f"Franchise {i}",
+            address=f"{i} Main St",
+            city="Seattle",
+            postal_code="98101",
+            max_capacity=max_capacity,
+            standard_rate=Decimal("12.00"),
+            peak_hour_rate=Decimal("18.00"),
+            open_time="07:00",
+            close_time="19:00",
+            operating_days=[1, 2, 3, 4, 5, 6, 7]
+        )
+        for i in range(count)
+    ]
+
+def make_bookings(franchises: List[Franchise], count: int, days: int = 365, seed: int = 7) -> List[Booking]:
+    rng = random.Random(seed)
+    bookings = []
+    for i in range(count):
+        start = BASE_DAY + timedelta(days=rng.randrange(days), hours=rng.randrange(8, 16),
+                                     minutes=rng.choice((0, 15, 30, 45)))
+        bookings.append(Booking(
+            franchise_id=franchises[i % len(franchises)].id,
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=rng.randrange(60, 181, 15)),
+            customer_info=CustomerInfo(f"Parent {i}", f"parent{i}@example.com", "+1-555-0100"),
+            child_info=ChildInfo(f"Child {i}", rng.randrange(1, 10)),
+            total_amount=Money(Decimal("36.00"))
+        ))
+    return bookings
\ No newline at end of file
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Concurrent booking stress test: capacity must hold under many threads
+Threads hammer create_booking with overlapping windows on 1, 2, 4, ...
+franchises at once, then every franchise's per-minute occupancy is checked
+against max_capacity. Reports throughput for each franchise count and exits
+non-zero if any franchise was overbooked. --stripes 1 gives a single global
+lock for comparison; --unlocked swaps the locks for no-ops to show the race
+they close.
+Prints one JSON object.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from datetime import timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.datasets import BASE_DAY, make_franchises
+from src.application.services.booking_service import BookingApplicationService
+from src.domain.value_objects.child_info import ChildInfo
+from src.domain.value_objects.customer_info import CustomerInfo
+from src.infrastructure.events.event_publisher import EventPublisher
+from src.infrastructure.events.event_store import EventStore
+from src.infrastructure.locking.striped_lock import StripedLock
+from src.infrastructure.repositories.booking_repository import BookingRepository
+from src.infrastructure.repositories.franchise_repository import FranchiseRepository
+from src.infrastructure.repositories.payment_repository import PaymentRepository
+
+class NoLocks:
+    def hold(self, keys):
+        return nullcontext()
+
+def peak_occupancy(booking_repo: BookingRepository, franchise_id: str, days: int) -> int:
+    deltas = {}
+    for booking in booking_repo.find_by_franchise(franchise_id, BASE_DAY, BASE_DAY + timedelta(days=days + 1)):
+        deltas[booking.start_datetime] = deltas.get(booking.start_datetime, 0) + 1
+        deltas[booking.end_datetime] = deltas.get(booking.end_datetime, 0) - 1
+    peak = present = 0
+    for moment in sorted(deltas):
+        present += deltas[moment]
+        peak = max(peak, present)
+    return peak
+
+def run(franchise_count: int, args) -> dict:
+    franchises = make_franchises(franchise_count, max_capacity=args.capacity)
+    franchise_repo = FranchiseRepository()
+    for franchise in franchises:
+        franchise_repo.save(franchise)
+    booking_repo = BookingRepository()
+    service = BookingApplicationService(booking_repo, franchise_repo, PaymentRepository(),
+                                        EventPublisher(EventStore()), locks=NoLocks() if args.unlocked else StripedLock(args.stripes))
+    
+    outcomes = {"created": 0, "rejected": 0}
+    outcomes_lock = threading.Lock()
+    start_gate = threading.Barrier(args.threads)
+    
+    def worker(seed: int):
+        rng = random.Random(seed)
+        created = rejected = 0
+        start_gate.wait()
+        for i in range(args.requests // args.threads):
+            franchise = franchises[rng.randrange(franchise_count)]
+            # Overlapping late-morning windows on a handful of days
+            start = BASE_DAY + timedelta(days=rng.randrange(args.days), minutes=rng.randrange(9 * 60, 11 * 60, 15))
+            try:
+                service.create_booking(franchise.id, start, start + timedelta(hours=2),
+                                       CustomerInfo(f"Parent {seed}-{i}", "parent@example.com", "+1-555-0100"),
+                                       ChildInfo(f"Child {seed}-{i}", 4))
+                created += 1
+            except ValueError:
+                rejected += 1
+        with outcomes_lock:
+            outcomes["created"] += created
+            outcomes["rejected"] += rejected
+    
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(args.threads)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - started
+    
+    peak = max(peak_occupancy(booking_repo, franchise.id, args.days) for franchise in franchises)
+    return {
+        "franchises": franchise_count,
+        "requests": outcomes["created"] + outcomes["rejected"],
+        "created": outcomes["created"],
+        "requests_per_second": round((outcomes["created"] + outcomes["rejected"]) / seconds),
+        "created_per_second": round(outcomes["created"] / seconds),
+        "peak_occupancy": peak,
+        "overbooked": peak > args.capacity,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=8000, help="per franchise count, split across threads")
+    parser.add_argument("--franchises", default="1,2,4,8", help="comma-separated franchise counts")
+    parser.add_argument("--capacity", type=int, default=25)
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--stripes", type=int, default=64)
+    parser.add_argument("--unlocked", action="store_true")
+    args = parser.parse_args()
+    
+    # Switch threads far more often than the default 5 ms so races have a chance to show
+    sys.setswitchinterval(1e-5)
+    runs = [run(int(count), args) for count in args.franchises.split(",")]
+    print(json.dumps({
+        "benchmark": "booking_concurrency",
+        "threads": args.threads,
+        "capacity": args.capacity,
+        "stripes": 0 if args.unlocked else args.stripes,
+        "runs": runs,
+    }, indent=2))
+    if any(result["overbooked"] for result in runs):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
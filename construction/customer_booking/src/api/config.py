@@ -0,0 +1,80 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+def _flag(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+@dataclass
+class AppConfig:
+    # memory keeps state in process; sqlite persists to sqlite_path (WAL mode)
+    storage_backend: str = "memory"
+    sqlite_path: str = "childcare.db"
+    sqlite_pool_size: int = 5
+    # In-memory backend: keep a NumPy column mirror of bookings for vectorized scans
+    booking_columns: bool = False
+    # Set to keep events in size-rolled segment files instead of an in-process list
+    event_store_dir: Optional[str] = None
+    event_segment_bytes: int = 16 * 1024 * 1024
+    event_retention_segments: Optional[int] = None
+    # async takes publishing off the request path: events are queued and flushed in batches
+    # to the event store, or to event_queue_file as a local SQS stand-in
+    event_publisher_mode: str = "sync"
+    event_queue_file: Optional[str] = None
+    event_queue_size: int = 10000
+    event_batch_size: int = 256
+    event_linger_ms: float = 20.0
+    # In-memory backend only: restore from the latest snapshot plus newer events on startup
+    snapshot_dir: Optional[str] = None
+    snapshot_interval_seconds: float = 300.0
+    # In-process LRU+TTL cache for franchises, availability reports and prices; availability
+    # entries are dropped by BookingCreated/BookingCancelled, franchise-derived ones on save
+    cache_enabled: bool = True
+    cache_max_entries: int = 10000
+    cache_availability_ttl_seconds: float = 300.0
+    cache_franchise_ttl_seconds: float = 24 * 3600.0
+    cache_pricing_ttl_seconds: float = 3600.0
+    # Responses to requests sent with an Idempotency-Key are replayed for retries within the TTL;
+    # kept in an LRU of this size, and in the database with the sqlite backend
+    idempotency_ttl_seconds: float = 24 * 3600.0
+    idempotency_max_keys: int = 10000
+    # Run bookings, sessions and availability in this many worker processes, each owning
+    # the franchises that hash to it; the API process routes to them (in-memory backend only)
+    partitions: int = 0
+    # Parent photos uploaded at check-in, stored by content hash (a local stand-in for S3)
+    blob_store_dir: str = "blobs"
+    blob_store_workers: int = 4
+    max_photo_bytes: int = 20 * 1024 * 1024
+    seed_demo_data: bool = False
+    
+    @classmethod
+    def from_env(cls) -> "AppConfig":
+        retention_segments = os.getenv("EVENT_RETENTION_SEGMENTS")
+        return cls(
+            storage_backend=os.getenv("STORAGE_BACKEND", "memory"),
+            sqlite_path=os.getenv("SQLITE_PATH", "childcare.db"),
+            sqlite_pool_size=int(os.getenv("SQLITE_POOL_SIZE", "5")),
+            booking_columns=_flag(os.getenv("BOOKING_COLUMNS", "false")),
+            event_store_dir=os.getenv("EVENT_STORE_DIR") or None,
+            event_segment_bytes=int(os.getenv("EVENT_SEGMENT_BYTES", str(16 * 1024 * 1024))),
+            event_retention_segments=int(retention_segments) if retention_segments else None,
+            event_publisher_mode=os.getenv("EVENT_PUBLISHER_MODE", "sync"),
+            event_queue_file=os.getenv("EVENT_QUEUE_FILE") or None,
+            event_queue_size=int(os.getenv("EVENT_QUEUE_SIZE", "10000")),
+            event_batch_size=int(os.getenv("EVENT_BATCH_SIZE", "256")),
+            event_linger_ms=float(os.getenv("EVENT_LINGER_MS", "20")),
+            snapshot_dir=os.getenv("SNAPSHOT_DIR") or None,
+            snapshot_interval_seconds=float(os.getenv("SNAPSHOT_INTERVAL_SECONDS", "300")),
+            cache_enabled=_flag(os.getenv("CACHE_ENABLED", "true")),
+            cache_max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "10000")),
+            cache_availability_ttl_seconds=float(os.getenv("CACHE_AVAILABILITY_TTL_SECONDS", "300")),
+            cache_franchise_ttl_seconds=float(os.getenv("CACHE_FRANCHISE_TTL_SECONDS", str(24 * 3600))),
+            cache_pricing_ttl_seconds=float(os.getenv("CACHE_PRICING_TTL_SECONDS", "3600")),
+            idempotency_ttl_seconds=float(os.getenv("IDEMPOTENCY_TTL_SECONDS", str(24 * 3600))),
+            idempotency_max_keys=int(os.getenv("IDEMPOTENCY_MAX_KEYS", "10000")),
+            partitions=int(os.getenv("PARTITIONS", "0")),
+            blob_store_dir=os.getenv("BLOB_STORE_DIR", "blobs"),
+            blob_store_workers=int(os.getenv("BLOB_STORE_WORKERS", "4")),
+            max_photo_bytes=int(os.getenv("MAX_PHOTO_BYTES", str(20 * 1024 * 1024))),
+            seed_demo_data=_flag(os.getenv("SEED_DEMO_DATA", "false"))
+        )
\ No newline at end of file
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+from fastapi import Request
+from .config import AppConfig
+
+@dataclass
+class ServiceContainer:
+    booking_repo: Any
+    franchise_repo: Any
+    payment_repo: Any
+    session_repo: Any
+    event_store: Any
+    event_publisher: Any
+    booking_service: Any
+    session_service: Any
+    snapshotter: Optional[Any] = None
+    sqlite_pool: Optional[Any] = None
+    cache: Optional[Any] = None
+    pricing_engine: Optional[Any] = None
+    partitions: Optional[Any] = None  # PartitionedEngine when config.partitions is set
+    idempotency: Optional[Any] = None
+    blob_store: Optional[Any] = None
+    async_events: bool = False  # event_publisher is an AsyncEventPublisher, started and stopped with the app
+    
+    @property
+    def availability_service(self):
+        return self.booking_service.availability_service
+    
+    def close(self) -> None:
+        if hasattr(self.event_store, "close"):
+            self.event_store.close()
+        if self.sqlite_pool is not None:
+            self.sqlite_pool.close()
+        if self.partitions is not None:
+            self.partitions.close()
+        if self.blob_store is not None:
+            self.blob_store.close()
+
+def build_container(config: AppConfig) -> ServiceContainer:
+    """Create repositories and services for config, importing only the backends it selects"""
+    if config.partitions:
+        return build_partitioned_container(config)
+    
+    sqlite_pool = None
+    if config.storage_backend == "sqlite":
+        from ..infrastructure.repositories.sqlite.connection_pool import SQLiteConnectionPool
+        from ..infrastructure.repositories.sqlite.schema import create_schema
+        from ..infrastructure.repositories.sqlite.booking_repository import SQLiteBookingRepository
+        from ..infrastructure.repositories.sqlite.franchise_repository import SQLiteFranchiseRepository
+        from ..infrastructure.repositories.sqlite.payment_repository import SQLitePaymentRepository
+        from ..infrastructure.repositories.sqlite.session_repository import SQLiteBookingSessionRepository
+        
+        sqlite_pool = SQLiteConnectionPool(config.sqlite_path, size=config.sqlite_pool_size)
+        create_schema(sqlite_pool)
+        booking_repo = SQLiteBookingRepository(sqlite_pool)
+        franchise_repo = SQLiteFranchiseRepository(sqlite_pool)
+        payment_repo = SQLitePaymentRepository(sqlite_pool)
+        session_repo = SQLiteBookingSessionRepository(sqlite_pool)
+    elif config.storage_backend == "memory":
+        from ..infrastructure.repositories.booking_repository import BookingRepository
+        from ..infrastructure.repositories.franchise_repository import FranchiseRepository
+        from ..infrastructure.repositories.payment_repository import PaymentRepository
+        from ..infrastructure.repositories.session_repository import BookingSessionRepository
+        
+        booking_repo = BookingRepository(columnar=config.booking_columns)
+        franchise_repo = FranchiseRepository()
+        payment_repo = PaymentRepository()
+        session_repo = BookingSessionRepository()
+    else:
+        raise ValueError(f"Unknown STORAGE_BACKEND: {config.storage_backend}")
+    
+    if config.event_store_dir:
+        from ..infrastructure.events.segmented_event_store import SegmentedEventStore
+        event_store = SegmentedEventStore(config.event_store_dir, segment_bytes=config.event_segment_bytes,
+                                          retention_segments=config.event_retention_segments)
+    else:
+        from ..infrastructure.events.event_store import EventStore
+        event_store = EventStore()
+    
+    if config.event_publisher_mode == "async":
+        from ..infrastructure.events.async_event_publisher import AsyncEventPublisher
+        from ..infrastructure.events.event_sinks import EventStoreSink, FileQueueSink
+        event_sink = FileQueueSink(config.event_queue_file) if config.event_queue_file else EventStoreSink(event_store)
+        event_publisher = AsyncEventPublisher(event_sink, max_queue_size=config.event_queue_size,
+                                              batch_size=config.event_batch_size, linger_ms=config.event_linger_ms)
+    else:
+        from ..infrastructure.events.event_publisher import EventPublisher
+        event_publisher = EventPublisher(event_store)
+    
+    from ..domain.services.pricing_engine import PricingEngine
+    from ..domain.services.pricing_service import PricingService
+    pricing_engine = PricingEngine()
+    pricing_service = PricingService(pricing_engine)
+    
+    cache = availability_service = None
+    if config.cache_enabled:
+        from ..domain.services.availability_service import AvailabilityService
+        from ..infrastructure.cache.lru_ttl_cache import LRUTTLCache
+        from ..infrastructure.cache.cache_invalidator import CacheInvalidator
+        from ..infrastructure.cache.cached_services import CachedAvailabilityService, CachedPricingService
+        from ..infrastructure.repositories.cached_franchise_repository import CachedFranchiseRepository
+        cache = LRUTTLCache(max_entries=config.cache_max_entries)
+        franchise_repo = CachedFranchiseRepository(franchise_repo, cache, ttl=config.cache_franchise_ttl_seconds)
+        availability_service = CachedAvailabilityService(AvailabilityService(booking_repo), cache,
+                                                         ttl=config.cache_availability_ttl_seconds)
+        pricing_service = CachedPricingService(cache, ttl=config.cache_pricing_ttl_seconds,
+                                               pricing_service=pricing_service)
+        event_publisher.subscribe(CacheInvalidator(cache))
+    
+    from ..application.services.booking_service import BookingApplicationService
+    from ..application.services.session_service import SessionManagementService
+    booking_service = BookingApplicationService(booking_repo, franchise_repo, payment_repo, event_publisher,
+                                                availability_service, pricing_service)
+    session_service = SessionManagementService(session_repo, booking_repo, event_publisher)
+    
+    snapshotter = None
+    if config.snapshot_dir and config.storage_backend == "memory":
+        if not config.event_store_dir:
+            # The in-memory event store restarts at sequence 0, so nothing after the snapshot could be replayed
+            raise ValueError("SNAPSHOT_DIR needs EVENT_STORE_DIR")
+        from ..infrastructure.snapshots.snapshot_store import SnapshotStore
+        from ..infrastructure.snapshots.repository_snapshotter import RepositorySnapshotter
+        snapshotter = RepositorySnapshotter(SnapshotStore(config.snapshot_dir), event_store,
+                                            franchise_repo, booking_repo, payment_repo, session_repo)
+        snapshotter.restore()
+    
+    idempotency_repo = None
+    if sqlite_pool is not None:
+        from ..infrastructure.repositories.sqlite.idempotency_repository import SQLiteIdempotencyRepository
+        idempotency_repo = SQLiteIdempotencyRepository(sqlite_pool)
+    
+    return ServiceContainer(booking_repo, franchise_repo, payment_repo, session_repo, event_store,
+                            event_publisher, booking_service, session_service, snapshotter, sqlite_pool, cache,
+                            pricing_engine, idempotency=build_idempotency_store(config, idempotency_repo),
+                            blob_store=build_blob_store(config),
+                            async_events=config.event_publisher_mode == "async")
+
+def build_partitioned_container(config: AppConfig) -> ServiceContainer:
+    """Start config.partitions worker processes and a container of routing proxies in front of them"""
+    if config.storage_backend != "memory" or config.snapshot_dir:
+        raise ValueError("PARTITIONS needs STORAGE_BACKEND=memory and no SNAPSHOT_DIR")
+    from ..domain.services.pricing_engine import PricingEngine
+    from ..infrastructure.repositories.franchise_repository import FranchiseRepository
+    from ..infrastructure.partitioning.partitioned_engine import PartitionedEngine
+    from ..infrastructure.partitioning.partitioned_services import (
+        PartitionedBookingRepository, PartitionedBookingService, PartitionedCache, PartitionedEventPublisher,
+        PartitionedFranchiseRepository, PartitionedSessionRepository, PartitionedSessionService)
+    
+    engine = PartitionedEngine(config, config.partitions)
+    return ServiceContainer(
+        booking_repo=PartitionedBookingRepository(engine),
+        franchise_repo=PartitionedFranchiseRepository(engine, FranchiseRepository()),
+        payment_repo=None,
+        session_repo=PartitionedSessionRepository(engine),
+        event_store=None,
+        event_publisher=PartitionedEventPublisher(engine),
+        booking_service=PartitionedBookingService(engine),
+        session_service=PartitionedSessionService(engine),
+        cache=PartitionedCache(engine) if config.cache_enabled else None,
+        pricing_engine=PricingEngine(),
+        partitions=engine,
+        idempotency=build_idempotency_store(config),
+        blob_store=build_blob_store(config)
+    )
+
+def build_idempotency_store(config: AppConfig, repository=None):
+    from ..infrastructure.cache.lru_ttl_cache import LRUTTLCache
+    from ..infrastructure.idempotency.idempotency_store import IdempotencyStore
+    # Its own cache, so keys are neither evicted by cached reports nor turned off with CACHE_ENABLED
+    return IdempotencyStore(LRUTTLCache(max_entries=config.idempotency_max_keys),
+                            ttl=config.idempotency_ttl_seconds, repository=repository)
+
+def build_blob_store(config: AppConfig):
+    from ..infrastructure.blobs.local_blob_store import LocalBlobStore
+    return LocalBlobStore(config.blob_store_dir, workers=config.blob_store_workers,
+                          max_object_bytes=config.max_photo_bytes)
+
+def get_container(request: Request) -> ServiceContainer:
+    return request.app.state.container
\ No newline at end of file
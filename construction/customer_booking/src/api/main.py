@@ -1,25 +1,165 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import base64
+import hashlib
+import json
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from datetime import datetime
-from decimal import Decimal
-from typing import Optional
+from datetime import datetime, date, timedelta
+from typing import Any, Callable, List, Optional, Tuple
 
 from ..domain.value_objects.customer_info import CustomerInfo
 from ..domain.value_objects.child_info import ChildInfo
-from ..domain.entities.franchise import Franchise
+from ..domain.entities.booking import Booking, BookingStatus
 from ..domain.entities.payment import PaymentMethod
-from ..infrastructure.repositories.booking_repository import BookingRepository
-from ..infrastructure.repositories.franchise_repository import FranchiseRepository
-from ..infrastructure.repositories.payment_repository import PaymentRepository
-from ..infrastructure.events.event_store import EventStore
-from ..infrastructure.events.event_publisher import EventPublisher
-from ..application.services.booking_service import BookingApplicationService
-from ..application.services.session_service import SessionManagementService
-from ..infrastructure.repositories.session_repository import BookingSessionRepository
-
-app = FastAPI(title="Unified Childcare Management API")
-
-@app.get("/")
+from ..application.services.booking_service import NewBooking
+from ..application.services.session_service import SessionScan
+from ..infrastructure.idempotency.idempotency_store import IdempotencyKeyReused
+from .config import AppConfig
+from .dependencies import ServiceContainer, build_container, get_container
+
+async def take_snapshot(container: ServiceContainer):
+    # Capture only once every queued event has reached the store, so the recorded
+    # sequence number matches the captured state
+    if container.async_events:
+        while container.event_publisher.metrics.queue_depth:
+            await container.event_publisher.flush()
+    state, sequence = await asyncio.to_thread(container.snapshotter.capture)
+    await asyncio.to_thread(container.snapshotter.snapshot_store.write, state, sequence)
+
+async def snapshot_periodically(container: ServiceContainer, interval: float):
+    while True:
+        await asyncio.sleep(interval)
+        await take_snapshot(container)
+
+async def call_service(container: ServiceContainer, method, *args):
+    """Partitioned containers block on worker IPC, so their calls run off the event loop"""
+    if container.partitions is None:
+        return method(*args)
+    return await asyncio.to_thread(method, *args)
+
+async def run_idempotent(container: ServiceContainer, key: Optional[str], route: str, request: BaseModel, execute):
+    """Run execute() once per Idempotency-Key; retries with the key get the first response (or 4xx) back.
+    Exceptions other than a 4xx HTTPException are not stored, so a retry runs execute() again."""
+    if not key or container.idempotency is None:
+        return await execute()
+    if len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+        raise HTTPException(status_code=400,
+                            detail=f"Idempotency-Key is limited to {MAX_IDEMPOTENCY_KEY_LENGTH} characters")
+    
+    async def command():
+        try:
+            return 200, jsonable_encoder(await execute())
+        except HTTPException as e:
+            if e.status_code >= 500:
+                raise
+            return e.status_code, e.detail
+    
+    fingerprint = hashlib.sha256(f"{route}\n{request.model_dump_json()}".encode()).hexdigest()
+    try:
+        stored = await container.idempotency.run(key, fingerprint, command)
+    except IdempotencyKeyReused as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if stored.status_code >= 400:
+        raise HTTPException(status_code=stored.status_code, detail=stored.body)
+    return stored.body
+
+async def list_response(container: ServiceContainer, response: Response,
+                        fetch_page: Callable[[Optional[list], int], list], cursor_key: Callable[[Any], list],
+                        to_row: Callable[[Any], dict], cursor: Optional[str], limit: int, output: str):
+    """Keyset-paginated listing. fetch_page(after, n) returns up to n items after the decoded cursor, in
+    cursor_key order. JSON returns one page, with X-Next-Cursor set when there is more; NDJSON streams
+    every row from the cursor on, one page in memory at a time."""
+    after = _decode_cursor(cursor)
+    page_size = STREAM_PAGE_SIZE if output == "ndjson" else limit + 1
+    try:
+        items = await call_service(container, fetch_page, after, page_size)
+    except (ValueError, IndexError, TypeError):
+        if after is None:
+            raise
+        raise HTTPException(status_code=400, detail="Invalid cursor")  # from another listing, or edited
+    
+    if output == "ndjson":
+        async def rows(items):
+            while True:
+                for item in items:
+                    yield json.dumps(to_row(item)) + "\n"
+                if len(items) < STREAM_PAGE_SIZE:
+                    return
+                items = await call_service(container, fetch_page, cursor_key(items[-1]), STREAM_PAGE_SIZE)
+        
+        return StreamingResponse(rows(items), media_type="application/x-ndjson")
+    
+    if len(items) > limit:
+        items = items[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(cursor_key(items[-1]))
+    return [to_row(item) for item in items]
+
+def _encode_cursor(key: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[list]:
+    if not cursor:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        key = None
+    if not isinstance(key, list):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
+
+def seed_demo_data(container: ServiceContainer) -> bool:
+    """Seed demo data into an empty store (a persistent backend is only seeded once)"""
+    if container.franchise_repo.get_all_active():
+        return False
+    from ..infrastructure.migrations.seed_data import run_migration
+    run_migration(container.franchise_repo, container.booking_repo, container.payment_repo,
+                  container.session_repo, container.event_store, container.event_publisher, container.booking_service)
+    return True
+
+def create_app(config: Optional[AppConfig] = None) -> FastAPI:
+    """Build the API; repositories and services are created at startup, not at import"""
+    config = config or AppConfig.from_env()
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        container = build_container(config)
+        app.state.container = container
+        if container.async_events:
+            await container.event_publisher.start()
+        if config.seed_demo_data and await call_service(container, seed_demo_data, container) and container.snapshotter:
+            await take_snapshot(container)
+        snapshot_task = None
+        if container.snapshotter:
+            snapshot_task = asyncio.create_task(snapshot_periodically(container, config.snapshot_interval_seconds))
+        yield
+        if snapshot_task:
+            snapshot_task.cancel()
+        if container.async_events:
+            await container.event_publisher.stop()
+        if container.snapshotter:
+            await take_snapshot(container)
+        container.close()
+    
+    app = FastAPI(title="Unified Childcare Management API", lifespan=lifespan)
+    app.include_router(router)
+    return app
+
+router = APIRouter()
+
+MAX_QUOTE_WINDOWS = 10000
+MAX_BULK_BOOKINGS = 10000
+MAX_BATCH_SCANS = 1000
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_PAGE_SIZE = 500
+
+@router.get("/")
 async def welcome():
     return {
         "message": "Welcome to Unified Childcare Management System",
@@ -31,20 +171,6 @@ async def welcome():
         }
     }
 
-# Initialize repositories and services
-booking_repo = BookingRepository()
-franchise_repo = FranchiseRepository()
-payment_repo = PaymentRepository()
-session_repo = BookingSessionRepository()
-event_store = EventStore()
-event_publisher = EventPublisher(event_store)
-booking_service = BookingApplicationService(booking_repo, franchise_repo, payment_repo, event_publisher)
-session_service = SessionManagementService(session_repo, booking_repo, event_publisher)
-
-# Seed demo data on startup
-from ..infrastructure.migrations.seed_data import run_migration
-run_migration(franchise_repo, booking_repo, payment_repo, session_repo, event_store, event_publisher)
-
 # Pydantic models
 class CreateBookingRequest(BaseModel):
     franchise_id: str
@@ -61,6 +187,12 @@ class CreateBookingRequest(BaseModel):
     pickup_authorization: str = ""
     special_instructions: str = ""
 
+class BulkBookingRequest(BaseModel):
+    bookings: List[CreateBookingRequest]
+
+class QuoteRequest(BaseModel):
+    windows: List[Tuple[datetime, datetime]]  # [start, end] pairs
+
 class ProcessPaymentRequest(BaseModel):
     payment_method: str = "CREDIT_CARD"
 
@@ -71,70 +203,106 @@ class StartSessionRequest(BaseModel):
 class CheckInRequest(BaseModel):
     photo_data: str
 
+class ScanRequest(BaseModel):
+    qr_data: str
+    photo_data: str
+
+class BatchCheckInRequest(BaseModel):
+    staff_id: str
+    scans: List[ScanRequest]
+
 class OvertimeChargeRequest(BaseModel):
     overtime_minutes: int
 
 class CheckOutRequest(BaseModel):
     notes: str = ""
 
-@app.post("/api/v1/bookings")
-async def create_booking(request: CreateBookingRequest):
-    try:
-        customer_info = CustomerInfo(
-            name=request.customer_name,
-            email=request.customer_email,
-            phone=request.customer_phone,
-            emergency_contact=request.emergency_contact
-        )
-        
-        child_info = ChildInfo(
-            name=request.child_name,
-            age=request.child_age,
-            special_needs=request.special_needs,
-            allergies=request.allergies,
-            pickup_authorization=request.pickup_authorization,
-            special_instructions=request.special_instructions
-        )
+@router.post("/api/v1/bookings")
+async def create_booking(request: CreateBookingRequest, container: ServiceContainer = Depends(get_container),
+                         idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
+    async def execute():
+        try:
+            customer_info, child_info = _booking_details(request)
+            booking_id = await call_service(
+                container,
+                container.booking_service.create_booking,
+                request.franchise_id,
+                request.start_datetime,
+                request.end_datetime,
+                customer_info,
+                child_info
+            )
+            
+            booking = await call_service(container, container.booking_repo.get_by_id, booking_id)
+            return {
+                "booking_id": booking_id,
+                "reference_number": booking.reference_number,
+                "total_amount": float(booking.total_amount.amount),
+                "currency": booking.total_amount.currency,
+                "payment_required": True
+            }
+        except ValueError as e:  # anything else is a 5xx, which run_idempotent does not store
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    return await run_idempotent(container, idempotency_key, "POST /api/v1/bookings", request, execute)
+
+@router.post("/api/v1/bookings/bulk")
+async def create_bookings(request: BulkBookingRequest, container: ServiceContainer = Depends(get_container),
+                          idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
+    async def execute():
+        if len(request.bookings) > MAX_BULK_BOOKINGS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_BOOKINGS} bookings per request")
         
-        booking_id = booking_service.create_booking(
-            request.franchise_id,
-            request.start_datetime,
-            request.end_datetime,
-            customer_info,
-            child_info
-        )
+        batch = []
+        for item in request.bookings:
+            customer_info, child_info = _booking_details(item)
+            batch.append(NewBooking(item.franchise_id, item.start_datetime, item.end_datetime,
+                                    customer_info, child_info))
+        results = await call_service(container, container.booking_service.create_bookings, batch)
         
-        booking = booking_repo.get_by_id(booking_id)
-        return {
-            "booking_id": booking_id,
-            "reference_number": booking.reference_number,
-            "total_amount": float(booking.total_amount.amount),
-            "currency": booking.total_amount.currency,
-            "payment_required": True
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        items = []
+        for result in results:
+            if result.error:
+                items.append({"error": result.error})
+                continue
+            booking = result.booking
+            items.append({
+                "booking_id": booking.id,
+                "reference_number": booking.reference_number,
+                "total_amount": float(booking.total_amount.amount),
+                "currency": booking.total_amount.currency
+            })
+        created = sum(1 for result in results if result.booking)
+        return {"created": created, "failed": len(results) - created, "results": items}
+    
+    return await run_idempotent(container, idempotency_key, "POST /api/v1/bookings/bulk", request, execute)
 
-@app.post("/api/v1/bookings/{booking_id}/payment")
-async def process_payment(booking_id: str, request: ProcessPaymentRequest):
-    try:
-        payment_method = PaymentMethod.CREDIT_CARD
-        payment_id = booking_service.process_payment(booking_id, payment_method)
-        return {"payment_id": payment_id, "status": "completed"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@router.post("/api/v1/bookings/{booking_id}/payment")
+async def process_payment(booking_id: str, request: ProcessPaymentRequest,
+                          container: ServiceContainer = Depends(get_container),
+                          idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
+    async def execute():
+        try:
+            payment_method = PaymentMethod.CREDIT_CARD
+            payment_id = await call_service(container, container.booking_service.process_payment, booking_id,
+                                            payment_method)
+            return {"payment_id": payment_id, "status": "completed"}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    return await run_idempotent(container, idempotency_key, f"POST /api/v1/bookings/{booking_id}/payment", request, execute)
 
-@app.delete("/api/v1/bookings/{booking_id}")
-async def cancel_booking(booking_id: str):
+@router.delete("/api/v1/bookings/{booking_id}")
+async def cancel_booking(booking_id: str, container: ServiceContainer = Depends(get_container)):
     try:
-        booking_service.cancel_booking(booking_id, "Customer request")
+        await call_service(container, container.booking_service.cancel_booking, booking_id, "Customer request")
         return {"status": "cancelled"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.get("/api/v1/bookings/{booking_id}")
-async def get_booking(booking_id: str):
-    booking = booking_repo.get_by_id(booking_id)
+@router.get("/api/v1/bookings/{booking_id}")
+async def get_booking(booking_id: str, container: ServiceContainer = Depends(get_container)):
+    booking = await call_service(container, container.booking_repo.get_by_id, booking_id)
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
@@ -148,55 +316,253 @@ async def get_booking(booking_id: str):
         "total_amount": float(booking.total_amount.amount)
     }
 
-@app.get("/api/v1/franchises")
-async def get_franchises():
-    franchises = franchise_repo.get_all_active()
-    return [{"id": f.id, "name": f.name, "city": f.city} for f in franchises]
+@router.get("/api/v1/franchises")
+async def get_franchises(response: Response, cursor: Optional[str] = None,
+                         limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                         output: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+                         container: ServiceContainer = Depends(get_container)):
+    return await list_response(
+        container, response,
+        lambda after, n: container.franchise_repo.get_active_page(after[0] if after else None, n),
+        lambda f: [f.id],
+        lambda f: {"id": f.id, "name": f.name, "city": f.city},
+        cursor, limit, output)
+
+@router.get("/api/v1/franchises/{franchise_id}/bookings")
+async def list_franchise_bookings(franchise_id: str, response: Response, from_date: date = Query(alias="from"),
+                                  to_date: date = Query(alias="to"), status: Optional[BookingStatus] = None,
+                                  cursor: Optional[str] = None,
+                                  limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                                  output: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+                                  container: ServiceContainer = Depends(get_container)):
+    """Bookings starting between from and to (inclusive), ordered by start time"""
+    if not container.franchise_repo.get_by_id(franchise_id):
+        raise HTTPException(status_code=404, detail="Franchise not found")
+    start_from = datetime.combine(from_date, datetime.min.time())
+    try:
+        start_to = datetime.combine(to_date + timedelta(days=1), datetime.min.time())
+    except OverflowError:
+        raise HTTPException(status_code=400, detail=f"'to' must be before {date.max.isoformat()}")
+    
+    def fetch_page(after: Optional[list], n: int) -> List[Booking]:
+        after_key = (datetime.fromisoformat(after[0]), after[1]) if after else None
+        return container.booking_repo.get_page_by_franchise(franchise_id, start_from, start_to, status, after_key, n)
+    
+    return await list_response(
+        container, response, fetch_page,
+        lambda booking: [booking.start_datetime.isoformat(), booking.id],
+        _booking_row, cursor, limit, output)
+
+@router.get("/api/v1/franchises/{franchise_id}/availability")
+async def get_availability_grid(franchise_id: str, from_date: date = Query(alias="from"),
+                                to_date: date = Query(alias="to"), slot: int = 30,
+                                container: ServiceContainer = Depends(get_container)):
+    franchise = container.franchise_repo.get_by_id(franchise_id)
+    if not franchise:
+        raise HTTPException(status_code=404, detail="Franchise not found")
+    
+    try:
+        grid = await call_service(container, container.availability_service.get_availability_grid,
+                                  franchise, from_date, to_date, slot)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "franchise_id": franchise.id,
+        "from": from_date,
+        "to": to_date,
+        "slot_minutes": grid.slot_minutes,
+        "max_capacity": franchise.max_capacity,
+        "slots": grid.slot_starts,
+        "days": [{"date": day, "remaining": row} for day, row in zip(grid.days, grid.remaining.tolist())]
+    }
+
+@router.get("/api/v1/franchises/{franchise_id}/occupancy")
+async def get_hourly_occupancy(franchise_id: str, from_date: date = Query(alias="from"),
+                               to_date: date = Query(alias="to"),
+                               container: ServiceContainer = Depends(get_container)):
+    franchise = container.franchise_repo.get_by_id(franchise_id)
+    if not franchise:
+        raise HTTPException(status_code=404, detail="Franchise not found")
+    
+    try:
+        occupancy = await call_service(container, container.availability_service.get_hourly_occupancy,
+                                       franchise, from_date, to_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "franchise_id": franchise.id,
+        "from": from_date,
+        "to": to_date,
+        "max_capacity": franchise.max_capacity,
+        "days": [{"date": from_date + timedelta(days=i), "peak_by_hour": row}
+                 for i, row in enumerate(occupancy.tolist())]
+    }
+
+@router.post("/api/v1/franchises/{franchise_id}/quotes")
+async def quote_windows(franchise_id: str, request: QuoteRequest,
+                        container: ServiceContainer = Depends(get_container)):
+    franchise = container.franchise_repo.get_by_id(franchise_id)
+    if not franchise:
+        raise HTTPException(status_code=404, detail="Franchise not found")
+    if len(request.windows) > MAX_QUOTE_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_QUOTE_WINDOWS} windows per request")
+    
+    try:
+        cents = container.pricing_engine.quote(franchise, request.windows)
+    except (ValueError, TypeError) as e:  # TypeError: a window mixing naive and offset timestamps
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Windows outside opening hours cannot be booked, so they get no price
+    schedule = franchise.schedule or franchise.compile_schedule()
+    return {
+        "franchise_id": franchise.id,
+        "currency": "USD",
+        "total_amounts": [amount if schedule.is_open_for(start, end) else None
+                          for amount, (start, end) in zip((cents / 100).tolist(), request.windows)]
+    }
+
+def _booking_details(request: CreateBookingRequest) -> Tuple[CustomerInfo, ChildInfo]:
+    customer_info = CustomerInfo(
+        name=request.customer_name,
+        email=request.customer_email,
+        phone=request.customer_phone,
+        emergency_contact=request.emergency_contact
+    )
+    
+    child_info = ChildInfo(
+        name=request.child_name,
+        age=request.child_age,
+        special_needs=request.special_needs,
+        allergies=request.allergies,
+        pickup_authorization=request.pickup_authorization,
+        special_instructions=request.special_instructions
+    )
+    return customer_info, child_info
+
+def _booking_row(booking: Booking) -> dict:
+    return {
+        "id": booking.id,
+        "franchise_id": booking.franchise_id,
+        "start_datetime": booking.start_datetime.isoformat(),
+        "end_datetime": booking.end_datetime.isoformat(),
+        "status": booking.booking_status.value,
+        "payment_status": booking.payment_status.value,
+        "total_amount": float(booking.total_amount.amount)
+    }
 
 # Admin Portal Endpoints
-@app.post("/api/v1/admin/sessions")
-async def start_session(request: StartSessionRequest):
+@router.post("/api/v1/admin/sessions")
+async def start_session(request: StartSessionRequest, container: ServiceContainer = Depends(get_container)):
     try:
-        session_id = session_service.start_session(request.qr_data, request.staff_id)
+        session_id = await call_service(container, container.session_service.start_session,
+                                        request.qr_data, request.staff_id)
         return {"session_id": session_id, "status": "started"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/api/v1/admin/sessions/{session_id}/checkin")
-async def check_in_child(session_id: str, request: CheckInRequest):
+@router.post("/api/v1/admin/sessions/batch")
+async def start_sessions(request: BatchCheckInRequest, container: ServiceContainer = Depends(get_container)):
+    """Start and check in a queue of QR scans in one round trip"""
+    if len(request.scans) > MAX_BATCH_SCANS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SCANS} scans per request")
+    
+    scans = [SessionScan(scan.qr_data, scan.photo_data) for scan in request.scans]
+    results = await call_service(container, container.session_service.start_and_check_in_sessions,
+                                 scans, request.staff_id)
+    items = []
+    for result in results:
+        if result.error:
+            items.append({"error": result.error})
+            continue
+        session = result.session
+        items.append({
+            "session_id": session.id,
+            "booking_id": session.booking_id,
+            "status": session.session_status.value,
+            "check_in_time": session.check_in_time
+        })
+    started = sum(1 for result in results if result.session)
+    return {"started": started, "failed": len(results) - started, "results": items}
+
+@router.post("/api/v1/admin/sessions/{session_id}/checkin")
+async def check_in_child(session_id: str, request: CheckInRequest, container: ServiceContainer = Depends(get_container)):
     try:
-        session_service.check_in_child(session_id, request.photo_data)
+        await call_service(container, container.session_service.check_in_child, session_id, request.photo_data)
         return {"status": "checked_in"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/api/v1/admin/sessions/{session_id}/overtime")
-async def apply_overtime_charge(session_id: str, request: OvertimeChargeRequest):
+@router.post("/api/v1/admin/sessions/{session_id}/checkin/photo")
+async def check_in_child_with_photo(session_id: str, request: Request,
+                                    container: ServiceContainer = Depends(get_container)):
+    """Check in with the parent photo sent as the `photo` field of a multipart/form-data body.
+    
+    The body is streamed into the blob store, never held whole in memory.
+    """
+    from ..infrastructure.blobs.local_blob_store import BlobTooLarge
+    from ..infrastructure.blobs.multipart_stream import MultipartError, multipart_file_chunks
+    if not await call_service(container, container.session_repo.get_by_id, session_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+    try:
+        chunks = multipart_file_chunks(request.stream(), request.headers.get("content-type", ""), "photo")
+        photo = await container.blob_store.put_stream(chunks)
+    except BlobTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except MultipartError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        await call_service(container, container.session_service.check_in_child_with_photo, session_id, photo.key)
+        return {"status": "checked_in", "photo_key": photo.key, "photo_bytes": photo.size}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/api/v1/admin/photos/{photo_key}")
+async def get_photo(photo_key: str, container: ServiceContainer = Depends(get_container)):
+    from ..infrastructure.blobs.local_blob_store import CHUNK_SIZE
+    try:
+        body = await asyncio.to_thread(container.blob_store.get_object, photo_key)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if body is None:
+        raise HTTPException(status_code=404, detail="Photo not found")
+    
+    def read_chunks():
+        with body:
+            yield from iter(lambda: body.read(CHUNK_SIZE), b"")
+    
+    return StreamingResponse(read_chunks(), media_type="application/octet-stream")
+
+@router.post("/api/v1/admin/sessions/{session_id}/overtime")
+async def apply_overtime_charge(session_id: str, request: OvertimeChargeRequest, container: ServiceContainer = Depends(get_container)):
     try:
-        session_service.apply_overtime_charge(session_id, request.overtime_minutes)
+        await call_service(container, container.session_service.apply_overtime_charge, session_id,
+                           request.overtime_minutes)
         return {"status": "overtime_applied", "minutes": request.overtime_minutes}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/api/v1/admin/sessions/{session_id}/checkout")
-async def check_out_child(session_id: str, request: CheckOutRequest):
+@router.post("/api/v1/admin/sessions/{session_id}/checkout")
+async def check_out_child(session_id: str, request: CheckOutRequest, container: ServiceContainer = Depends(get_container)):
     try:
-        session_service.check_out_child(session_id, request.notes)
+        await call_service(container, container.session_service.check_out_child, session_id, request.notes)
         return {"status": "checked_out"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/api/v1/admin/sessions/{session_id}/complete")
-async def complete_session(session_id: str):
+@router.post("/api/v1/admin/sessions/{session_id}/complete")
+async def complete_session(session_id: str, container: ServiceContainer = Depends(get_container)):
     try:
-        session_service.complete_session(session_id)
+        await call_service(container, container.session_service.complete_session, session_id)
         return {"status": "completed"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.get("/api/v1/admin/sessions/{session_id}")
-async def get_session(session_id: str):
-    session = session_repo.get_by_id(session_id)
+@router.get("/api/v1/admin/sessions/{session_id}")
+async def get_session(session_id: str, container: ServiceContainer = Depends(get_container)):
+    session = await call_service(container, container.session_repo.get_by_id, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -210,13 +576,36 @@ async def get_session(session_id: str):
         "total_charges": sum(c.amount for c in session.additional_charges)
     }
 
-@app.get("/api/v1/admin/sessions")
-async def get_active_sessions():
-    sessions = session_repo.get_active_sessions()
-    return [{
-        "id": s.id,
-        "booking_id": s.booking_id,
-        "status": s.session_status.value,
-        "staff_id": s.staff_member_id
-    } for s in sessions]
+@router.get("/api/v1/admin/sessions")
+async def get_active_sessions(response: Response, cursor: Optional[str] = None,
+                              limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                              output: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+                              container: ServiceContainer = Depends(get_container)):
+    return await list_response(
+        container, response,
+        lambda after, n: container.session_repo.get_active_page(after[0] if after else None, n),
+        lambda s: [s.id],
+        lambda s: {
+            "id": s.id,
+            "booking_id": s.booking_id,
+            "status": s.session_status.value,
+            "staff_id": s.staff_member_id
+        },
+        cursor, limit, output)
+
+@router.get("/api/v1/admin/events/metrics")
+async def get_event_publisher_metrics(container: ServiceContainer = Depends(get_container)):
+    metrics = await call_service(container, lambda: container.event_publisher.metrics)
+    return {
+        "mode": "async" if container.async_events else "sync",
+        **asdict(metrics)
+    }
+
+@router.get("/api/v1/admin/cache/metrics")
+async def get_cache_metrics(container: ServiceContainer = Depends(get_container)):
+    if container.cache is None:
+        return {"enabled": False}
+    stats = await call_service(container, lambda: container.cache.stats)
+    return {"enabled": True, **asdict(stats)}
 
+app = create_app()
\ No newline at end of file
@@ -1,25 +1,50 @@
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Dict, List, Optional
 from ...domain.entities.booking import Booking
 from ...domain.entities.booking_aggregate import BookingAggregate
 from ...domain.entities.payment import Payment, PaymentMethod
+from ...domain.value_objects.money import Money
 from ...domain.value_objects.customer_info import CustomerInfo
 from ...domain.value_objects.child_info import ChildInfo
 from ...domain.services.pricing_service import PricingService
 from ...domain.services.availability_service import AvailabilityService
+from ...domain.services.occupancy_timeline import split_by_day
 from ...domain.events.booking_events import BookingCreated
 from ...infrastructure.repositories.booking_repository import BookingRepository
 from ...infrastructure.repositories.franchise_repository import FranchiseRepository
 from ...infrastructure.repositories.payment_repository import PaymentRepository
+from ...infrastructure.repositories.booking_aggregate_loader import BookingAggregateLoader
 from ...infrastructure.events.event_publisher import EventPublisher
+from ...infrastructure.locking.striped_lock import StripedLock
+
+@dataclass
+class NewBooking:
+    franchise_id: str
+    start_datetime: datetime
+    end_datetime: datetime
+    customer_info: CustomerInfo
+    child_info: ChildInfo
+
+@dataclass
+class BookingResult:
+    booking: Optional[Booking] = None
+    error: Optional[str] = None
 
 class BookingApplicationService:
-    def __init__(self, booking_repo: BookingRepository, franchise_repo: FranchiseRepository, 
-                 payment_repo: PaymentRepository, event_publisher: EventPublisher):
+    def __init__(self, booking_repo: BookingRepository, franchise_repo: FranchiseRepository,
+                 payment_repo: PaymentRepository, event_publisher: EventPublisher,
+                 availability_service=None, pricing_service=None, locks: StripedLock = None):
         self.booking_repo = booking_repo
         self.franchise_repo = franchise_repo
         self.payment_repo = payment_repo
         self.event_publisher = event_publisher
-        self.availability_service = AvailabilityService(booking_repo)
+        self.availability_service = availability_service or AvailabilityService(booking_repo)
+        self.pricing_service = pricing_service or PricingService()
+        self.aggregate_loader = BookingAggregateLoader(booking_repo, payment_repo)
+        # Held per (franchise_id, day) from the capacity check until the booking is saved,
+        # and around every other booking write, so concurrent callers cannot overbook
+        self.locks = locks or StripedLock()
     
     def create_booking(self, franchise_id: str, start_datetime: datetime, end_datetime: datetime,
                       customer_info: CustomerInfo, child_info: ChildInfo) -> str:
@@ -27,42 +52,80 @@ class BookingApplicationService:
         if not franchise:
             raise ValueError("Franchise not found")
         
-        if not self.availability_service.check_availability(franchise, start_datetime, end_datetime):
-            raise ValueError("No availability for requested time")
-        
-        total_amount = PricingService.calculate_booking_cost(franchise, start_datetime, end_datetime)
-        
-        booking = Booking(
-            franchise_id=franchise_id,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            customer_info=customer_info,
-            child_info=child_info,
-            total_amount=total_amount
-        )
-        
-        # Create and publish event
-        event = BookingCreated(
-            booking_id=booking.id,
-            franchise_id=franchise_id,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-            customer_email=customer_info.email,
-            child_name=child_info.name
-        )
-        booking.add_event(event)
-        
-        aggregate = BookingAggregate(booking)
-        self.booking_repo.save(booking)
+        with self.locks.hold(_lock_keys(franchise_id, start_datetime, end_datetime)):
+            if not self.availability_service.check_availability(franchise, start_datetime, end_datetime):
+                raise ValueError("No availability for requested time")
+            
+            total_amount = self.pricing_service.calculate_booking_cost(franchise, start_datetime, end_datetime)
+            
+            booking = self._new_booking(franchise_id, start_datetime, end_datetime, customer_info, child_info,
+                                        total_amount)
+            
+            aggregate = BookingAggregate(booking)
+            self.booking_repo.save(booking)
         self.event_publisher.publish_events(aggregate.get_uncommitted_events())
         aggregate.mark_events_committed()
         
         return booking.id
     
+    def create_bookings(self, batch: List[NewBooking]) -> List[BookingResult]:
+        """Create many bookings at once (partner or migration imports); one result per item, in order.
+        
+        Items are grouped by franchise, so each franchise is looked up once, its
+        occupancy read once for all the days the group covers and its bookings priced
+        together. Items are checked in order and earlier ones in the batch count
+        against capacity for later ones, with the day locks for every item held until
+        the save. Accepted bookings are saved and their events published in one batch;
+        rejected items get an error and nothing else happens.
+        """
+        results = [BookingResult() for _ in batch]
+        by_franchise: Dict[str, List[int]] = {}
+        for index, item in enumerate(batch):
+            by_franchise.setdefault(item.franchise_id, []).append(index)
+        
+        lock_keys = [key for item in batch
+                     for key in _lock_keys(item.franchise_id, item.start_datetime, item.end_datetime)]
+        bookings = []
+        with self.locks.hold(lock_keys):
+            for franchise_id, indexes in by_franchise.items():
+                franchise = self.franchise_repo.get_by_id(franchise_id)
+                if not franchise:
+                    for index in indexes:
+                        results[index].error = "Franchise not found"
+                    continue
+                
+                windows = [(batch[index].start_datetime, batch[index].end_datetime) for index in indexes]
+                available = self.availability_service.check_availability_batch(franchise, windows)
+                accepted = []
+                for index, window, is_available in zip(indexes, windows, available):
+                    if is_available:
+                        accepted.append((index, window))
+                    else:
+                        results[index].error = "No availability for requested time"
+                
+                amounts = self.pricing_service.calculate_booking_costs(franchise, [window for _, window in accepted])
+                for (index, _), total_amount in zip(accepted, amounts):
+                    item = batch[index]
+                    booking = self._new_booking(franchise_id, item.start_datetime, item.end_datetime,
+                                                item.customer_info, item.child_info, total_amount)
+                    bookings.append(booking)
+                    results[index].booking = booking
+            
+            self.booking_repo.save_all(bookings)
+        events = []
+        for booking in bookings:
+            aggregate = BookingAggregate(booking)
+            events.extend(aggregate.get_uncommitted_events())
+            aggregate.mark_events_committed()
+        if events:
+            self.event_publisher.publish_events(events)
+        return results
+    
     def process_payment(self, booking_id: str, payment_method: PaymentMethod) -> str:
-        booking = self.booking_repo.get_by_id(booking_id)
-        if not booking:
+        aggregate = self.aggregate_loader.load(booking_id)
+        if not aggregate:
             raise ValueError("Booking not found")
+        booking = aggregate.booking
         
         payment = Payment(
             booking_id=booking_id,
@@ -72,24 +135,79 @@ class BookingApplicationService:
         )
         payment.mark_completed()
         
-        aggregate = BookingAggregate(booking)
-        aggregate.add_payment(payment)
-        
-        self.payment_repo.save(payment)
-        self.booking_repo.save(booking)
+        with self.locks.hold(_lock_keys(booking.franchise_id, booking.start_datetime, booking.end_datetime)):
+            aggregate.add_payment(payment)
+            self.payment_repo.save(payment)
+            self.booking_repo.save(booking)
         self.event_publisher.publish_events(aggregate.get_uncommitted_events())
         aggregate.mark_events_committed()
         
         return payment.id
     
     def cancel_booking(self, booking_id: str, reason: str) -> None:
-        booking = self.booking_repo.get_by_id(booking_id)
-        if not booking:
+        aggregate = self.aggregate_loader.load(booking_id)
+        if not aggregate:
             raise ValueError("Booking not found")
         
-        aggregate = BookingAggregate(booking)
-        aggregate.cancel_booking(reason)
-        
-        self.booking_repo.save(booking)
+        booking = aggregate.booking
+        with self.locks.hold(_lock_keys(booking.franchise_id, booking.start_datetime, booking.end_datetime)):
+            aggregate.cancel_booking(reason)
+            self.booking_repo.save(booking)
         self.event_publisher.publish_events(aggregate.get_uncommitted_events())
-        aggregate.mark_events_committed()
\ No newline at end of file
+        aggregate.mark_events_committed()
+    
+    def cancel_bookings(self, booking_ids: List[str], reason: str) -> List[str]:
+        """Cancel many bookings at once (e.g. a franchise closure day); returns the ids cancelled"""
+        aggregates = self.aggregate_loader.load_many(booking_ids)
+        
+        lock_keys = [key for aggregate in aggregates.values()
+                     for key in _lock_keys(aggregate.booking.franchise_id, aggregate.booking.start_datetime,
+                                           aggregate.booking.end_datetime)]
+        events = []
+        with self.locks.hold(lock_keys):
+            for aggregate in aggregates.values():
+                aggregate.cancel_booking(reason)
+                self.booking_repo.save(aggregate.booking)
+                events.extend(aggregate.get_uncommitted_events())
+                aggregate.mark_events_committed()
+        
+        if events:
+            self.event_publisher.publish_events(events)
+        return list(aggregates)
+    
+    def _new_booking(self, franchise_id: str, start_datetime: datetime, end_datetime: datetime,
+                     customer_info: CustomerInfo, child_info: ChildInfo, total_amount: Money) -> Booking:
+        booking = Booking(
+            franchise_id=franchise_id,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            customer_info=customer_info,
+            child_info=child_info,
+            total_amount=total_amount
+        )
+        
+        # Create event
+        event = BookingCreated(
+            booking_id=booking.id,
+            franchise_id=franchise_id,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            customer_email=customer_info.email,
+            child_name=child_info.name,
+            customer_name=customer_info.name,
+            customer_phone=customer_info.phone,
+            emergency_contact=customer_info.emergency_contact,
+            child_age=child_info.age,
+            special_needs=child_info.special_needs,
+            allergies=child_info.allergies,
+            pickup_authorization=child_info.pickup_authorization,
+            special_instructions=child_info.special_instructions,
+            total_amount=float(total_amount.amount),
+            currency=total_amount.currency,
+            reference_number=booking.reference_number
+        )
+        booking.add_event(event)
+        return booking
+
+def _lock_keys(franchise_id: str, start_datetime: datetime, end_datetime: datetime) -> List[tuple]:
+    return [(franchise_id, day) for day, _, _ in split_by_day(start_datetime, end_datetime)]
\ No newline at end of file
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime
+from typing import List, Optional
 from ...domain.entities.booking_session import BookingSession
 from ...domain.value_objects.admin_value_objects import ParentPhoto, AdditionalCharge, SessionNotes
 from ...domain.services.qr_service import QRScanningService, PhotoCaptureService
@@ -7,8 +9,18 @@ from ...infrastructure.repositories.session_repository import BookingSessionRepo
 from ...infrastructure.repositories.booking_repository import BookingRepository
 from ...infrastructure.events.event_publisher import EventPublisher
 
+@dataclass
+class SessionScan:
+    qr_data: str
+    photo_data: str
+
+@dataclass
+class ScanResult:
+    session: Optional[BookingSession] = None
+    error: Optional[str] = None
+
 class SessionManagementService:
-    def __init__(self, session_repo: BookingSessionRepository, booking_repo: BookingRepository, 
+    def __init__(self, session_repo: BookingSessionRepository, booking_repo: BookingRepository,
                  event_publisher: EventPublisher):
         self.session_repo = session_repo
         self.booking_repo = booking_repo
@@ -36,17 +48,80 @@ class SessionManagementService:
         )
         session.add_event(event)
         
-        self.session_repo.save(session)
-        self.event_publisher.publish_events([event])
+        self._commit([session])
         
         return session.id
     
+    def start_and_check_in_sessions(self, scans: List[SessionScan], staff_id: str) -> List[ScanResult]:
+        """Start and check in a queue of QR scans at once (morning drop-off); one result per scan, in order.
+        
+        Every code is decoded first and the bookings are fetched in one lookup. A scan
+        fails on an unreadable code, an unknown booking, or a booking already scanned
+        earlier in the batch; the others get a checked-in session. Sessions are saved
+        and their SessionStarted and ChildCheckedIn events published in one batch.
+        """
+        results = [ScanResult() for _ in scans]
+        booking_ids = [QRScanningService.scan_qr_code(scan.qr_data) for scan in scans]
+        bookings = self.booking_repo.get_by_ids(list(dict.fromkeys(filter(None, booking_ids))))
+        
+        sessions, scanned = [], set()
+        for result, scan, booking_id in zip(results, scans, booking_ids):
+            if not booking_id:
+                result.error = "Invalid QR code"
+                continue
+            booking = bookings.get(booking_id)
+            if not booking:
+                result.error = "Booking not found"
+                continue
+            if booking_id in scanned:
+                result.error = "Booking already scanned in this batch"
+                continue
+            scanned.add(booking_id)
+            
+            session = BookingSession(booking_id=booking_id, staff_member_id=staff_id)
+            photo_id = PhotoCaptureService.capture_parent_photo(scan.photo_data, staff_id)
+            session.check_in_child(ParentPhoto(
+                photo_data=photo_id,
+                captured_at=datetime.utcnow(),
+                staff_member_id=staff_id
+            ))
+            session.add_event(SessionStarted(
+                session_id=session.id,
+                booking_id=booking_id,
+                staff_member_id=staff_id,
+                qr_code_scanned=scan.qr_data
+            ))
+            session.add_event(ChildCheckedIn(
+                session_id=session.id,
+                booking_id=booking_id,
+                child_name=booking.child_info.name,
+                check_in_time=session.check_in_time,
+                staff_member_id=staff_id,
+                photo_id=photo_id
+            ))
+            sessions.append(session)
+            result.session = session
+        
+        self._commit(sessions)
+        return results
+    
     def check_in_child(self, session_id: str, photo_data: str) -> None:
         session = self.session_repo.get_by_id(session_id)
         if not session:
             raise ValueError("Session not found")
         
         photo_id = PhotoCaptureService.capture_parent_photo(photo_data, session.staff_member_id)
+        self._check_in(session, photo_id)
+    
+    def check_in_child_with_photo(self, session_id: str, photo_key: str) -> None:
+        """Check in with a parent photo already in the blob store; its content key is the photo ID"""
+        session = self.session_repo.get_by_id(session_id)
+        if not session:
+            raise ValueError("Session not found")
+        
+        self._check_in(session, photo_key)
+    
+    def _check_in(self, session: BookingSession, photo_id: str) -> None:
         parent_photo = ParentPhoto(
             photo_data=photo_id,
             captured_at=datetime.utcnow(),
@@ -57,16 +132,16 @@ class SessionManagementService:
         
         booking = self.booking_repo.get_by_id(session.booking_id)
         event = ChildCheckedIn(
-            session_id=session_id,
+            session_id=session.id,
             booking_id=session.booking_id,
             child_name=booking.child_info.name if booking else "Unknown",
             check_in_time=session.check_in_time,
-            staff_member_id=session.staff_member_id
+            staff_member_id=session.staff_member_id,
+            photo_id=photo_id
         )
         session.add_event(event)
         
-        self.session_repo.save(session)
-        self.event_publisher.publish_events([event])
+        self._commit([session])
     
     def apply_overtime_charge(self, session_id: str, overtime_minutes: int) -> None:
         session = self.session_repo.get_by_id(session_id)
@@ -75,12 +150,13 @@ class SessionManagementService:
         
         # Simple overtime calculation: $1 per minute
         charge_amount = overtime_minutes * 1.0
+        applied_at = datetime.utcnow()
         
         charge = AdditionalCharge(
             charge_type="overtime",
             amount=charge_amount,
             description=f"{overtime_minutes} minutes overtime",
-            applied_at=datetime.utcnow()
+            applied_at=applied_at
         )
         
         session.add_charge(charge)
@@ -90,12 +166,12 @@ class SessionManagementService:
             booking_id=session.booking_id,
             overtime_minutes=overtime_minutes,
             charge_amount=charge_amount,
-            staff_member_id=session.staff_member_id
+            staff_member_id=session.staff_member_id,
+            timestamp=applied_at
         )
         session.add_event(event)
         
-        self.session_repo.save(session)
-        self.event_publisher.publish_events([event])
+        self._commit([session])
     
     def check_out_child(self, session_id: str, notes: str) -> None:
         session = self.session_repo.get_by_id(session_id)
@@ -119,12 +195,12 @@ class SessionManagementService:
             booking_id=session.booking_id,
             check_out_time=session.check_out_time,
             total_duration_minutes=duration,
-            staff_member_id=session.staff_member_id
+            staff_member_id=session.staff_member_id,
+            notes=notes
         )
         session.add_event(event)
         
-        self.session_repo.save(session)
-        self.event_publisher.publish_events([event])
+        self._commit([session])
     
     def complete_session(self, session_id: str) -> None:
         session = self.session_repo.get_by_id(session_id)
@@ -143,5 +219,15 @@ class SessionManagementService:
         )
         session.add_event(event)
         
-        self.session_repo.save(session)
-        self.event_publisher.publish_events([event])
\ No newline at end of file
+        self._commit([session])
+    
+    def _commit(self, sessions: List[BookingSession]) -> None:
+        """The outbox path for every session change: save the sessions, publish their
+        uncommitted events in one batch, then mark them committed so sessions never
+        hold events that are already in the event store"""
+        self.session_repo.save_all(sessions)
+        events = [event for session in sessions for event in session.get_uncommitted_events()]
+        if events:
+            self.event_publisher.publish_events(events)
+        for session in sessions:
+            session.mark_events_committed()
\ No newline at end of file
@@ -18,7 +18,7 @@ class PaymentStatus(Enum):
     PAID = "PAID"
     REFUNDED = "REFUNDED"
 
-@dataclass
+@dataclass(slots=True)
 class Booking:
     franchise_id: str
     start_datetime: datetime
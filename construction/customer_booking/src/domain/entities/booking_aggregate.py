@@ -1,12 +1,12 @@
-from typing import List
+from typing import List, Optional
 from .booking import Booking
 from .payment import Payment
 from ..events.booking_events import BookingCreated, PaymentProcessed, BookingCancelled
 
 class BookingAggregate:
-    def __init__(self, booking: Booking):
+    def __init__(self, booking: Booking, payments: Optional[List[Payment]] = None):
         self.booking = booking
-        self.payments: List[Payment] = []
+        self.payments: List[Payment] = list(payments) if payments else []
     
     def add_payment(self, payment: Payment):
         self.payments.append(payment)
@@ -16,7 +16,9 @@ class BookingAggregate:
                 booking_id=self.booking.id,
                 payment_id=payment.id,
                 amount=float(payment.amount.amount),
-                currency=payment.amount.currency
+                currency=payment.amount.currency,
+                payment_method=payment.payment_method.value,
+                stripe_payment_id=payment.stripe_payment_id
             )
             self.booking.add_event(event)
     
@@ -26,7 +28,10 @@ class BookingAggregate:
         event = BookingCancelled(
             booking_id=self.booking.id,
             cancellation_reason=reason,
-            refund_amount=float(refund_amount)
+            refund_amount=float(refund_amount),
+            franchise_id=self.booking.franchise_id,
+            start_datetime=self.booking.start_datetime,
+            end_datetime=self.booking.end_datetime
         )
         self.booking.add_event(event)
     
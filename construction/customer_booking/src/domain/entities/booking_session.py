@@ -12,7 +12,7 @@ class SessionStatus(Enum):
     CHECKED_OUT = "CHECKED_OUT"
     COMPLETED = "COMPLETED"
 
-@dataclass
+@dataclass(slots=True)
 class BookingSession:
     booking_id: str
     staff_member_id: str
@@ -23,7 +23,7 @@ class BookingSession:
     parent_photo: Optional[ParentPhoto] = None
     additional_charges: List[AdditionalCharge] = field(default_factory=list)
     session_notes: Optional[SessionNotes] = None
-    events: List[BaseEvent] = field(default_factory=list)
+    events: List[BaseEvent] = field(default_factory=list)  # uncommitted; cleared once published
     
     def check_in_child(self, parent_photo: ParentPhoto):
         self.session_status = SessionStatus.CHECKED_IN
@@ -42,4 +42,10 @@ class BookingSession:
         self.session_status = SessionStatus.COMPLETED
     
     def add_event(self, event: BaseEvent):
-        self.events.append(event)
\ No newline at end of file
+        self.events.append(event)
+    
+    def get_uncommitted_events(self) -> List[BaseEvent]:
+        return self.events.copy()
+    
+    def mark_events_committed(self):
+        self.events.clear()
\ No newline at end of file
@@ -1,9 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from uuid import uuid4
-from typing import List
+from typing import List, Optional
+from ..value_objects.franchise_schedule import FranchiseSchedule
 
-@dataclass
+@dataclass(slots=True)
 class Franchise:
     name: str
     address: str
@@ -17,7 +18,13 @@ class Franchise:
     operating_days: List[int]
     id: str = None
     is_active: bool = True
+    # Compiled from the fields above by compile_schedule(); repositories do this on save
+    schedule: Optional[FranchiseSchedule] = field(default=None, compare=False, repr=False)
     
     def __post_init__(self):
         if not self.id:
-            self.id = str(uuid4())
\ No newline at end of file
+            self.id = str(uuid4())
+    
+    def compile_schedule(self) -> FranchiseSchedule:
+        self.schedule = FranchiseSchedule.compile(self.open_time, self.close_time, self.operating_days)
+        return self.schedule
\ No newline at end of file
@@ -14,7 +14,7 @@ class PaymentStatus(Enum):
     FAILED = "FAILED"
     REFUNDED = "REFUNDED"
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     booking_id: str
     amount: Money
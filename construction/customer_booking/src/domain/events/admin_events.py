@@ -2,22 +2,23 @@ from dataclasses import dataclass
 from datetime import datetime
 from .base_event import BaseEvent
 
-@dataclass
+@dataclass(slots=True)
 class SessionStarted(BaseEvent):
     session_id: str = ""
     booking_id: str = ""
     staff_member_id: str = ""
     qr_code_scanned: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ChildCheckedIn(BaseEvent):
     session_id: str = ""
     booking_id: str = ""
     child_name: str = ""
     check_in_time: datetime = None
     staff_member_id: str = ""
+    photo_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class OvertimeChargeApplied(BaseEvent):
     session_id: str = ""
     booking_id: str = ""
@@ -25,15 +26,16 @@ class OvertimeChargeApplied(BaseEvent):
     charge_amount: float = 0.0
     staff_member_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ChildCheckedOut(BaseEvent):
     session_id: str = ""
     booking_id: str = ""
     check_out_time: datetime = None
     total_duration_minutes: int = 0
     staff_member_id: str = ""
+    notes: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class SessionCompleted(BaseEvent):
     session_id: str = ""
     booking_id: str = ""
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import uuid4
 
-@dataclass
+@dataclass(slots=True)
 class BaseEvent:
     event_id: str = None
     timestamp: datetime = None
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from .base_event import BaseEvent
 
-@dataclass
+@dataclass(slots=True)
 class BookingCreated(BaseEvent):
     booking_id: str = ""
     franchise_id: str = ""
@@ -10,16 +10,34 @@ class BookingCreated(BaseEvent):
     end_datetime: datetime = field(default_factory=datetime.utcnow)
     customer_email: str = ""
     child_name: str = ""
+    # Remaining booking state, so the booking can be rebuilt by replaying this event
+    customer_name: str = ""
+    customer_phone: str = ""
+    emergency_contact: str = ""
+    child_age: int = 0
+    special_needs: str = ""
+    allergies: str = ""
+    pickup_authorization: str = ""
+    special_instructions: str = ""
+    total_amount: float = 0.0
+    currency: str = "USD"
+    reference_number: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class PaymentProcessed(BaseEvent):
     booking_id: str = ""
     payment_id: str = ""
     amount: float = 0.0
     currency: str = "USD"
+    payment_method: str = ""
+    stripe_payment_id: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class BookingCancelled(BaseEvent):
     booking_id: str = ""
     cancellation_reason: str = ""
-    refund_amount: float = 0.0
\ No newline at end of file
+    refund_amount: float = 0.0
+    # The cancelled booking's slot, so consumers know which franchise days regained capacity
+    franchise_id: str = ""
+    start_datetime: datetime = None
+    end_datetime: datetime = None
\ No newline at end of file
@@ -1,6 +1,28 @@
-from datetime import datetime, date
-from typing import List, Dict
+from dataclasses import dataclass
+from datetime import datetime, date, time, timedelta
+from typing import List, Dict, Sequence, Tuple, TYPE_CHECKING
 from ..entities.franchise import Franchise
+from .occupancy_timeline import MINUTES_PER_DAY, epoch_seconds, split_by_day, wall_clock
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAX_GRID_DAYS = 92
+
+@dataclass
+class AvailabilityGrid:
+    franchise_id: str
+    start_date: date
+    slot_minutes: int
+    remaining: "np.ndarray"  # days x slots, children that can still be booked
+    
+    @property
+    def days(self) -> List[date]:
+        return [self.start_date + timedelta(days=i) for i in range(self.remaining.shape[0])]
+    
+    @property
+    def slot_starts(self) -> List[str]:
+        return [f"{m // 60:02d}:{m % 60:02d}" for m in range(0, MINUTES_PER_DAY, self.slot_minutes)]
 
 class AvailabilityService:
     def __init__(self, booking_repository):
@@ -14,23 +36,92 @@ class AvailabilityService:
         if not self._is_within_operating_hours(franchise, start_time, end_time):
             return False
         
-        # Check capacity
-        existing_bookings = self.booking_repository.get_by_franchise_and_date(
-            franchise.id, start_time.date()
-        )
+        # Check capacity: peak concurrent children over the window, cancelled bookings excluded
+        for day, start_minute, end_minute in split_by_day(start_time, end_time):
+            timeline = self.booking_repository.get_occupancy(franchise.id, day)
+            if timeline is not None and timeline.max_concurrent(start_minute, end_minute) >= franchise.max_capacity:
+                return False
+        
+        return True
+    
+    def check_availability_batch(self, franchise: Franchise,
+                                 windows: Sequence[Tuple[datetime, datetime]]) -> List[bool]:
+        """check_availability for many windows at once, in order.
         
-        overlapping_count = sum(1 for b in existing_bookings 
-                              if self._times_overlap(b.start_datetime, b.end_datetime, start_time, end_time))
+        Each window that fits takes its place before the next is checked, so windows
+        in the same batch compete for capacity just like separate bookings would.
+        Occupancy is read once per day the batch touches, as that day's minutes, so
+        memory follows the number of days, not how far apart they are.
+        Aware datetimes are read as their wall-clock time, as check_availability does.
+        """
+        windows = [(wall_clock(start_time), wall_clock(end_time)) for start_time, end_time in windows]
+        schedule = franchise.schedule or franchise.compile_schedule()
+        available = [False] * len(windows)
+        if not franchise.is_active:
+            return available
         
-        return overlapping_count < franchise.max_capacity
+        occupancy_by_day: Dict[date, "np.ndarray"] = {}
+        capacity = franchise.max_capacity
+        for index, (start_time, end_time) in enumerate(windows):
+            if not (start_time < end_time and schedule.is_open_for(start_time, end_time)):
+                continue
+            pieces = split_by_day(start_time, end_time)
+            for day, _, _ in pieces:
+                if day not in occupancy_by_day:
+                    occupancy_by_day[day] = self._minute_occupancy(franchise.id, datetime.combine(day, time.min),
+                                                                   MINUTES_PER_DAY)
+            if all(occupancy_by_day[day][start_minute:end_minute].max() < capacity
+                   for day, start_minute, end_minute in pieces):
+                for day, start_minute, end_minute in pieces:
+                    occupancy_by_day[day][start_minute:end_minute] += 1
+                available[index] = True
+        return available
     
-    def _is_within_operating_hours(self, franchise: Franchise, start_time: datetime, end_time: datetime) -> bool:
-        weekday = start_time.weekday() + 1  # Monday = 1
-        if weekday not in franchise.operating_days:
-            return False
+    def get_availability_grid(self, franchise: Franchise, start_date: date, end_date: date,
+                              slot_minutes: int = 30) -> AvailabilityGrid:
+        import numpy as np  # deferred: only the grid needs it, and it dominates import time
+        if slot_minutes <= 0 or MINUTES_PER_DAY % slot_minutes:
+            raise ValueError("Slot length must divide the day into whole slots")
+        day_count = self._day_count(start_date, end_date)
+        peak = self._peak_occupancy(franchise.id, start_date, day_count, slot_minutes)
         
-        # Simple time check - just verify it's a reasonable time
-        return 8 <= start_time.hour <= 18 and 8 <= end_time.hour <= 18
+        remaining = np.clip(franchise.max_capacity - peak, 0, None)
+        schedule = franchise.schedule or franchise.compile_schedule()
+        remaining[~schedule.open_slot_mask(start_date, day_count, slot_minutes)] = 0
+        if not franchise.is_active:
+            remaining[:] = 0
+        return AvailabilityGrid(franchise.id, start_date, slot_minutes, remaining)
+    
+    def get_hourly_occupancy(self, franchise: Franchise, start_date: date, end_date: date) -> "np.ndarray":
+        """Peak number of children present in each hour, days x 24"""
+        return self._peak_occupancy(franchise.id, start_date, self._day_count(start_date, end_date), 60)
     
-    def _times_overlap(self, start1: datetime, end1: datetime, start2: datetime, end2: datetime) -> bool:
-        return start1 < end2 and start2 < end1
\ No newline at end of file
+    def _day_count(self, start_date: date, end_date: date) -> int:
+        if end_date < start_date:
+            raise ValueError("End date must not be before start date")
+        day_count = (end_date - start_date).days + 1
+        if day_count > MAX_GRID_DAYS:
+            raise ValueError(f"Availability grid is limited to {MAX_GRID_DAYS} days")
+        return day_count
+    
+    def _peak_occupancy(self, franchise_id: str, start_date: date, day_count: int, slot_minutes: int) -> "np.ndarray":
+        occupancy = self._minute_occupancy(franchise_id, datetime.combine(start_date, time.min),
+                                           day_count * MINUTES_PER_DAY)
+        return occupancy.reshape(day_count, -1, slot_minutes).max(axis=2)
+    
+    def _minute_occupancy(self, franchise_id: str, window_start: datetime, total_minutes: int) -> "np.ndarray":
+        import numpy as np
+        starts, ends = self.booking_repository.get_active_spans(franchise_id, window_start,
+                                                                window_start + timedelta(minutes=total_minutes))
+        # Children present in each minute of the range, from +1/-1 deltas at each booking's
+        # start and end minute (end rounded up), clipped to the range
+        base = epoch_seconds(window_start)
+        start_minutes = np.clip((starts - base) // 60, 0, total_minutes)
+        end_minutes = np.clip(-((base - ends) // 60), 0, total_minutes)
+        deltas = (np.bincount(start_minutes, minlength=total_minutes + 1)
+                  - np.bincount(end_minutes, minlength=total_minutes + 1))
+        return np.cumsum(deltas[:total_minutes])
+    
+    def _is_within_operating_hours(self, franchise: Franchise, start_time: datetime, end_time: datetime) -> bool:
+        schedule = franchise.schedule or franchise.compile_schedule()
+        return schedule.is_open_for(start_time, end_time)
\ No newline at end of file
@@ -0,0 +1,117 @@
+from datetime import datetime, date, timedelta
+from typing import Iterable, List, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+def epoch_seconds(moment: datetime) -> int:
+    """Whole seconds since 1970-01-01; naive datetimes are taken as UTC like elsewhere in the domain"""
+    if moment.tzinfo is not None:
+        return int(moment.timestamp())
+    return (moment - _EPOCH) // _SECOND
+
+def wall_clock(moment: datetime) -> datetime:
+    """The moment's local date and time with any offset dropped; day buckets and timelines are wall-clock"""
+    return moment.replace(tzinfo=None)
+
+def split_by_day(start_time: datetime, end_time: datetime) -> List[Tuple[date, int, int]]:
+    """Split [start_time, end_time) into (day, start_minute, end_minute) pieces"""
+    pieces = []
+    day = start_time.date()
+    last_day = end_time.date()
+    end_minute = end_time.hour * 60 + end_time.minute
+    if end_time.second or end_time.microsecond:
+        end_minute += 1
+    start_minute = start_time.hour * 60 + start_time.minute
+    while day <= last_day:
+        piece_end = end_minute if day == last_day else MINUTES_PER_DAY
+        if start_minute < piece_end:
+            pieces.append((day, start_minute, piece_end))
+        day += timedelta(days=1)
+        start_minute = 0
+    return pieces
+
+class OccupancyTimeline:
+    """Children present per minute of one day, as a range-add / range-max segment tree"""
+    
+    def __init__(self, slots: int = MINUTES_PER_DAY):
+        self._n = slots
+        self._height = slots.bit_length()
+        self._tree = [0] * (2 * slots)
+        self._pending = [0] * slots
+    
+    @classmethod
+    def from_spans(cls, spans: Iterable[Tuple[int, int]]) -> "OccupancyTimeline":
+        """Build in one pass from (start_minute, end_minute) spans instead of one add() each"""
+        timeline = cls()
+        n, tree = timeline._n, timeline._tree
+        deltas = [0] * (n + 1)
+        for start_minute, end_minute in spans:
+            deltas[start_minute] += 1
+            deltas[end_minute] -= 1
+        running = 0
+        for minute in range(n):
+            running += deltas[minute]
+            tree[n + minute] = running
+        for node in range(n - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        return timeline
+    
+    def add(self, start_minute: int, end_minute: int, count: int = 1) -> None:
+        left, right = start_minute + self._n, end_minute + self._n
+        first, last = left, right - 1
+        while left < right:
+            if left & 1:
+                self._apply(left, count)
+                left += 1
+            if right & 1:
+                right -= 1
+                self._apply(right, count)
+            left >>= 1
+            right >>= 1
+        self._rebuild(first)
+        self._rebuild(last)
+    
+    def remove(self, start_minute: int, end_minute: int, count: int = 1) -> None:
+        self.add(start_minute, end_minute, -count)
+    
+    def max_concurrent(self, start_minute: int, end_minute: int) -> int:
+        if start_minute >= end_minute:
+            return 0
+        left, right = start_minute + self._n, end_minute + self._n
+        self._push(left)
+        self._push(right - 1)
+        result = 0
+        tree = self._tree
+        while left < right:
+            if left & 1:
+                result = max(result, tree[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                result = max(result, tree[right])
+            left >>= 1
+            right >>= 1
+        return result
+    
+    def _apply(self, node: int, count: int) -> None:
+        self._tree[node] += count
+        if node < self._n:
+            self._pending[node] += count
+    
+    def _rebuild(self, node: int) -> None:
+        tree, pending = self._tree, self._pending
+        while node > 1:
+            node >>= 1
+            tree[node] = max(tree[2 * node], tree[2 * node + 1]) + pending[node]
+    
+    def _push(self, node: int) -> None:
+        pending = self._pending
+        for shift in range(self._height, 0, -1):
+            parent = node >> shift
+            if pending[parent]:
+                self._apply(2 * parent, pending[parent])
+                self._apply(2 * parent + 1, pending[parent])
+                pending[parent] = 0
\ No newline at end of file
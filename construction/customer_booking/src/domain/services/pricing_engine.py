@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Sequence, Tuple, TYPE_CHECKING
+from ..entities.franchise import Franchise
+from .occupancy_timeline import MINUTES_PER_DAY, epoch_seconds, wall_clock
+
+if TYPE_CHECKING:
+    import numpy as np
+
+PEAK_HOURS = (16 * 60, 18 * 60)  # minute offsets of the daily peak-rate window
+SECONDS_PER_DAY = MINUTES_PER_DAY * 60
+
+@dataclass(frozen=True)
+class RateSchedule:
+    """A franchise's daily rates as minute-offset breakpoints, plus a cumulative table.
+    
+    cumulative[m] is the cost of minutes [0, m) of a day in 1/60 cent, so the
+    cost of any span is two lookups and a subtraction however many rate
+    segments it crosses. Costs are exact integers in 1/3600 cent until the
+    final rounding to cents.
+    """
+    breakpoints: Tuple[int, ...]           # segment start minutes, starting at 0
+    cents_per_hour: Tuple[int, ...]        # rate of each segment
+    minute_rates: Tuple[int, ...]          # cents per hour, by minute of day
+    cumulative: Tuple[int, ...]            # MINUTES_PER_DAY + 1 entries
+    
+    @classmethod
+    def for_franchise(cls, franchise: Franchise) -> "RateSchedule":
+        standard = _to_cents(franchise.standard_rate)
+        peak = _to_cents(franchise.peak_hour_rate)
+        return cls.from_breakpoints((0, PEAK_HOURS[0], PEAK_HOURS[1]), (standard, peak, standard))
+    
+    @classmethod
+    def from_breakpoints(cls, breakpoints: Sequence[int], cents_per_hour: Sequence[int]) -> "RateSchedule":
+        if not breakpoints or breakpoints[0] != 0 or list(breakpoints) != sorted(set(breakpoints)):
+            raise ValueError("Breakpoints must start at 0 and increase")
+        bounds = list(breakpoints) + [MINUTES_PER_DAY]
+        minute_rates = []
+        for index, rate in enumerate(cents_per_hour):
+            minute_rates.extend([rate] * (bounds[index + 1] - bounds[index]))
+        cumulative = [0]
+        for rate in minute_rates:
+            cumulative.append(cumulative[-1] + rate)
+        return cls(tuple(breakpoints), tuple(cents_per_hour), tuple(minute_rates), tuple(cumulative))
+    
+    def cost_units(self, second_of_span: int) -> int:
+        """Cost from the start of the span's first day up to second_of_span, in 1/3600 cent"""
+        days, second = divmod(second_of_span, SECONDS_PER_DAY)
+        minute, remainder = divmod(second, 60)
+        return days * self.cumulative[-1] * 60 + self.cumulative[minute] * 60 + self.minute_rates[minute] * remainder
+
+class PricingEngine:
+    """Prices bookings by summing over the rate segments they cross, in integer cents.
+    
+    Rate schedules are compiled once per franchise and recompiled when its rates change.
+    """
+    
+    def __init__(self):
+        self._schedules: Dict[str, Tuple[Tuple[Decimal, Decimal], RateSchedule]] = {}
+    
+    def schedule_for(self, franchise: Franchise) -> RateSchedule:
+        rates = (franchise.standard_rate, franchise.peak_hour_rate)
+        cached = self._schedules.get(franchise.id)
+        if cached is None or cached[0] != rates:
+            cached = self._schedules[franchise.id] = (rates, RateSchedule.for_franchise(franchise))
+        return cached[1]
+    
+    def price_cents(self, franchise: Franchise, start_time: datetime, end_time: datetime) -> int:
+        if end_time <= start_time:
+            raise ValueError("End time must be after start time")
+        schedule = self.schedule_for(franchise)
+        day_start = start_time.hour * 3600 + start_time.minute * 60 + start_time.second
+        duration = int((end_time - start_time).total_seconds())
+        units = schedule.cost_units(day_start + duration) - schedule.cost_units(day_start)
+        return (units + 1800) // 3600
+    
+    def quote_cents(self, franchise: Franchise, starts: "np.ndarray", ends: "np.ndarray") -> "np.ndarray":
+        """Vectorized price_cents for arrays of start/end epoch seconds, counted in wall-clock time"""
+        import numpy as np
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if np.any(ends <= starts):
+            raise ValueError("End time must be after start time")
+        schedule = self.schedule_for(franchise)
+        minute_rates = np.asarray(schedule.minute_rates, dtype=np.int64)
+        cumulative = np.asarray(schedule.cumulative, dtype=np.int64)
+        
+        def cost_units(seconds):
+            days, second = np.divmod(seconds, SECONDS_PER_DAY)
+            minute, remainder = np.divmod(second, 60)
+            return days * cumulative[-1] * 60 + cumulative[minute] * 60 + minute_rates[minute] * remainder
+        
+        day_start = starts % SECONDS_PER_DAY
+        units = cost_units(day_start + (ends - starts)) - cost_units(day_start)
+        return (units + 1800) // 3600
+    
+    def quote(self, franchise: Franchise, windows: Sequence[Tuple[datetime, datetime]]) -> "np.ndarray":
+        import numpy as np
+        # As in price_cents: rates follow the start's wall-clock time, the length is the elapsed time
+        starts = np.fromiter((epoch_seconds(wall_clock(start)) for start, _ in windows), dtype=np.int64,
+                             count=len(windows))
+        durations = np.fromiter((int((end - start).total_seconds()) for start, end in windows), dtype=np.int64,
+                                count=len(windows))
+        return self.quote_cents(franchise, starts, starts + durations)
+
+def _to_cents(amount: Decimal) -> int:
+    return int((amount * 100).to_integral_value())
\ No newline at end of file
@@ -1,16 +1,18 @@
 from datetime import datetime
+from typing import List, Sequence, Tuple
 from decimal import Decimal
 from ..entities.franchise import Franchise
 from ..value_objects.money import Money
+from .pricing_engine import PricingEngine
 
 class PricingService:
-    @staticmethod
-    def calculate_booking_cost(franchise: Franchise, start_time: datetime, end_time: datetime) -> Money:
-        duration_hours = (end_time - start_time).total_seconds() / 3600
-        
-        # Simple pricing: peak hours 16-18, otherwise standard
-        is_peak = 16 <= start_time.hour < 18
-        rate = franchise.peak_hour_rate if is_peak else franchise.standard_rate
-        
-        total_amount = Decimal(str(duration_hours)) * rate
-        return Money(amount=total_amount)
\ No newline at end of file
+    def __init__(self, engine: PricingEngine = None):
+        self.engine = engine or PricingEngine()
+    
+    def calculate_booking_cost(self, franchise: Franchise, start_time: datetime, end_time: datetime) -> Money:
+        # Standard rate, except peak_hour_rate for the part of the booking between 16:00 and 18:00
+        cents = self.engine.price_cents(franchise, start_time, end_time)
+        return Money(amount=Decimal(cents).scaleb(-2))
+    
+    def calculate_booking_costs(self, franchise: Franchise, windows: Sequence[Tuple[datetime, datetime]]) -> List[Money]:
+        return [Money(amount=Decimal(cents).scaleb(-2)) for cents in self.engine.quote(franchise, windows).tolist()]
\ No newline at end of file
@@ -10,7 +10,7 @@ class QRScanningService:
             decoded = base64.b64decode(qr_data).decode('utf-8')
             # Return the decoded booking ID (UUID format)
             return decoded if len(decoded) > 10 else None
-        except:
+        except ValueError:  # bad base64 (binascii.Error), non-ASCII input or non-UTF-8 payload
             return None
     
     @staticmethod
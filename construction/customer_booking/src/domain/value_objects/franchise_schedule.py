@@ -0,0 +1,90 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MINUTES_PER_DAY = 24 * 60
+
+def parse_minutes(value: str) -> int:
+    """'HH:MM' -> minutes after midnight; '24:00' is allowed as an end of day"""
+    hours, minutes = value.split(":")
+    result = int(hours) * 60 + int(minutes)
+    if not 0 <= result <= MINUTES_PER_DAY or not 0 <= int(minutes) < 60:
+        raise ValueError(f"Invalid time of day: {value}")
+    return result
+
+@dataclass(frozen=True, slots=True)
+class FranchiseSchedule:
+    """Opening hours compiled to integers: a weekday bitmask (bit 0 = Monday) and open/close
+    minute offsets per weekday, with date-specific closures and special hours on top"""
+    weekday_mask: int
+    open_minutes: Tuple[int, ...]   # by weekday, Monday first
+    close_minutes: Tuple[int, ...]
+    closures: FrozenSet[date] = frozenset()
+    special_hours: Tuple[Tuple[date, int, int], ...] = ()  # (day, open, close), sorted by day
+    
+    @classmethod
+    def compile(cls, open_time: str, close_time: str, operating_days: Iterable[int],
+                closures: Iterable[date] = (), special_hours: Optional[Dict[date, Tuple[str, str]]] = None
+                ) -> "FranchiseSchedule":
+        """operating_days uses Monday = 1 ... Sunday = 7, as on Franchise"""
+        open_minute, close_minute = parse_minutes(open_time), parse_minutes(close_time)
+        if close_minute <= open_minute:
+            raise ValueError("Closing time must be after opening time")
+        weekday_mask = 0
+        for day in operating_days:
+            weekday_mask |= 1 << (day - 1)
+        special = []
+        for day, (special_open, special_close) in sorted((special_hours or {}).items()):
+            special_open_minute, special_close_minute = parse_minutes(special_open), parse_minutes(special_close)
+            if special_close_minute <= special_open_minute:
+                raise ValueError(f"Closing time must be after opening time on {day.isoformat()}")
+            special.append((day, special_open_minute, special_close_minute))
+        return cls(weekday_mask, (open_minute,) * 7, (close_minute,) * 7, frozenset(closures), tuple(special))
+    
+    def hours_on(self, day: date) -> Optional[Tuple[int, int]]:
+        """(open minute, close minute) on day, or None when closed"""
+        if day in self.closures:
+            return None
+        index = bisect_left(self.special_hours, (day,))
+        if index < len(self.special_hours) and self.special_hours[index][0] == day:
+            return self.special_hours[index][1:]
+        weekday = day.weekday()
+        if not self.weekday_mask >> weekday & 1:
+            return None
+        return self.open_minutes[weekday], self.close_minutes[weekday]
+    
+    def is_open_for(self, start_time: datetime, end_time: datetime) -> bool:
+        """True when [start_time, end_time) lies within a single day's opening hours"""
+        hours = self.hours_on(start_time.date())
+        if hours is None:
+            return False
+        # Whole minutes: start rounded down, end rounded up, as for occupancy
+        start_minute = start_time.hour * 60 + start_time.minute
+        end_minute = (end_time.date() - start_time.date()).days * MINUTES_PER_DAY + end_time.hour * 60 + end_time.minute
+        if end_time.second or end_time.microsecond:
+            end_minute += 1
+        return hours[0] <= start_minute and end_minute <= hours[1]
+    
+    def open_slot_mask(self, start_date: date, day_count: int, slot_minutes: int) -> "np.ndarray":
+        """days x slots booleans: True where the whole slot falls within opening hours"""
+        import numpy as np
+        weekdays = (start_date.weekday() + np.arange(day_count)) % 7
+        opens = np.asarray(self.open_minutes)[weekdays]
+        closes = np.asarray(self.close_minutes)[weekdays]
+        closed = (self.weekday_mask >> weekdays & 1) == 0
+        for day, special_open, special_close in self.special_hours:
+            offset = (day - start_date).days
+            if 0 <= offset < day_count:
+                opens[offset], closes[offset], closed[offset] = special_open, special_close, False
+        for day in self.closures:
+            offset = (day - start_date).days
+            if 0 <= offset < day_count:
+                closed[offset] = True
+        slot_starts = np.arange(0, MINUTES_PER_DAY, slot_minutes)
+        mask = (slot_starts >= opens[:, None]) & (slot_starts + slot_minutes <= closes[:, None])
+        mask[closed] = False
+        return mask
\ No newline at end of file
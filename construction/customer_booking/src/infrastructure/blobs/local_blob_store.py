@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterable, BinaryIO, Optional, Union
+
+CHUNK_SIZE = 1024 * 1024
+KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+@dataclass(frozen=True, slots=True)
+class BlobInfo:
+    key: str   # SHA-256 of the content, hex
+    size: int  # bytes
+
+class BlobTooLarge(ValueError):
+    pass
+
+class BlobWriter:
+    """One upload in progress: bytes are hashed as they are written to a temporary file,
+    which commit() moves to its content address"""
+    
+    def __init__(self, store: "LocalBlobStore"):
+        self.store = store
+        self.max_bytes = store.max_object_bytes
+        self.size = 0
+        self._hash = hashlib.sha256()
+        os.makedirs(store.tmp_dir, exist_ok=True)
+        self._file = tempfile.NamedTemporaryFile(dir=store.tmp_dir, prefix="upload-", delete=False)
+    
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise BlobTooLarge(f"Blob larger than {self.max_bytes} bytes")
+        self._hash.update(chunk)
+        self._file.write(chunk)
+    
+    def commit(self) -> BlobInfo:
+        self._file.close()
+        key = self._hash.hexdigest()
+        path = self.store.path(key)
+        if os.path.exists(path):
+            os.unlink(self._file.name)  # same bytes already stored
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(self._file.name, path)
+        return BlobInfo(key, self.size)
+    
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._file.name):
+            os.unlink(self._file.name)
+
+class LocalBlobStore:
+    """Content-addressed blob store in a local directory, standing in for an S3 bucket.
+    
+    Objects are keyed by the SHA-256 of their bytes, so the same photo uploaded twice
+    is stored once. Methods follow the S3 object calls (put_object, get_object,
+    head_object, delete_object), so an S3-backed store can take its place. File work
+    runs on the store's own thread pool when called through the async methods, so
+    the event loop never hashes or writes blob bytes.
+    """
+    
+    def __init__(self, root: str, workers: int = 4, max_object_bytes: Optional[int] = None):
+        self.root = root
+        self.tmp_dir = os.path.join(root, "tmp")  # created with the first upload
+        self.max_object_bytes = max_object_bytes
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="blob-store")
+    
+    def path(self, key: str) -> str:
+        if not KEY_PATTERN.match(key):
+            raise ValueError("Invalid blob key")
+        return os.path.join(self.root, key[:2], key[2:4], key)
+    
+    def open_writer(self) -> BlobWriter:
+        return BlobWriter(self)
+    
+    def put_object(self, body: Union[bytes, BinaryIO]) -> BlobInfo:
+        writer = self.open_writer()
+        try:
+            if isinstance(body, (bytes, bytearray, memoryview)):
+                writer.write(bytes(body))
+            else:
+                for chunk in iter(lambda: body.read(CHUNK_SIZE), b""):
+                    writer.write(chunk)
+            return writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+    
+    def get_object(self, key: str) -> Optional[BinaryIO]:
+        try:
+            return open(self.path(key), "rb")
+        except FileNotFoundError:
+            return None
+    
+    def head_object(self, key: str) -> Optional[BlobInfo]:
+        try:
+            return BlobInfo(key, os.path.getsize(self.path(key)))
+        except FileNotFoundError:
+            return None
+    
+    def delete_object(self, key: str) -> None:
+        try:
+            os.unlink(self.path(key))
+        except FileNotFoundError:
+            pass
+    
+    async def put_stream(self, chunks: AsyncIterable[bytes]) -> BlobInfo:
+        """Store bytes as they arrive; hashing and writing happen on the store's thread pool"""
+        loop = asyncio.get_running_loop()
+        writer = await loop.run_in_executor(self.executor, self.open_writer)
+        try:
+            async for chunk in chunks:
+                await loop.run_in_executor(self.executor, writer.write, chunk)
+            return await loop.run_in_executor(self.executor, writer.commit)
+        except BaseException:
+            await loop.run_in_executor(self.executor, writer.abort)
+            raise
+    
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
\ No newline at end of file
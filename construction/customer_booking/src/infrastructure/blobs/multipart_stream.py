@@ -0,0 +1,74 @@
+from typing import AsyncIterator, Dict, List
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+class MultipartError(ValueError):
+    pass
+
+async def multipart_file_chunks(body: AsyncIterator[bytes], content_type: str,
+                                field_name: str) -> AsyncIterator[bytes]:
+    """Yield the bytes of one form field from a streamed multipart/form-data body as they arrive.
+    
+    Other fields are skipped and only one received chunk is held at a time, so the
+    request body is never buffered whole.
+    """
+    media_type, options = parse_options_header(content_type)
+    boundary = options.get(b"boundary")
+    if media_type != b"multipart/form-data" or not boundary:
+        raise MultipartError("Expected a multipart/form-data body")
+    
+    field = field_name.encode()
+    headers: Dict[bytes, bytes] = {}
+    header_field, header_value = bytearray(), bytearray()
+    state = {"in_field": False, "found": False}
+    pending: List[bytes] = []
+    
+    def on_part_begin():
+        headers.clear()
+    
+    def on_header_field(data: bytes, start: int, end: int):
+        header_field.extend(data[start:end])
+    
+    def on_header_value(data: bytes, start: int, end: int):
+        header_value.extend(data[start:end])
+    
+    def on_header_end():
+        headers[bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+    
+    def on_headers_finished():
+        _, disposition = parse_options_header(headers.get(b"content-disposition", b""))
+        state["in_field"] = disposition.get(b"name") == field and not state["found"]
+    
+    def on_part_data(data: bytes, start: int, end: int):
+        if state["in_field"]:
+            pending.append(data[start:end])
+    
+    def on_part_end():
+        if state["in_field"]:
+            state["in_field"], state["found"] = False, True
+    
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+    async for chunk in body:
+        try:
+            parser.write(chunk)
+        except Exception as e:
+            raise MultipartError(f"Malformed multipart body: {e}") from e
+        if pending:
+            yield b"".join(pending)
+            pending.clear()
+    parser.finalize()
+    if not state["found"]:
+        raise MultipartError(f"Missing form field '{field_name}'")
\ No newline at end of file
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable
+
+Tag = Hashable
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0      # entries dropped to stay within max_entries
+    expirations: int = 0    # entries found past their TTL
+    invalidations: int = 0  # entries dropped by tag invalidation
+    size: int = 0
+
+class CacheBackend(ABC):
+    """Key/value cache with per-entry TTL and tag-based invalidation.
+    
+    Tags group entries that depend on the same data, e.g. one franchise's
+    availability on one day, so they can be dropped together when it changes.
+    """
+    
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        ...
+    
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: float, tags: Iterable[Tag] = ()) -> None:
+        ...
+    
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[Tag]) -> int:
+        ...
+    
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+    
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        ...
+    
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: float, tags: Iterable[Tag] = ()) -> Any:
+        """Cache-aside read: return the cached value, or load, store and return it"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value, ttl, tags)
+        return value
+
+_MISSING = object()
\ No newline at end of file
@@ -0,0 +1,22 @@
+from typing import List
+from ...domain.events.base_event import BaseEvent
+from ...domain.events.booking_events import BookingCreated, BookingCancelled
+from ...domain.services.occupancy_timeline import split_by_day
+from .cache_backend import CacheBackend
+from .cache_tags import availability_tag
+
+class CacheInvalidator:
+    """Event subscriber that drops cached availability for exactly the franchise days a booking
+    occupies, whenever one is created or cancelled"""
+    
+    def __init__(self, cache: CacheBackend):
+        self.cache = cache
+    
+    def __call__(self, events: List[BaseEvent]) -> None:
+        tags = set()
+        for event in events:
+            if isinstance(event, (BookingCreated, BookingCancelled)) and event.franchise_id:
+                for day, _, _ in split_by_day(event.start_datetime, event.end_datetime):
+                    tags.add(availability_tag(event.franchise_id, day))
+        if tags:
+            self.cache.invalidate_tags(tags)
\ No newline at end of file
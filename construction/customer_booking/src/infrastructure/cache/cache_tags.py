@@ -0,0 +1,15 @@
+from datetime import date, timedelta
+from typing import List, Tuple
+
+# Tags shared by the cached services and CacheInvalidator, so writers and readers agree
+FRANCHISE_LIST_TAG = ("franchises",)
+
+def franchise_tag(franchise_id: str) -> Tuple[str, str]:
+    return ("franchise", franchise_id)
+
+def availability_tag(franchise_id: str, day: date) -> Tuple[str, str, date]:
+    return ("availability", franchise_id, day)
+
+def availability_tags(franchise_id: str, start_date: date, end_date: date) -> List[Tuple[str, str, date]]:
+    return [availability_tag(franchise_id, start_date + timedelta(days=i))
+            for i in range((end_date - start_date).days + 1)]
\ No newline at end of file
@@ -0,0 +1,61 @@
+from datetime import date, datetime
+from ...domain.entities.franchise import Franchise
+from ...domain.services.pricing_service import PricingService
+from ...domain.value_objects.money import Money
+from .cache_backend import CacheBackend
+from .cache_tags import availability_tags, franchise_tag
+
+class CachedAvailabilityService:
+    """Cache-aside wrapper for AvailabilityService's range reports.
+    
+    Entries are tagged with every franchise day they cover, so CacheInvalidator
+    drops them when a booking on one of those days is created or cancelled, and
+    with the franchise, so they go when its capacity or hours change. Single
+    availability checks read the repository's occupancy directly.
+    """
+    
+    def __init__(self, availability_service, cache: CacheBackend, ttl: float = 300):
+        self.availability_service = availability_service
+        self.cache = cache
+        self.ttl = ttl
+    
+    def check_availability(self, franchise: Franchise, start_time: datetime, end_time: datetime) -> bool:
+        return self.availability_service.check_availability(franchise, start_time, end_time)
+    
+    def check_availability_batch(self, franchise: Franchise, windows) -> list:
+        return self.availability_service.check_availability_batch(franchise, windows)
+    
+    def get_availability_grid(self, franchise: Franchise, start_date: date, end_date: date, slot_minutes: int = 30):
+        return self.cache.get_or_load(
+            ("availability_grid", franchise.id, start_date, end_date, slot_minutes),
+            lambda: self.availability_service.get_availability_grid(franchise, start_date, end_date, slot_minutes),
+            self.ttl, self._tags(franchise, start_date, end_date))
+    
+    def get_hourly_occupancy(self, franchise: Franchise, start_date: date, end_date: date):
+        return self.cache.get_or_load(
+            ("hourly_occupancy", franchise.id, start_date, end_date),
+            lambda: self.availability_service.get_hourly_occupancy(franchise, start_date, end_date),
+            self.ttl, self._tags(franchise, start_date, end_date))
+    
+    def _tags(self, franchise: Franchise, start_date: date, end_date: date) -> list:
+        if end_date < start_date:
+            return []  # the wrapped service rejects the range before anything is cached
+        return [franchise_tag(franchise.id)] + availability_tags(franchise.id, start_date, end_date)
+
+class CachedPricingService:
+    """Cache-aside wrapper for PricingService; entries go when the franchise's rates change"""
+    
+    def __init__(self, cache: CacheBackend, ttl: float = 3600, pricing_service: PricingService = None):
+        self.cache = cache
+        self.ttl = ttl
+        self.pricing_service = pricing_service or PricingService()
+    
+    def calculate_booking_cost(self, franchise: Franchise, start_time: datetime, end_time: datetime) -> Money:
+        return self.cache.get_or_load(
+            ("pricing", franchise.id, start_time, end_time),
+            lambda: self.pricing_service.calculate_booking_cost(franchise, start_time, end_time),
+            self.ttl, [franchise_tag(franchise.id)])
+    
+    def calculate_booking_costs(self, franchise: Franchise, windows) -> list:
+        # One-off import windows rarely repeat, so batches skip the cache
+        return self.pricing_service.calculate_booking_costs(franchise, windows)
\ No newline at end of file
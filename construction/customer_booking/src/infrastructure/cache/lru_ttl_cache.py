@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Set, Tuple
+from .cache_backend import CacheBackend, CacheStats, Tag
+
+class LRUTTLCache(CacheBackend):
+    """In-process cache: least recently used entries are evicted beyond max_entries,
+    and entries older than their TTL are dropped when next read"""
+    
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, Tuple[Tag, ...]]]" = OrderedDict()
+        self._keys_by_tag: Dict[Tag, Set[Hashable]] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return default
+            value, expires_at, _ = entry
+            if expires_at <= self.clock():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any, ttl: float, tags: Iterable[Tag] = ()) -> None:
+        tags = tuple(tags)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, self.clock() + ttl, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+    
+    def invalidate_tags(self, tags: Iterable[Tag]) -> int:
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                for key in self._keys_by_tag.get(tag, set()).copy():
+                    self._remove(key)
+                    removed += 1
+            self._stats.invalidations += removed
+        return removed
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+    
+    @property
+    def stats(self) -> CacheStats:
+        self._stats.size = len(self._entries)
+        return self._stats
+    
+    def _remove(self, key: Hashable) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
\ No newline at end of file
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional
+from ...domain.events.base_event import BaseEvent
+from .event_publisher import PublisherMetrics, notify_subscribers
+from .event_sinks import EventSink
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+class AsyncEventPublisher:
+    """Queues events on a bounded asyncio queue and flushes them to a sink in batches.
+    
+    A batch is written once it reaches batch_size events or its first event has
+    waited linger_ms. publish_events keeps the synchronous EventPublisher
+    signature: on the event loop it only enqueues; when the queue is full the
+    caller drains it inline (in order) as backpressure. Other threads block
+    until their events are queued. Before start() and after stop() events go
+    straight to the sink. Subscribers are called when events are published,
+    not when they are flushed.
+    """
+    
+    def __init__(self, sink: EventSink, max_queue_size: int = 10000, batch_size: int = 256,
+                 linger_ms: float = 20.0):
+        self.sink = sink
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.linger = linger_ms / 1000
+        self._metrics = PublisherMetrics()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: List[BaseEvent] = []  # batch being collected by the flusher
+        self._batch_ready: Optional[asyncio.Event] = None
+        self.subscribers: List[Callable[[List[BaseEvent]], None]] = []
+    
+    def subscribe(self, handler: Callable[[List[BaseEvent]], None]) -> None:
+        self.subscribers.append(handler)
+    
+    @property
+    def metrics(self) -> PublisherMetrics:
+        self._metrics.queue_depth = self._queue.qsize() + len(self._pending) if self._queue else 0
+        return self._metrics
+    
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._batch_ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Flush everything queued, then stop the flusher"""
+        if self._task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+    
+    async def flush(self) -> None:
+        if self._task is not None:
+            await self._queue.join()
+    
+    def publish_events(self, events: List[BaseEvent]) -> None:
+        if not events:
+            return
+        self._metrics.published += len(events)
+        notify_subscribers(self.subscribers, events)
+        if self._task is None:
+            self._write(list(events))
+        elif self._on_loop_thread():
+            for position, event in enumerate(events):
+                try:
+                    self._queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    self._drain_inline(list(events[position:]))
+                    break
+            self._signal_batch_ready()
+        else:
+            asyncio.run_coroutine_threadsafe(self._enqueue(events), self._loop).result()
+    
+    async def publish_events_async(self, events: List[BaseEvent]) -> None:
+        """Awaits queue space instead of draining inline when the queue is full"""
+        self._metrics.published += len(events)
+        notify_subscribers(self.subscribers, events)
+        if self._task is None:
+            self._write(list(events))
+        else:
+            await self._enqueue(events)
+    
+    async def _enqueue(self, events: List[BaseEvent]) -> None:
+        for event in events:
+            await self._queue.put(event)
+        self._signal_batch_ready()
+    
+    def _signal_batch_ready(self) -> None:
+        if self._queue.qsize() + len(self._pending) >= self.batch_size:
+            self._batch_ready.set()
+    
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+    
+    async def _run(self) -> None:
+        while True:
+            # Items are only taken off the queue by direct awaits or get_nowait, never by a
+            # helper task, so the batch in progress is always visible to _drain_inline.
+            item = await self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            self._pending.append(item)
+            if self._queue.qsize() + len(self._pending) < self.batch_size:
+                self._batch_ready.clear()
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.linger)
+                except asyncio.TimeoutError:
+                    pass
+            stopping = False
+            while len(self._pending) < self.batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                self._pending.append(item)
+            self._flush_pending(self._pending)
+            if stopping:
+                return
+    
+    def _drain_inline(self, events: List[BaseEvent]) -> None:
+        """Backpressure: write the flusher's batch, the queue and these events from the caller"""
+        queued = []
+        stop_requested = False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is _STOP:
+                stop_requested = True
+                continue
+            queued.append(item)
+        self._metrics.backpressured += len(events)
+        self._flush_pending(self._pending + queued)
+        self._write(events)
+        if stop_requested:
+            self._queue.task_done()
+            self._queue.put_nowait(_STOP)
+    
+    def _flush_pending(self, batch: List[BaseEvent]) -> None:
+        self._pending = []
+        self._write(batch)
+        for _ in batch:
+            self._queue.task_done()
+    
+    def _write(self, batch: List[BaseEvent]) -> None:
+        if not batch:
+            return
+        try:
+            self.sink.write_batch(batch)
+        except Exception:
+            logger.exception("Failed to publish %d events", len(batch))
+            self._metrics.failed += len(batch)
+            return
+        self._metrics.flushed += len(batch)
+        self._metrics.batches += 1
+        self._metrics.max_batch_size = max(self._metrics.max_batch_size, len(batch))
\ No newline at end of file
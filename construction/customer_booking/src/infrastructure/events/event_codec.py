@@ -0,0 +1,37 @@
+import json
+from dataclasses import fields
+from datetime import datetime, timedelta
+from ...domain.events.base_event import BaseEvent
+from ...domain.events.booking_events import BookingCreated, PaymentProcessed, BookingCancelled
+from ...domain.events.admin_events import (SessionStarted, ChildCheckedIn, OvertimeChargeApplied,
+                                           ChildCheckedOut, SessionCompleted)
+
+# Events are stored as a positional JSON array: [type name, field values in declaration order].
+# New event fields must therefore be appended; older records simply decode with the defaults.
+EVENT_TYPES = {cls.__name__: cls for cls in (
+    BookingCreated, PaymentProcessed, BookingCancelled,
+    SessionStarted, ChildCheckedIn, OvertimeChargeApplied, ChildCheckedOut, SessionCompleted
+)}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def encode_event(event: BaseEvent) -> bytes:
+    values = [type(event).__name__]
+    for f in fields(event):
+        value = getattr(event, f.name)
+        if isinstance(value, datetime):
+            # Naive (UTC) timestamps as integer microseconds; aware ones keep their offset
+            value = (value - _EPOCH) // _MICROSECOND if value.tzinfo is None else value.isoformat()
+        values.append(value)
+    return json.dumps(values, separators=(",", ":")).encode()
+
+def decode_event(data: bytes) -> BaseEvent:
+    values = json.loads(data)
+    cls = EVENT_TYPES[values[0]]
+    kwargs = {}
+    for f, value in zip(fields(cls), values[1:]):
+        if f.type is datetime and value is not None:
+            value = _EPOCH + value * _MICROSECOND if isinstance(value, int) else datetime.fromisoformat(value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
\ No newline at end of file
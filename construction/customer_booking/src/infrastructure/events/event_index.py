@@ -0,0 +1,62 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union, Callable
+from ...domain.events.base_event import BaseEvent
+
+EventType = Union[str, type]
+
+class StoredEvent(NamedTuple):
+    sequence: int
+    event: BaseEvent
+
+def event_type_name(event_type: Optional[EventType]) -> Optional[str]:
+    return event_type.__name__ if isinstance(event_type, type) else event_type
+
+def aggregate_ids(event: BaseEvent) -> List[str]:
+    return [value for value in (getattr(event, "booking_id", ""), getattr(event, "session_id", "")) if value]
+
+class EventIndex:
+    """Ascending sequence numbers per event type and per aggregate (booking_id / session_id)"""
+    
+    def __init__(self):
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_aggregate: Dict[str, List[int]] = {}
+    
+    def add(self, sequence: int, event: BaseEvent) -> None:
+        self._by_type.setdefault(type(event).__name__, []).append(sequence)
+        for aggregate_id in aggregate_ids(event):
+            self._by_aggregate.setdefault(aggregate_id, []).append(sequence)
+    
+    def discard_before(self, sequence: int) -> None:
+        for index in (self._by_type, self._by_aggregate):
+            for key in list(index):
+                sequences = index[key]
+                del sequences[:bisect_left(sequences, sequence)]
+                if not sequences:
+                    del index[key]
+    
+    def candidates(self, from_sequence: int, event_type: Optional[str], aggregate_id: Optional[str],
+                   next_sequence: Callable[[], int]) -> Iterator[int]:
+        """Yield sequence numbers that may match, lazily, including events appended meanwhile.
+        
+        With both filters only the aggregate index is walked; callers check the type.
+        """
+        if aggregate_id is not None:
+            sequences = self._by_aggregate.get(aggregate_id, [])
+        elif event_type is not None:
+            sequences = self._by_type.get(event_type, [])
+        else:
+            sequence = from_sequence
+            while sequence < next_sequence():
+                yield sequence
+                sequence += 1
+            return
+        
+        position = bisect_left(sequences, from_sequence)
+        while position < len(sequences):
+            sequence = sequences[position]
+            yield sequence
+            # Retention may have trimmed the list while we were suspended
+            if position >= len(sequences) or sequences[position] != sequence:
+                position = bisect_right(sequences, sequence)
+            else:
+                position += 1
\ No newline at end of file
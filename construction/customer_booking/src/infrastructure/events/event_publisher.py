@@ -1,12 +1,44 @@
-from typing import List
+import logging
+from dataclasses import dataclass
+from typing import Callable, List
 from ...domain.events.base_event import BaseEvent
 from .event_store import EventStore
 
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PublisherMetrics:
+    published: int = 0        # events accepted from callers
+    flushed: int = 0          # events written to the sink
+    batches: int = 0          # sink writes
+    max_batch_size: int = 0
+    backpressured: int = 0    # events a caller had to write itself because the queue was full
+    failed: int = 0           # events lost to sink errors
+    queue_depth: int = 0
+
 class EventPublisher:
     def __init__(self, event_store: EventStore):
         self.event_store = event_store
+        self.metrics = PublisherMetrics()
+        self.subscribers: List[Callable[[List[BaseEvent]], None]] = []
+    
+    def subscribe(self, handler: Callable[[List[BaseEvent]], None]) -> None:
+        """Call handler in-process with each published batch (e.g. cache invalidation)"""
+        self.subscribers.append(handler)
     
     def publish_events(self, events: List[BaseEvent]) -> None:
         # Mock SQS publishing - just store events
         self.event_store.save_events(events)
-        print(f"Published {len(events)} events to SQS")
\ No newline at end of file
+        self.metrics.published += len(events)
+        self.metrics.flushed += len(events)
+        self.metrics.batches += 1
+        self.metrics.max_batch_size = max(self.metrics.max_batch_size, len(events))
+        logger.debug("Published %d events to SQS", len(events))
+        notify_subscribers(self.subscribers, events)
+
+def notify_subscribers(subscribers: List[Callable[[List[BaseEvent]], None]], events: List[BaseEvent]) -> None:
+    for handler in subscribers:
+        try:
+            handler(events)
+        except Exception:
+            logger.exception("Event subscriber %r failed", handler)
\ No newline at end of file
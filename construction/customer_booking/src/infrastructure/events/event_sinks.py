@@ -0,0 +1,44 @@
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import List
+from ...domain.events.base_event import BaseEvent
+from .event_codec import encode_event
+
+class EventSink(ABC):
+    """Destination for batches flushed by AsyncEventPublisher"""
+    
+    @abstractmethod
+    def write_batch(self, events: List[BaseEvent]) -> None:
+        ...
+
+class EventStoreSink(EventSink):
+    def __init__(self, event_store):
+        self.event_store = event_store
+    
+    def write_batch(self, events: List[BaseEvent]) -> None:
+        self.event_store.save_events(events)
+
+class FileQueueSink(EventSink):
+    """Local SQS stand-in: appends one encoded event per line to a queue file"""
+    
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+    
+    def write_batch(self, events: List[BaseEvent]) -> None:
+        data = b"".join(encode_event(event) + b"\n" for event in events)
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+    
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
\ No newline at end of file
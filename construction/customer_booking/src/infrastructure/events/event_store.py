@@ -1,12 +1,36 @@
-from typing import List
+import threading
+from itertools import islice
+from typing import Iterator, List, Optional
 from ...domain.events.base_event import BaseEvent
+from .event_index import EventIndex, EventType, StoredEvent, event_type_name
 
 class EventStore:
     def __init__(self):
         self._events: List[BaseEvent] = []
+        self._index = EventIndex()
+        self._lock = threading.Lock()
+    
+    @property
+    def next_sequence(self) -> int:
+        return len(self._events)
     
     def save_events(self, events: List[BaseEvent]) -> None:
-        self._events.extend(events)
+        with self._lock:
+            for event in events:
+                self._index.add(len(self._events), event)
+                self._events.append(event)
     
     def get_all_events(self) -> List[BaseEvent]:
-        return self._events.copy()
\ No newline at end of file
+        return self._events.copy()
+    
+    def read(self, from_sequence: int = 0, limit: int = 100, event_type: Optional[EventType] = None,
+             aggregate_id: Optional[str] = None) -> List[StoredEvent]:
+        return list(islice(self.stream(from_sequence, event_type, aggregate_id), limit))
+    
+    def stream(self, from_sequence: int = 0, event_type: Optional[EventType] = None,
+               aggregate_id: Optional[str] = None) -> Iterator[StoredEvent]:
+        type_name = event_type_name(event_type)
+        for sequence in self._index.candidates(from_sequence, type_name, aggregate_id, lambda: len(self._events)):
+            event = self._events[sequence]
+            if type_name is None or type(event).__name__ == type_name:
+                yield StoredEvent(sequence, event)
\ No newline at end of file
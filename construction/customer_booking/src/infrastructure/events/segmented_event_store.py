@@ -0,0 +1,192 @@
+import mmap
+import os
+import struct
+import threading
+from array import array
+from itertools import islice
+from typing import Iterator, List, Optional
+from ...domain.events.base_event import BaseEvent
+from .event_codec import encode_event, decode_event
+from .event_index import EventIndex, EventType, StoredEvent, event_type_name
+
+# Record layout: sequence number (u64), payload length (u32), payload
+RECORD_HEADER = struct.Struct("<QI")
+SEGMENT_SUFFIX = ".log"
+
+class _Segment:
+    """One append-only segment file, named after the sequence number of its first event"""
+    
+    def __init__(self, directory: str, base_sequence: int):
+        self.base_sequence = base_sequence
+        self.path = os.path.join(directory, f"{base_sequence:020d}{SEGMENT_SUFFIX}")
+        self.offsets = array("Q")  # file offset of each record, by sequence - base_sequence
+        self.size = 0
+        self._map: Optional[mmap.mmap] = None
+    
+    @property
+    def next_sequence(self) -> int:
+        return self.base_sequence + len(self.offsets)
+    
+    def scan(self) -> None:
+        """Rebuild the offset index, truncating a partially written trailing record"""
+        self.size = os.path.getsize(self.path)
+        view = self._view(self.size)
+        offset = 0
+        while offset + RECORD_HEADER.size <= self.size:
+            _, length = RECORD_HEADER.unpack_from(view, offset)
+            if offset + RECORD_HEADER.size + length > self.size:
+                break
+            self.offsets.append(offset)
+            offset += RECORD_HEADER.size + length
+        if offset != self.size:
+            self.close()
+            os.truncate(self.path, offset)
+            self.size = offset
+    
+    def read(self, sequence: int) -> bytes:
+        offset = self.offsets[sequence - self.base_sequence]
+        view = self._view(self.size)
+        _, length = RECORD_HEADER.unpack_from(view, offset)
+        start = offset + RECORD_HEADER.size
+        return view[start:start + length]
+    
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+    
+    def _view(self, needed: int):
+        # Segments only grow, so remap when a read reaches past the current mapping
+        if needed == 0:
+            return b""
+        if self._map is None or len(self._map) < needed:
+            self.close()
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+class SegmentedEventStore:
+    """File-backed EventStore: size-rolled, append-only segment files read through mmap.
+    
+    Each event gets a monotonic sequence number; an in-memory offset index per
+    segment lets replay and tail reads touch only the records they return.
+    Retention drops whole segments from the old end. The type/aggregate index
+    is rebuilt from the retained segments on open.
+    """
+    
+    def __init__(self, directory: str, segment_bytes: int = 16 * 1024 * 1024,
+                 retention_segments: Optional[int] = None, fsync: bool = False):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.retention_segments = retention_segments
+        self.fsync = fsync
+        self._lock = threading.RLock()
+        self._segments: List[_Segment] = []
+        self._index = EventIndex()
+        os.makedirs(directory, exist_ok=True)
+        
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(SEGMENT_SUFFIX):
+                segment = _Segment(directory, int(name[:-len(SEGMENT_SUFFIX)]))
+                segment.scan()
+                self._segments.append(segment)
+        if not self._segments:
+            self._segments.append(self._create_segment(0))
+        for sequence, event in enumerate(self.replay(), self.first_sequence):
+            self._index.add(sequence, event)
+        self._writer = open(self._segments[-1].path, "ab")
+    
+    @property
+    def first_sequence(self) -> int:
+        return self._segments[0].base_sequence
+    
+    @property
+    def next_sequence(self) -> int:
+        return self._segments[-1].next_sequence
+    
+    def save_events(self, events: List[BaseEvent]) -> None:
+        with self._lock:
+            for event in events:
+                segment = self._segments[-1]
+                if segment.size >= self.segment_bytes:
+                    segment = self._roll()
+                payload = encode_event(event)
+                self._writer.write(RECORD_HEADER.pack(segment.next_sequence, len(payload)))
+                self._writer.write(payload)
+                self._index.add(segment.next_sequence, event)
+                segment.offsets.append(segment.size)
+                segment.size += RECORD_HEADER.size + len(payload)
+            self._writer.flush()
+            if self.fsync:
+                os.fsync(self._writer.fileno())
+    
+    def get_all_events(self) -> List[BaseEvent]:
+        return list(self.replay())
+    
+    def replay(self, from_sequence: int = 0) -> Iterator[BaseEvent]:
+        """Yield retained events from from_sequence onwards, decoding them lazily"""
+        sequence = from_sequence
+        while True:
+            with self._lock:
+                # Retention may drop segments between events; skip ahead past them
+                sequence = max(sequence, self.first_sequence)
+                if sequence >= self.next_sequence:
+                    return
+                payload = self._segment_for(sequence).read(sequence)
+            yield decode_event(payload)
+            sequence += 1
+    
+    def tail(self, count: int) -> List[BaseEvent]:
+        return list(self.replay(max(self.next_sequence - count, 0)))
+    
+    def read(self, from_sequence: int = 0, limit: int = 100, event_type: Optional[EventType] = None,
+             aggregate_id: Optional[str] = None) -> List[StoredEvent]:
+        return list(islice(self.stream(from_sequence, event_type, aggregate_id), limit))
+    
+    def stream(self, from_sequence: int = 0, event_type: Optional[EventType] = None,
+               aggregate_id: Optional[str] = None) -> Iterator[StoredEvent]:
+        type_name = event_type_name(event_type)
+        from_sequence = max(from_sequence, self.first_sequence)
+        for sequence in self._index.candidates(from_sequence, type_name, aggregate_id, lambda: self.next_sequence):
+            with self._lock:
+                if sequence < self.first_sequence:
+                    continue
+                payload = self._segment_for(sequence).read(sequence)
+            event = decode_event(payload)
+            if type_name is None or type(event).__name__ == type_name:
+                yield StoredEvent(sequence, event)
+    
+    def close(self) -> None:
+        with self._lock:
+            self._writer.close()
+            for segment in self._segments:
+                segment.close()
+    
+    def _segment_for(self, sequence: int) -> _Segment:
+        segments = self._segments
+        low, high = 0, len(segments) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if segments[middle].base_sequence <= sequence:
+                low = middle
+            else:
+                high = middle - 1
+        return segments[low]
+    
+    def _create_segment(self, base_sequence: int) -> _Segment:
+        segment = _Segment(self.directory, base_sequence)
+        open(segment.path, "ab").close()
+        return segment
+    
+    def _roll(self) -> _Segment:
+        self._writer.close()
+        segment = self._create_segment(self._segments[-1].next_sequence)
+        self._segments.append(segment)
+        self._writer = open(segment.path, "ab")
+        if self.retention_segments:
+            while len(self._segments) > self.retention_segments:
+                expired = self._segments.pop(0)
+                expired.close()
+                os.remove(expired.path)
+            self._index.discard_before(self.first_sequence)
+        return segment
\ No newline at end of file
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from ..cache.cache_backend import CacheBackend
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    fingerprint: str   # hash of the request the key was first used with
+    status_code: int
+    body: Any          # JSON-compatible
+    expires_at: float  # wall-clock seconds
+
+class IdempotencyKeyReused(ValueError):
+    pass
+
+class IdempotencyStore:
+    """Remembers the response to each Idempotency-Key so a retried command is answered, not re-run.
+    
+    Responses live in a bounded LRU+TTL cache and, when a durable repository is
+    given, are written through to it so they outlast eviction and restarts. A
+    duplicate that arrives while the first request is still running waits for
+    that result. In-flight requests are tracked with asyncio futures, so run()
+    must be called on the event loop.
+    """
+    
+    def __init__(self, cache: CacheBackend, ttl: float = 24 * 3600, repository=None,
+                 clock: Callable[[], float] = time.time):
+        self.cache = cache
+        self.ttl = ttl
+        self.repository = repository
+        self.clock = clock
+        self._in_flight: Dict[str, Tuple[str, asyncio.Future]] = {}
+    
+    async def run(self, key: str, fingerprint: str,
+                  command: Callable[[], Awaitable[Tuple[int, Any]]]) -> StoredResponse:
+        """Result of command() for key: stored, awaited from an in-flight duplicate or newly executed.
+        
+        command returns (status_code, body). If it raises, nothing is stored and a
+        retry runs it again.
+        """
+        stored = self.get(key)
+        if stored is not None:
+            _check_fingerprint(stored.fingerprint, fingerprint)
+            return stored
+        
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            _check_fingerprint(in_flight[0], fingerprint)
+            return await asyncio.shield(in_flight[1])
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (fingerprint, future)
+        try:
+            status_code, body = await command()
+            stored = StoredResponse(fingerprint, status_code, body, self.clock() + self.ttl)
+            self.save(key, stored)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; don't warn when there are none
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._in_flight[key]
+        future.set_result(stored)
+        return stored
+    
+    def get(self, key: str) -> Optional[StoredResponse]:
+        stored = self.cache.get(key)
+        if stored is None and self.repository is not None:
+            stored = self.repository.get(key, self.clock())
+            if stored is not None:
+                self.cache.set(key, stored, stored.expires_at - self.clock())
+        return stored
+    
+    def save(self, key: str, stored: StoredResponse) -> None:
+        self.cache.set(key, stored, self.ttl)
+        if self.repository is not None:
+            self.repository.save(key, stored, self.clock())
+
+def _check_fingerprint(expected: str, fingerprint: str) -> None:
+    if expected != fingerprint:
+        raise IdempotencyKeyReused("Idempotency-Key was already used with a different request")
\ No newline at end of file
@@ -0,0 +1,28 @@
+import threading
+from contextlib import contextmanager
+from typing import Hashable, Iterable, Iterator
+
+class StripedLock:
+    """A fixed set of locks shared out by key hash, e.g. one per (franchise_id, day).
+    
+    Callers that touch different keys rarely wait on each other, and memory stays
+    bounded however many keys there are. hold() takes the stripes for all its keys
+    in index order, so callers locking several keys at once cannot deadlock.
+    Locks are per process.
+    """
+    
+    def __init__(self, stripes: int = 64):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+    
+    @contextmanager
+    def hold(self, keys: Iterable[Hashable]) -> Iterator[None]:
+        indexes = sorted({hash(key) % len(self._locks) for key in keys})
+        acquired = []
+        try:
+            for index in indexes:
+                self._locks[index].acquire()
+                acquired.append(self._locks[index])
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
\ No newline at end of file
@@ -64,7 +64,7 @@ def seed_bookings(booking_service: BookingApplicationService, franchises):
         {
             "customer": CustomerInfo(
                 name="Sarah Johnson",
-                email="sarah@example.com", 
+                email="sarah@example.com",
                 phone="+1-555-0101",
                 emergency_contact="Mike Johnson +1-555-0102"
             ),
@@ -79,7 +79,7 @@ def seed_bookings(booking_service: BookingApplicationService, franchises):
             "customer": CustomerInfo(
                 name="David Chen",
                 email="david@example.com",
-                phone="+1-555-0201", 
+                phone="+1-555-0201",
                 emergency_contact="Lisa Chen +1-555-0202"
             ),
             "child": ChildInfo(
@@ -97,7 +97,7 @@ def seed_bookings(booking_service: BookingApplicationService, franchises):
                 emergency_contact="Carlos Rodriguez +1-555-0302"
             ),
             "child": ChildInfo(
-                name="Sofia Rodriguez", 
+                name="Sofia Rodriguez",
                 age=3,
                 allergies="Dairy",
                 special_instructions="Nap time 1-2pm"
@@ -133,12 +133,13 @@ def seed_bookings(booking_service: BookingApplicationService, franchises):
     
     return bookings
 
-def run_migration(franchise_repo, booking_repo, payment_repo, session_repo, event_store, event_publisher):
+def run_migration(franchise_repo, booking_repo, payment_repo, session_repo, event_store, event_publisher,
+                  booking_service=None):
     """Run complete data migration"""
     print("🌱 Seeding database with demo data...")
     
     # Initialize services
-    booking_service = BookingApplicationService(
+    booking_service = booking_service or BookingApplicationService(
         booking_repo, franchise_repo, payment_repo, event_publisher
     )
     
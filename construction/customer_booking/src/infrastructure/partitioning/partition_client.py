@@ -0,0 +1,44 @@
+import multiprocessing
+import threading
+from typing import Any
+from .partition_worker import STOP, run_partition
+
+class PartitionClient:
+    """Router-side handle on one partition worker process, over a pipe.
+    
+    Calls from several threads are serialized on the pipe; the worker handles
+    one command at a time anyway, which is what keeps its franchises consistent.
+    """
+    
+    def __init__(self, index: int, config):
+        self.index = index
+        # spawn: the router may already be running an event loop and threads, which fork would copy
+        context = multiprocessing.get_context("spawn")
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(target=run_partition, args=(worker_connection, config),
+                                        name=f"partition-{index}", daemon=True)
+        self._process.start()
+        worker_connection.close()
+        self._lock = threading.Lock()
+    
+    def call(self, target: str, method: str, *args) -> Any:
+        with self._lock:
+            try:
+                self._connection.send((target, method, args))
+                ok, result = self._connection.recv()
+            except (EOFError, OSError):
+                raise RuntimeError(f"Partition {self.index} is not running")
+        if not ok:
+            raise result
+        return result
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        with self._lock:
+            try:
+                self._connection.send(STOP)
+            except (EOFError, OSError):
+                pass
+            self._connection.close()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
\ No newline at end of file
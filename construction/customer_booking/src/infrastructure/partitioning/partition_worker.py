@@ -0,0 +1,44 @@
+import logging
+from multiprocessing.connection import Connection
+
+logger = logging.getLogger(__name__)
+
+# Container attributes a partition serves; anything else is refused
+COMMAND_TARGETS = ("booking_service", "session_service", "availability_service", "booking_repo",
+                   "session_repo", "franchise_repo", "event_publisher", "cache")
+
+STOP = "stop"
+
+def run_partition(connection: Connection, config) -> None:
+    """Process entry point: own one partition's repositories and services and serve
+    (target, method, args) commands from the router one at a time until told to stop.
+    
+    Replies are (True, result) or (False, exception); results and exceptions are pickled.
+    """
+    from ...api.dependencies import build_container
+    container = build_container(config)
+    try:
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                break
+            if message == STOP:
+                break
+            target, method, args = message
+            try:
+                if target not in COMMAND_TARGETS or method.startswith("_"):
+                    raise ValueError(f"Unknown partition command: {target}.{method}")
+                handler = getattr(getattr(container, target), method)
+                result = handler(*args) if callable(handler) else handler
+                reply = (True, result)
+            except Exception as e:
+                reply = (False, e)
+            try:
+                connection.send(reply)
+            except Exception as e:
+                logger.exception("Partition could not send reply to %s.%s", target, method)
+                connection.send((False, RuntimeError(f"Unsendable reply from {target}.{method}: {e}")))
+    finally:
+        container.close()
+        connection.close()
\ No newline at end of file
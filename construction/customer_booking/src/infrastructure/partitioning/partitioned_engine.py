@@ -0,0 +1,68 @@
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Callable, List, Optional
+from .partition_client import PartitionClient
+
+def partition_of(franchise_id: str, partition_count: int) -> int:
+    # crc32 rather than hash(): str hashes are salted per process
+    return zlib.crc32(franchise_id.encode()) % partition_count
+
+class PartitionedEngine:
+    """Fixed set of worker processes, each owning every booking, payment and session
+    of the franchises that hash to it.
+    
+    Commands carrying a franchise id go straight to its partition. Bookings and
+    sessions are found by asking every partition once and remembering the answer;
+    they never move, so remembered routes stay valid.
+    """
+    
+    def __init__(self, config, partition_count: int, max_routes: int = 100_000):
+        self.partition_count = partition_count
+        self.max_routes = max_routes
+        self.clients: List[PartitionClient] = [
+            PartitionClient(index, _partition_config(config, index)) for index in range(partition_count)
+        ]
+        self._routes: "OrderedDict[str, PartitionClient]" = OrderedDict()
+        self._fanout = ThreadPoolExecutor(max_workers=partition_count, thread_name_prefix="partition-fanout")
+    
+    def for_franchise(self, franchise_id: str) -> PartitionClient:
+        return self.clients[partition_of(franchise_id, self.partition_count)]
+    
+    def remember(self, entity_id: str, client: PartitionClient) -> None:
+        self._routes[entity_id] = client
+        if len(self._routes) > self.max_routes:
+            self._routes.popitem(last=False)
+    
+    def locate(self, entity_id: str, target: str) -> Optional[PartitionClient]:
+        """Partition holding the booking or session entity_id, via target.get_by_id"""
+        client = self._routes.get(entity_id)
+        if client is None:
+            found = self.broadcast(target, "get_by_id", entity_id)
+            client = next((self.clients[index] for index, entity in enumerate(found) if entity), None)
+            if client is not None:
+                self.remember(entity_id, client)
+        return client
+    
+    def broadcast(self, target: str, method: str, *args) -> List[Any]:
+        """Call every partition in parallel; results in partition order"""
+        return self.map(lambda client: client.call(target, method, *args))
+    
+    def map(self, call: Callable[[PartitionClient], Any], clients: Optional[List[PartitionClient]] = None) -> List[Any]:
+        return list(self._fanout.map(call, clients if clients is not None else self.clients))
+    
+    def close(self) -> None:
+        for client in self.clients:
+            client.stop()
+        self._fanout.shutdown()
+
+def _partition_config(config, index: int):
+    # Workers are plain in-process deployments; durable event files get one directory/file each
+    return replace(
+        config,
+        partitions=0,
+        seed_demo_data=False,
+        event_store_dir=f"{config.event_store_dir}/partition-{index}" if config.event_store_dir else None,
+        event_queue_file=f"{config.event_queue_file}.partition-{index}" if config.event_queue_file else None
+    )
\ No newline at end of file
@@ -0,0 +1,260 @@
+from collections import defaultdict
+from dataclasses import fields
+from typing import Dict, List, Optional
+from ...domain.entities.booking import Booking
+from ...domain.entities.booking_session import BookingSession
+from ...domain.entities.franchise import Franchise
+from ...domain.services.qr_service import QRScanningService
+from ...application.services.booking_service import BookingResult, NewBooking
+from ...application.services.session_service import ScanResult, SessionScan
+from ...infrastructure.cache.cache_backend import CacheStats
+from ...infrastructure.events.event_publisher import PublisherMetrics
+from .partition_client import PartitionClient
+from .partitioned_engine import PartitionedEngine
+
+class PartitionedBookingService:
+    """BookingApplicationService interface, routed to the partition owning each franchise"""
+    
+    def __init__(self, engine: PartitionedEngine):
+        self.engine = engine
+        self.availability_service = PartitionedAvailabilityService(engine)
+    
+    def create_booking(self, franchise_id: str, *args) -> str:
+        client = self.engine.for_franchise(franchise_id)
+        booking_id = client.call("booking_service", "create_booking", franchise_id, *args)
+        self.engine.remember(booking_id, client)
+        return booking_id
+    
+    def create_bookings(self, batch: List[NewBooking]) -> List[BookingResult]:
+        by_partition: Dict[PartitionClient, List[int]] = defaultdict(list)
+        for index, item in enumerate(batch):
+            by_partition[self.engine.for_franchise(item.franchise_id)].append(index)
+        clients = list(by_partition)
+        replies = self.engine.map(
+            lambda client: client.call("booking_service", "create_bookings", [batch[i] for i in by_partition[client]]),
+            clients)
+        
+        results: List[Optional[BookingResult]] = [None] * len(batch)
+        for client, partition_results in zip(clients, replies):
+            for index, result in zip(by_partition[client], partition_results):
+                results[index] = result
+                if result.booking:
+                    self.engine.remember(result.booking.id, client)
+        return results
+    
+    def process_payment(self, booking_id: str, *args) -> str:
+        return self._booking_partition(booking_id).call("booking_service", "process_payment", booking_id, *args)
+    
+    def cancel_booking(self, booking_id: str, reason: str) -> None:
+        self._booking_partition(booking_id).call("booking_service", "cancel_booking", booking_id, reason)
+    
+    def cancel_bookings(self, booking_ids: List[str], reason: str) -> List[str]:
+        by_partition: Dict[PartitionClient, List[str]] = defaultdict(list)
+        for booking_id in booking_ids:
+            client = self.engine.locate(booking_id, "booking_repo")
+            if client is not None:
+                by_partition[client].append(booking_id)
+        clients = list(by_partition)
+        replies = self.engine.map(
+            lambda client: client.call("booking_service", "cancel_bookings", by_partition[client], reason), clients)
+        return [booking_id for cancelled in replies for booking_id in cancelled]
+    
+    def _booking_partition(self, booking_id: str) -> PartitionClient:
+        client = self.engine.locate(booking_id, "booking_repo")
+        if client is None:
+            raise ValueError("Booking not found")
+        return client
+
+class PartitionedAvailabilityService:
+    def __init__(self, engine: PartitionedEngine):
+        self.engine = engine
+    
+    def check_availability(self, franchise: Franchise, *args) -> bool:
+        return self._call("check_availability", franchise, *args)
+    
+    def check_availability_batch(self, franchise: Franchise, *args) -> List[bool]:
+        return self._call("check_availability_batch", franchise, *args)
+    
+    def get_availability_grid(self, franchise: Franchise, *args):
+        return self._call("get_availability_grid", franchise, *args)
+    
+    def get_hourly_occupancy(self, franchise: Franchise, *args):
+        return self._call("get_hourly_occupancy", franchise, *args)
+    
+    def _call(self, method: str, franchise: Franchise, *args):
+        return self.engine.for_franchise(franchise.id).call("availability_service", method, franchise, *args)
+
+class PartitionedSessionService:
+    """SessionManagementService interface; sessions live with their booking's partition"""
+    
+    def __init__(self, engine: PartitionedEngine):
+        self.engine = engine
+    
+    def start_session(self, qr_data: str, staff_id: str) -> str:
+        booking_id = QRScanningService.scan_qr_code(qr_data)
+        client = self.engine.locate(booking_id, "booking_repo") if booking_id else None
+        if client is None:
+            raise ValueError("Invalid QR code" if not booking_id else "Booking not found")
+        session_id = client.call("session_service", "start_session", qr_data, staff_id)
+        self.engine.remember(session_id, client)
+        return session_id
+    
+    def start_and_check_in_sessions(self, scans: List[SessionScan], staff_id: str) -> List[ScanResult]:
+        results: List[Optional[ScanResult]] = [None] * len(scans)
+        by_partition: Dict[PartitionClient, List[int]] = defaultdict(list)
+        for index, scan in enumerate(scans):
+            booking_id = QRScanningService.scan_qr_code(scan.qr_data)
+            client = self.engine.locate(booking_id, "booking_repo") if booking_id else None
+            if client is None:
+                results[index] = ScanResult(error="Invalid QR code" if not booking_id else "Booking not found")
+            else:
+                by_partition[client].append(index)
+        clients = list(by_partition)
+        replies = self.engine.map(
+            lambda client: client.call("session_service", "start_and_check_in_sessions",
+                                       [scans[i] for i in by_partition[client]], staff_id),
+            clients)
+        
+        for client, partition_results in zip(clients, replies):
+            for index, result in zip(by_partition[client], partition_results):
+                results[index] = result
+                if result.session:
+                    self.engine.remember(result.session.id, client)
+        return results
+    
+    def check_in_child(self, session_id: str, *args) -> None:
+        self._call("check_in_child", session_id, *args)
+    
+    def check_in_child_with_photo(self, session_id: str, *args) -> None:
+        self._call("check_in_child_with_photo", session_id, *args)
+    
+    def apply_overtime_charge(self, session_id: str, *args) -> None:
+        self._call("apply_overtime_charge", session_id, *args)
+    
+    def check_out_child(self, session_id: str, *args) -> None:
+        self._call("check_out_child", session_id, *args)
+    
+    def complete_session(self, session_id: str) -> None:
+        self._call("complete_session", session_id)
+    
+    def _call(self, method: str, session_id: str, *args):
+        client = self.engine.locate(session_id, "session_repo")
+        if client is None:
+            raise ValueError("Session not found")
+        return client.call("session_service", method, session_id, *args)
+
+class PartitionedBookingRepository:
+    def __init__(self, engine: PartitionedEngine):
+        self.engine = engine
+    
+    def save(self, booking: Booking) -> None:
+        client = self.engine.for_franchise(booking.franchise_id)
+        client.call("booking_repo", "save", booking)
+        self.engine.remember(booking.id, client)
+    
+    def get_by_id(self, booking_id: str) -> Optional[Booking]:
+        client = self.engine.locate(booking_id, "booking_repo")
+        return client.call("booking_repo", "get_by_id", booking_id) if client else None
+    
+    def get_by_ids(self, booking_ids: List[str]) -> Dict[str, Booking]:
+        found = {}
+        for bookings in self.engine.broadcast("booking_repo", "get_by_ids", booking_ids):
+            found.update(bookings)
+        return {booking_id: found[booking_id] for booking_id in booking_ids if booking_id in found}
+    
+    def get_by_franchise_and_date(self, franchise_id: str, *args) -> List[Booking]:
+        return self.engine.for_franchise(franchise_id).call("booking_repo", "get_by_franchise_and_date",
+                                                            franchise_id, *args)
+    
+    def find_by_franchise(self, franchise_id: str, *args) -> List[Booking]:
+        return self.engine.for_franchise(franchise_id).call("booking_repo", "find_by_franchise", franchise_id, *args)
+    
+    def get_page_by_franchise(self, franchise_id: str, *args) -> List[Booking]:
+        return self.engine.for_franchise(franchise_id).call("booking_repo", "get_page_by_franchise",
+                                                            franchise_id, *args)
+    
+    def get_all(self) -> List[Booking]:
+        return [booking for bookings in self.engine.broadcast("booking_repo", "get_all") for booking in bookings]
+
+class PartitionedSessionRepository:
+    def __init__(self, engine: PartitionedEngine):
+        self.engine = engine
+    
+    def save(self, session: BookingSession) -> None:
+        client = self.engine.locate(session.booking_id, "booking_repo")
+        if client is None:
+            raise ValueError("Booking not found")
+        client.call("session_repo", "save", session)
+        self.engine.remember(session.id, client)
+    
+    def get_by_id(self, session_id: str) -> Optional[BookingSession]:
+        client = self.engine.locate(session_id, "session_repo")
+        return client.call("session_repo", "get_by_id", session_id) if client else None
+    
+    def get_by_booking_id(self, booking_id: str) -> Optional[BookingSession]:
+        client = self.engine.locate(booking_id, "booking_repo")
+        return client.call("session_repo", "get_by_booking_id", booking_id) if client else None
+    
+    def get_by_status(self, status) -> List[BookingSession]:
+        return [session for sessions in self.engine.broadcast("session_repo", "get_by_status", status)
+                for session in sessions]
+    
+    def get_active_sessions(self) -> List[BookingSession]:
+        return [session for sessions in self.engine.broadcast("session_repo", "get_active_sessions")
+                for session in sessions]
+    
+    def get_active_page(self, after_id: Optional[str], limit: int) -> List[BookingSession]:
+        # Each partition's page is in id order, so the first limit of the merged pages are the global page
+        pages = self.engine.broadcast("session_repo", "get_active_page", after_id, limit)
+        return sorted((session for page in pages for session in page), key=lambda session: session.id)[:limit]
+    
+    def get_all(self) -> List[BookingSession]:
+        return [session for sessions in self.engine.broadcast("session_repo", "get_all") for session in sessions]
+
+class PartitionedFranchiseRepository:
+    """Franchises are reference data: every partition keeps a full copy, and reads are served locally"""
+    
+    def __init__(self, engine: PartitionedEngine, local_repo):
+        self.engine = engine
+        self.local_repo = local_repo
+    
+    def save(self, franchise: Franchise) -> None:
+        self.local_repo.save(franchise)
+        self.engine.broadcast("franchise_repo", "save", franchise)
+    
+    def get_by_id(self, franchise_id: str) -> Optional[Franchise]:
+        return self.local_repo.get_by_id(franchise_id)
+    
+    def get_all_active(self) -> List[Franchise]:
+        return self.local_repo.get_all_active()
+    
+    def get_active_page(self, after_id: Optional[str], limit: int) -> List[Franchise]:
+        return self.local_repo.get_active_page(after_id, limit)
+    
+    def get_all(self) -> List[Franchise]:
+        return self.local_repo.get_all()
+
+class PartitionedEventPublisher:
+    """Events are published inside the partitions; this only sums their counters"""
+    
+    def __init__(self, engine: PartitionedEngine):
+        self.engine = engine
+    
+    @property
+    def metrics(self) -> PublisherMetrics:
+        return _sum_counters(PublisherMetrics(), self.engine.broadcast("event_publisher", "metrics"))
+
+class PartitionedCache:
+    def __init__(self, engine: PartitionedEngine):
+        self.engine = engine
+    
+    @property
+    def stats(self) -> CacheStats:
+        return _sum_counters(CacheStats(), self.engine.broadcast("cache", "stats"))
+
+def _sum_counters(total, parts):
+    for part in parts:
+        for field in fields(total):
+            combine = max if field.name.startswith("max_") else int.__add__
+            setattr(total, field.name, combine(getattr(total, field.name), getattr(part, field.name)))
+    return total
\ No newline at end of file
@@ -0,0 +1,23 @@
+from typing import Dict, List, Optional
+from ...domain.entities.booking_aggregate import BookingAggregate
+from .booking_repository import BookingRepository
+from .payment_repository import PaymentRepository
+
+class BookingAggregateLoader:
+    """Rehydrates BookingAggregates with their payments from the indexed repositories"""
+    
+    def __init__(self, booking_repo: BookingRepository, payment_repo: PaymentRepository):
+        self.booking_repo = booking_repo
+        self.payment_repo = payment_repo
+    
+    def load(self, booking_id: str) -> Optional[BookingAggregate]:
+        booking = self.booking_repo.get_by_id(booking_id)
+        if not booking:
+            return None
+        return BookingAggregate(booking, self.payment_repo.get_by_booking_id(booking_id))
+    
+    def load_many(self, booking_ids: List[str]) -> Dict[str, BookingAggregate]:
+        bookings = self.booking_repo.get_by_ids(booking_ids)
+        payments = self.payment_repo.get_by_booking_ids(list(bookings))
+        return {booking_id: BookingAggregate(booking, payments[booking_id])
+                for booking_id, booking in bookings.items()}
\ No newline at end of file
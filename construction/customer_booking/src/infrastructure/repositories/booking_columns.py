@@ -0,0 +1,90 @@
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from ...domain.entities.booking import Booking, BookingStatus, PaymentStatus
+from ...domain.services.occupancy_timeline import epoch_seconds, wall_clock
+
+BOOKING_STATUS_CODES = {status: code for code, status in enumerate(BookingStatus)}
+PAYMENT_STATUS_CODES = {status: code for code, status in enumerate(PaymentStatus)}
+
+class BookingColumns:
+    """Columnar NumPy mirror of the booking store: one growable array per scanned field.
+    
+    Rows are appended on first save and patched in place on later saves, so
+    status changes are reflected without moving anything. Scans are boolean
+    masks over the arrays; only matching rows are mapped back to booking ids.
+    Times are stored and compared as wall-clock seconds, offsets dropped.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._franchise_codes: Dict[str, int] = {}
+        self.start = np.zeros(capacity, dtype=np.int64)  # epoch seconds
+        self.end = np.zeros(capacity, dtype=np.int64)
+        self.franchise = np.zeros(capacity, dtype=np.int32)
+        self.booking_status = np.zeros(capacity, dtype=np.int8)
+        self.payment_status = np.zeros(capacity, dtype=np.int8)
+        self.amount_cents = np.zeros(capacity, dtype=np.int64)
+        # Saves for different franchise days can run concurrently; rows are shared
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def upsert(self, booking: Booking) -> None:
+        with self._lock:
+            row = self._rows.get(booking.id)
+            if row is None:
+                row = len(self._ids)
+                if row == len(self.start):
+                    self._grow()
+                self._ids.append(booking.id)
+                self._rows[booking.id] = row
+            franchise_code = self._franchise_codes.setdefault(booking.franchise_id, len(self._franchise_codes))
+            self.start[row] = epoch_seconds(wall_clock(booking.start_datetime))
+            self.end[row] = epoch_seconds(wall_clock(booking.end_datetime))
+            self.franchise[row] = franchise_code
+            self.booking_status[row] = BOOKING_STATUS_CODES[booking.booking_status]
+            self.payment_status[row] = PAYMENT_STATUS_CODES[booking.payment_status]
+            self.amount_cents[row] = int((booking.total_amount.amount * 100).to_integral_value())
+    
+    def rows_starting_between(self, franchise_id: str, start_from: datetime, start_to: datetime,
+                              status: Optional[BookingStatus] = None) -> np.ndarray:
+        """Rows of the franchise's bookings starting in [start_from, start_to), ordered by start"""
+        size = len(self._ids)
+        franchise_code = self._franchise_codes.get(franchise_id)
+        if franchise_code is None:
+            return np.empty(0, dtype=np.int64)
+        start = self.start[:size]
+        mask = self.franchise[:size] == franchise_code
+        mask &= (start >= epoch_seconds(wall_clock(start_from))) & (start < epoch_seconds(wall_clock(start_to)))
+        if status is not None:
+            mask &= self.booking_status[:size] == BOOKING_STATUS_CODES[status]
+        rows = np.flatnonzero(mask)
+        return rows[np.argsort(start[rows], kind="stable")]
+    
+    def active_spans(self, franchise_id: str, window_start: datetime,
+                     window_end: datetime) -> Tuple[np.ndarray, np.ndarray]:
+        """Start/end epoch seconds of non-cancelled bookings overlapping [window_start, window_end)"""
+        size = len(self._ids)
+        franchise_code = self._franchise_codes.get(franchise_id)
+        if franchise_code is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        start, end = self.start[:size], self.end[:size]
+        mask = self.franchise[:size] == franchise_code
+        mask &= self.booking_status[:size] != BOOKING_STATUS_CODES[BookingStatus.CANCELLED]
+        mask &= (start < epoch_seconds(wall_clock(window_end))) & (end > epoch_seconds(wall_clock(window_start)))
+        return start[mask], end[mask]
+    
+    def ids(self, rows: np.ndarray) -> List[str]:
+        return [self._ids[row] for row in rows.tolist()]
+    
+    def _grow(self) -> None:
+        capacity = 2 * len(self.start)
+        for name in ("start", "end", "franchise", "booking_status", "payment_status", "amount_cents"):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
\ No newline at end of file
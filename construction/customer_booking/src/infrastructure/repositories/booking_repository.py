@@ -1,20 +1,151 @@
-from typing import Dict, List, Optional
-from datetime import date
-from ...domain.entities.booking import Booking
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from ...domain.entities.booking import Booking, BookingStatus
+from ...domain.services.occupancy_timeline import OccupancyTimeline, epoch_seconds, split_by_day, wall_clock
 
 class BookingRepository:
-    def __init__(self):
+    def __init__(self, columnar: bool = False):
         self._bookings: Dict[str, Booking] = {}
+        # (franchise_id, day) -> bookings starting that day, keyed by booking id
+        self._by_franchise_day: Dict[Tuple[str, date], Dict[str, Booking]] = {}
+        self._index_keys: Dict[str, Tuple[str, date]] = {}
+        # franchise_id -> sorted days that have a _by_franchise_day bucket, so range scans skip empty days
+        self._days_by_franchise: Dict[str, List[date]] = {}
+        # (franchise_id, day) -> minute spans of non-cancelled bookings present that day
+        self._spans_by_day: Dict[Tuple[str, date], Dict[str, Tuple[int, int]]] = {}
+        # per-minute occupancy, built from _spans_by_day on first read and kept up to date after
+        self._occupancy: Dict[Tuple[str, date], OccupancyTimeline] = {}
+        self._occupancy_spans: Dict[str, Tuple[Tuple[Tuple[str, date], int, int], ...]] = {}
+        # Optional NumPy column mirror for vectorized scans
+        self.columns = None
+        if columnar:
+            from .booking_columns import BookingColumns
+            self.columns = BookingColumns()
     
     def save(self, booking: Booking) -> None:
         self._bookings[booking.id] = booking
+        self._index(booking)
+        self._update_occupancy(booking)
+        if self.columns is not None:
+            self.columns.upsert(booking)
+    
+    def save_all(self, bookings: List[Booking]) -> None:
+        for booking in bookings:
+            self.save(booking)
     
     def get_by_id(self, booking_id: str) -> Optional[Booking]:
         return self._bookings.get(booking_id)
     
+    def get_by_ids(self, booking_ids: List[str]) -> Dict[str, Booking]:
+        return {booking_id: self._bookings[booking_id] for booking_id in booking_ids if booking_id in self._bookings}
+    
     def get_by_franchise_and_date(self, franchise_id: str, booking_date: date) -> List[Booking]:
-        return [b for b in self._bookings.values() 
-                if b.franchise_id == franchise_id and b.start_datetime.date() == booking_date]
+        return list(self._by_franchise_day.get((franchise_id, booking_date), {}).values())
+    
+    def get_occupancy(self, franchise_id: str, day: date) -> Optional[OccupancyTimeline]:
+        key = (franchise_id, day)
+        timeline = self._occupancy.get(key)
+        if timeline is None and self._spans_by_day.get(key):
+            timeline = self._occupancy[key] = OccupancyTimeline.from_spans(self._spans_by_day[key].values())
+        return timeline
+    
+    def find_by_franchise(self, franchise_id: str, start_from: datetime, start_to: datetime,
+                          status: Optional[BookingStatus] = None) -> List[Booking]:
+        """Bookings starting in [start_from, start_to), ordered by start time"""
+        if self.columns is not None:
+            rows = self.columns.rows_starting_between(franchise_id, start_from, start_to, status)
+            return [self._bookings[booking_id] for booking_id in self.columns.ids(rows)]
+        bookings = []
+        for day in self._days_between(franchise_id, start_from.date(), start_to.date()):
+            for booking in self._by_franchise_day[(franchise_id, day)].values():
+                if (start_from <= wall_clock(booking.start_datetime) < start_to
+                        and status in (None, booking.booking_status)):
+                    bookings.append(booking)
+        return sorted(bookings, key=lambda booking: wall_clock(booking.start_datetime))
+    
+    def get_page_by_franchise(self, franchise_id: str, start_from: datetime, start_to: datetime,
+                              status: Optional[BookingStatus] = None, after: Optional[Tuple[datetime, str]] = None,
+                              limit: int = 100) -> List[Booking]:
+        """Up to limit bookings starting in [start_from, start_to), in (start_datetime, id) order,
+        after the key of the previous page's last booking; stops reading days once the page is full.
+        Start times are compared as wall-clock time, the order of the day index."""
+        if after is not None:
+            after = (wall_clock(after[0]), after[1])
+            start_from = max(start_from, after[0])
+        
+        def key(booking: Booking) -> Tuple[datetime, str]:
+            return wall_clock(booking.start_datetime), booking.id
+        
+        page = []
+        for day in self._days_between(franchise_id, start_from.date(), start_to.date()):
+            matches = sorted((booking for booking in self._by_franchise_day[(franchise_id, day)].values()
+                              if start_from <= key(booking)[0] < start_to
+                              and status in (None, booking.booking_status)
+                              and (after is None or key(booking) > after)),
+                             key=key)
+            page.extend(matches[:limit - len(page)])
+            if len(page) >= limit:
+                break
+        return page
+    
+    def get_active_spans(self, franchise_id: str, window_start: datetime, window_end: datetime):
+        """Start/end epoch seconds (NumPy arrays) of non-cancelled bookings overlapping the window"""
+        if self.columns is not None:
+            return self.columns.active_spans(franchise_id, window_start, window_end)
+        import numpy as np
+        starts, ends = [], []
+        # Include the previous day so bookings running past midnight are counted
+        for day in self._days_between(franchise_id, window_start.date() - timedelta(days=1), window_end.date()):
+            for booking in self._by_franchise_day[(franchise_id, day)].values():
+                start, end = wall_clock(booking.start_datetime), wall_clock(booking.end_datetime)
+                if booking.booking_status != BookingStatus.CANCELLED and start < window_end and end > window_start:
+                    starts.append(epoch_seconds(start))
+                    ends.append(epoch_seconds(end))
+        return np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
     
     def get_all(self) -> List[Booking]:
-        return list(self._bookings.values())
\ No newline at end of file
+        return list(self._bookings.values())
+    
+    def _index(self, booking: Booking) -> None:
+        key = (booking.franchise_id, booking.start_datetime.date())
+        previous_key = self._index_keys.get(booking.id)
+        if previous_key is not None and previous_key != key:
+            bucket = self._by_franchise_day[previous_key]
+            bucket.pop(booking.id, None)
+            if not bucket:
+                del self._by_franchise_day[previous_key]
+                days = self._days_by_franchise[previous_key[0]]
+                del days[bisect_left(days, previous_key[1])]
+        if key not in self._by_franchise_day:
+            self._by_franchise_day[key] = {}
+            insort(self._days_by_franchise.setdefault(key[0], []), key[1])
+        self._by_franchise_day[key][booking.id] = booking
+        self._index_keys[booking.id] = key
+    
+    def _days_between(self, franchise_id: str, first: date, last: date) -> List[date]:
+        """Days from first to last, inclusive, on which the franchise has bookings"""
+        days = self._days_by_franchise.get(franchise_id, [])
+        return days[bisect_left(days, first):bisect_right(days, last)]
+    
+    def _update_occupancy(self, booking: Booking) -> None:
+        spans = ()
+        if booking.booking_status != BookingStatus.CANCELLED:
+            spans = tuple(((booking.franchise_id, day), start_minute, end_minute)
+                          for day, start_minute, end_minute
+                          in split_by_day(booking.start_datetime, booking.end_datetime))
+        previous_spans = self._occupancy_spans.get(booking.id, ())
+        if spans == previous_spans:
+            return
+        for key, start_minute, end_minute in previous_spans:
+            day_spans = self._spans_by_day[key]
+            del day_spans[booking.id]
+            if not day_spans:
+                del self._spans_by_day[key]
+            if key in self._occupancy:
+                self._occupancy[key].remove(start_minute, end_minute)
+        for key, start_minute, end_minute in spans:
+            self._spans_by_day.setdefault(key, {})[booking.id] = (start_minute, end_minute)
+            if key in self._occupancy:
+                self._occupancy[key].add(start_minute, end_minute)
+        self._occupancy_spans[booking.id] = spans
\ No newline at end of file
@@ -0,0 +1,32 @@
+from typing import List, Optional
+from ...domain.entities.franchise import Franchise
+from ..cache.cache_backend import CacheBackend
+from ..cache.cache_tags import FRANCHISE_LIST_TAG, franchise_tag
+
+class CachedFranchiseRepository:
+    """Cache-aside wrapper for any franchise repository; save() drops the franchise's entries,
+    including cached availability and pricing derived from it"""
+    
+    def __init__(self, repository, cache: CacheBackend, ttl: float = 24 * 3600):
+        self.repository = repository
+        self.cache = cache
+        self.ttl = ttl
+    
+    def save(self, franchise: Franchise) -> None:
+        self.repository.save(franchise)
+        self.cache.invalidate_tags([franchise_tag(franchise.id), FRANCHISE_LIST_TAG])
+    
+    def get_by_id(self, franchise_id: str) -> Optional[Franchise]:
+        return self.cache.get_or_load(("franchise", franchise_id),
+                                      lambda: self.repository.get_by_id(franchise_id),
+                                      self.ttl, [franchise_tag(franchise_id)])
+    
+    def get_all_active(self) -> List[Franchise]:
+        return list(self.cache.get_or_load(("franchises", "active"), self.repository.get_all_active,
+                                           self.ttl, [FRANCHISE_LIST_TAG]))
+    
+    def get_active_page(self, after_id: Optional[str], limit: int) -> List[Franchise]:
+        return self.repository.get_active_page(after_id, limit)
+    
+    def get_all(self) -> List[Franchise]:
+        return self.repository.get_all()
\ No newline at end of file
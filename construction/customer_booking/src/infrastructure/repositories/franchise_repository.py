@@ -1,15 +1,34 @@
+from bisect import bisect_right, insort
 from typing import Dict, List, Optional
 from ...domain.entities.franchise import Franchise
 
 class FranchiseRepository:
     def __init__(self):
         self._franchises: Dict[str, Franchise] = {}
+        self._sorted_ids: List[str] = []  # keyset order for paging
     
     def save(self, franchise: Franchise) -> None:
+        franchise.compile_schedule()
+        if franchise.id not in self._franchises:
+            insort(self._sorted_ids, franchise.id)
         self._franchises[franchise.id] = franchise
     
     def get_by_id(self, franchise_id: str) -> Optional[Franchise]:
         return self._franchises.get(franchise_id)
     
     def get_all_active(self) -> List[Franchise]:
-        return [f for f in self._franchises.values() if f.is_active]
\ No newline at end of file
+        return [f for f in self._franchises.values() if f.is_active]
+    
+    def get_active_page(self, after_id: Optional[str], limit: int) -> List[Franchise]:
+        """Up to limit active franchises with ids after after_id, in id order"""
+        page = []
+        position = bisect_right(self._sorted_ids, after_id) if after_id else 0
+        while position < len(self._sorted_ids) and len(page) < limit:
+            franchise = self._franchises[self._sorted_ids[position]]
+            if franchise.is_active:
+                page.append(franchise)
+            position += 1
+        return page
+    
+    def get_all(self) -> List[Franchise]:
+        return list(self._franchises.values())
\ No newline at end of file
@@ -4,12 +4,23 @@ from ...domain.entities.payment import Payment
 class PaymentRepository:
     def __init__(self):
         self._payments: Dict[str, Payment] = {}
+        self._by_booking: Dict[str, Dict[str, Payment]] = {}
     
     def save(self, payment: Payment) -> None:
+        previous = self._payments.get(payment.id)
+        if previous is not None and previous.booking_id != payment.booking_id:
+            self._by_booking[previous.booking_id].pop(payment.id, None)
         self._payments[payment.id] = payment
+        self._by_booking.setdefault(payment.booking_id, {})[payment.id] = payment
     
     def get_by_id(self, payment_id: str) -> Optional[Payment]:
         return self._payments.get(payment_id)
     
     def get_by_booking_id(self, booking_id: str) -> List[Payment]:
-        return [p for p in self._payments.values() if p.booking_id == booking_id]
\ No newline at end of file
+        return list(self._by_booking.get(booking_id, {}).values())
+    
+    def get_all(self) -> List[Payment]:
+        return list(self._payments.values())
+    
+    def get_by_booking_ids(self, booking_ids: List[str]) -> Dict[str, List[Payment]]:
+        return {booking_id: self.get_by_booking_id(booking_id) for booking_id in booking_ids}
\ No newline at end of file
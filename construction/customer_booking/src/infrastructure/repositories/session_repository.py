@@ -1,22 +1,54 @@
+from bisect import bisect_left, bisect_right, insort
 from typing import Dict, List, Optional
-from ...domain.entities.booking_session import BookingSession
+from ...domain.entities.booking_session import BookingSession, SessionStatus
+
+ACTIVE_STATUSES = (SessionStatus.STARTED, SessionStatus.CHECKED_IN)
 
 class BookingSessionRepository:
     def __init__(self):
         self._sessions: Dict[str, BookingSession] = {}
+        self._by_booking: Dict[str, BookingSession] = {}
+        # status -> sessions currently in it; _statuses remembers where each session is filed
+        self._by_status: Dict[SessionStatus, Dict[str, BookingSession]] = {status: {} for status in SessionStatus}
+        self._statuses: Dict[str, SessionStatus] = {}
+        self._sorted_active_ids: List[str] = []  # keyset order for paging
     
     def save(self, session: BookingSession) -> None:
         self._sessions[session.id] = session
+        self._by_booking.setdefault(session.booking_id, session)
+        
+        previous_status = self._statuses.get(session.id)
+        if previous_status != session.session_status:
+            if previous_status is not None:
+                self._by_status[previous_status].pop(session.id, None)
+            self._by_status[session.session_status][session.id] = session
+            self._statuses[session.id] = session.session_status
+            was_active, is_active = previous_status in ACTIVE_STATUSES, session.session_status in ACTIVE_STATUSES
+            if is_active and not was_active:
+                insort(self._sorted_active_ids, session.id)
+            elif was_active and not is_active:
+                del self._sorted_active_ids[bisect_left(self._sorted_active_ids, session.id)]
+    
+    def save_all(self, sessions: List[BookingSession]) -> None:
+        for session in sessions:
+            self.save(session)
     
     def get_by_id(self, session_id: str) -> Optional[BookingSession]:
         return self._sessions.get(session_id)
     
     def get_by_booking_id(self, booking_id: str) -> Optional[BookingSession]:
-        for session in self._sessions.values():
-            if session.booking_id == booking_id:
-                return session
-        return None
+        return self._by_booking.get(booking_id)
+    
+    def get_by_status(self, status: SessionStatus) -> List[BookingSession]:
+        return list(self._by_status[status].values())
     
     def get_active_sessions(self) -> List[BookingSession]:
-        return [s for s in self._sessions.values() 
-                if s.session_status.value in ["STARTED", "CHECKED_IN"]]
\ No newline at end of file
+        return [s for status in ACTIVE_STATUSES for s in self._by_status[status].values()]
+    
+    def get_active_page(self, after_id: Optional[str], limit: int) -> List[BookingSession]:
+        """Up to limit active sessions with ids after after_id, in id order"""
+        position = bisect_right(self._sorted_active_ids, after_id) if after_id else 0
+        return [self._sessions[session_id] for session_id in self._sorted_active_ids[position:position + limit]]
+    
+    def get_all(self) -> List[BookingSession]:
+        return list(self._sessions.values())
\ No newline at end of file
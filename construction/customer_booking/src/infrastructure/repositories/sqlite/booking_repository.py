@@ -0,0 +1,184 @@
+import sqlite3
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from ....domain.entities.booking import Booking, BookingStatus, PaymentStatus
+from ....domain.value_objects.money import Money
+from ....domain.value_objects.customer_info import CustomerInfo
+from ....domain.value_objects.child_info import ChildInfo
+from ....domain.services.occupancy_timeline import OccupancyTimeline, epoch_seconds, split_by_day, wall_clock
+from .connection_pool import SQLiteConnectionPool, select_in
+
+UPSERT_BOOKING = """
+INSERT INTO bookings (
+    id, franchise_id, booking_day, start_datetime, end_datetime, booking_status, payment_status,
+    total_amount, currency, reference_number, qr_code_url, customer_name, customer_email,
+    customer_phone, emergency_contact, child_name, child_age, special_needs, allergies,
+    pickup_authorization, special_instructions
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    franchise_id = excluded.franchise_id,
+    booking_day = excluded.booking_day,
+    start_datetime = excluded.start_datetime,
+    end_datetime = excluded.end_datetime,
+    booking_status = excluded.booking_status,
+    payment_status = excluded.payment_status,
+    total_amount = excluded.total_amount,
+    currency = excluded.currency,
+    qr_code_url = excluded.qr_code_url
+"""
+SELECT_BY_ID = "SELECT * FROM bookings WHERE id = ?"
+SELECT_BY_IDS = "SELECT * FROM bookings WHERE id IN ({})"
+SELECT_BY_FRANCHISE_DAY = "SELECT * FROM bookings WHERE franchise_id = ? AND booking_day = ? ORDER BY rowid"
+SELECT_SPANS = """
+SELECT start_datetime, end_datetime FROM bookings
+WHERE franchise_id = ? AND booking_day BETWEEN ? AND ? AND booking_status != 'CANCELLED'
+"""
+SELECT_STARTING_BETWEEN = """
+SELECT * FROM bookings
+WHERE franchise_id = ? AND start_datetime >= ? AND start_datetime < ?
+ORDER BY start_datetime
+"""
+SELECT_STARTING_BETWEEN_WITH_STATUS = """
+SELECT * FROM bookings
+WHERE franchise_id = ? AND start_datetime >= ? AND start_datetime < ? AND booking_status = ?
+ORDER BY start_datetime
+"""
+# Keyset pages: rows after the (start_datetime, id) of the previous page's last row
+SELECT_PAGE_STARTING_BETWEEN = """
+SELECT * FROM bookings
+WHERE franchise_id = ? AND start_datetime >= ? AND start_datetime < ? AND (start_datetime, id) > (?, ?)
+ORDER BY start_datetime, id LIMIT ?
+"""
+SELECT_PAGE_STARTING_BETWEEN_WITH_STATUS = """
+SELECT * FROM bookings
+WHERE franchise_id = ? AND start_datetime >= ? AND start_datetime < ? AND (start_datetime, id) > (?, ?)
+AND booking_status = ?
+ORDER BY start_datetime, id LIMIT ?
+"""
+# Bookings overlapping a window; the day-before bound keeps the range scan on the start index short
+SELECT_OVERLAPPING_SPANS = """
+SELECT start_datetime, end_datetime FROM bookings
+WHERE franchise_id = ? AND start_datetime >= ? AND start_datetime < ? AND end_datetime > ?
+AND booking_status != 'CANCELLED'
+"""
+SELECT_ALL = "SELECT * FROM bookings ORDER BY rowid"
+
+class SQLiteBookingRepository:
+    def __init__(self, pool: SQLiteConnectionPool):
+        self.pool = pool
+    
+    def save(self, booking: Booking) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(UPSERT_BOOKING, _to_row(booking))
+    
+    def save_all(self, bookings: List[Booking]) -> None:
+        with self.pool.connection() as conn:
+            conn.executemany(UPSERT_BOOKING, [_to_row(booking) for booking in bookings])
+    
+    def get_by_id(self, booking_id: str) -> Optional[Booking]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_BY_ID, (booking_id,)).fetchone()
+        return _from_row(row) if row else None
+    
+    def get_by_ids(self, booking_ids: List[str]) -> Dict[str, Booking]:
+        with self.pool.connection() as conn:
+            rows = select_in(conn, SELECT_BY_IDS, list(dict.fromkeys(booking_ids)))
+        return {row["id"]: _from_row(row) for row in rows}
+    
+    def get_by_franchise_and_date(self, franchise_id: str, booking_date: date) -> List[Booking]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_BY_FRANCHISE_DAY, (franchise_id, booking_date.isoformat())).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_occupancy(self, franchise_id: str, day: date) -> Optional[OccupancyTimeline]:
+        # Include the previous day so bookings running past midnight are counted
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_SPANS, (franchise_id, (day - timedelta(days=1)).isoformat(),
+                                               day.isoformat())).fetchall()
+        timeline = None
+        for row in rows:
+            for span_day, start_minute, end_minute in split_by_day(datetime.fromisoformat(row[0]),
+                                                                   datetime.fromisoformat(row[1])):
+                if span_day == day:
+                    timeline = timeline or OccupancyTimeline()
+                    timeline.add(start_minute, end_minute)
+        return timeline
+    
+    def find_by_franchise(self, franchise_id: str, start_from: datetime, start_to: datetime,
+                          status: Optional[BookingStatus] = None) -> List[Booking]:
+        with self.pool.connection() as conn:
+            if status is None:
+                rows = conn.execute(SELECT_STARTING_BETWEEN, (franchise_id, start_from.isoformat(),
+                                                              start_to.isoformat())).fetchall()
+            else:
+                rows = conn.execute(SELECT_STARTING_BETWEEN_WITH_STATUS, (franchise_id, start_from.isoformat(),
+                                                                          start_to.isoformat(), status.value)).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_page_by_franchise(self, franchise_id: str, start_from: datetime, start_to: datetime,
+                              status: Optional[BookingStatus] = None, after: Optional[Tuple[datetime, str]] = None,
+                              limit: int = 100) -> List[Booking]:
+        after_start, after_id = (after[0].isoformat(), after[1]) if after else ("", "")
+        params = [franchise_id, start_from.isoformat(), start_to.isoformat(), after_start, after_id]
+        with self.pool.connection() as conn:
+            if status is None:
+                rows = conn.execute(SELECT_PAGE_STARTING_BETWEEN, (*params, limit)).fetchall()
+            else:
+                rows = conn.execute(SELECT_PAGE_STARTING_BETWEEN_WITH_STATUS, (*params, status.value, limit)).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_active_spans(self, franchise_id: str, window_start: datetime, window_end: datetime):
+        import numpy as np
+        earliest_start = datetime.combine(window_start.date() - timedelta(days=1), datetime.min.time())
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_OVERLAPPING_SPANS, (franchise_id, earliest_start.isoformat(),
+                                                           window_end.isoformat(), window_start.isoformat())).fetchall()
+        starts = [epoch_seconds(wall_clock(datetime.fromisoformat(row[0]))) for row in rows]
+        ends = [epoch_seconds(wall_clock(datetime.fromisoformat(row[1]))) for row in rows]
+        return np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
+    
+    def get_all(self) -> List[Booking]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ALL).fetchall()
+        return [_from_row(row) for row in rows]
+
+def _to_row(booking: Booking) -> tuple:
+    customer, child = booking.customer_info, booking.child_info
+    return (
+        booking.id, booking.franchise_id, booking.start_datetime.date().isoformat(),
+        booking.start_datetime.isoformat(), booking.end_datetime.isoformat(),
+        booking.booking_status.value, booking.payment_status.value,
+        str(booking.total_amount.amount), booking.total_amount.currency,
+        booking.reference_number, booking.qr_code_url,
+        customer.name, customer.email, customer.phone, customer.emergency_contact,
+        child.name, child.age, child.special_needs, child.allergies,
+        child.pickup_authorization, child.special_instructions
+    )
+
+def _from_row(row: sqlite3.Row) -> Booking:
+    return Booking(
+        franchise_id=row["franchise_id"],
+        start_datetime=datetime.fromisoformat(row["start_datetime"]),
+        end_datetime=datetime.fromisoformat(row["end_datetime"]),
+        customer_info=CustomerInfo(
+            name=row["customer_name"],
+            email=row["customer_email"],
+            phone=row["customer_phone"],
+            emergency_contact=row["emergency_contact"]
+        ),
+        child_info=ChildInfo(
+            name=row["child_name"],
+            age=row["child_age"],
+            special_needs=row["special_needs"],
+            allergies=row["allergies"],
+            pickup_authorization=row["pickup_authorization"],
+            special_instructions=row["special_instructions"]
+        ),
+        total_amount=Money(amount=Decimal(row["total_amount"]), currency=row["currency"]),
+        id=row["id"],
+        reference_number=row["reference_number"],
+        booking_status=BookingStatus(row["booking_status"]),
+        payment_status=PaymentStatus(row["payment_status"]),
+        qr_code_url=row["qr_code_url"]
+    )
\ No newline at end of file
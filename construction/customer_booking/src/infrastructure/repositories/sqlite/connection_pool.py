@@ -0,0 +1,68 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from queue import LifoQueue, Empty
+from typing import Iterator, List, Sequence
+
+# Under SQLITE_MAX_VARIABLE_NUMBER, which is 999 in SQLite builds before 3.32
+MAX_IN_PARAMETERS = 900
+
+class SQLiteConnectionPool:
+    """Small fixed-size pool of WAL-mode connections to one SQLite database file.
+    
+    Statements are plain module-level SQL strings, so each pooled connection's
+    statement cache keeps them prepared across calls.
+    """
+    
+    def __init__(self, path: str, size: int = 5, timeout: float = 5.0):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._idle: LifoQueue = LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection; the block runs as one transaction, committed on success"""
+        conn = self._acquire()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._idle.put(conn)
+    
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                break
+    
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return self._connect()
+        return self._idle.get(timeout=self.timeout)
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+        return conn
+
+def select_in(conn: sqlite3.Connection, query: str, values: Sequence) -> List[sqlite3.Row]:
+    """Rows of query for all values, where query has one "IN ({})" placeholder for them.
+    Runs one statement per MAX_IN_PARAMETERS values instead of one per value."""
+    rows = []
+    for offset in range(0, len(values), MAX_IN_PARAMETERS):
+        chunk = values[offset:offset + MAX_IN_PARAMETERS]
+        rows.extend(conn.execute(query.format(", ".join("?" * len(chunk))), chunk).fetchall())
+    return rows
\ No newline at end of file
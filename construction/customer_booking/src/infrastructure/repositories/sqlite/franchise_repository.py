@@ -0,0 +1,81 @@
+import json
+import sqlite3
+from decimal import Decimal
+from typing import List, Optional
+from ....domain.entities.franchise import Franchise
+from .connection_pool import SQLiteConnectionPool
+
+UPSERT_FRANCHISE = """
+INSERT INTO franchises (
+    id, name, address, city, postal_code, max_capacity, standard_rate, peak_hour_rate,
+    open_time, close_time, operating_days, is_active
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    name = excluded.name,
+    address = excluded.address,
+    city = excluded.city,
+    postal_code = excluded.postal_code,
+    max_capacity = excluded.max_capacity,
+    standard_rate = excluded.standard_rate,
+    peak_hour_rate = excluded.peak_hour_rate,
+    open_time = excluded.open_time,
+    close_time = excluded.close_time,
+    operating_days = excluded.operating_days,
+    is_active = excluded.is_active
+"""
+SELECT_BY_ID = "SELECT * FROM franchises WHERE id = ?"
+SELECT_ACTIVE = "SELECT * FROM franchises WHERE is_active = 1 ORDER BY rowid"
+SELECT_ACTIVE_PAGE = "SELECT * FROM franchises WHERE is_active = 1 AND id > ? ORDER BY id LIMIT ?"
+SELECT_ALL = "SELECT * FROM franchises ORDER BY rowid"
+
+class SQLiteFranchiseRepository:
+    def __init__(self, pool: SQLiteConnectionPool):
+        self.pool = pool
+    
+    def save(self, franchise: Franchise) -> None:
+        franchise.compile_schedule()
+        with self.pool.connection() as conn:
+            conn.execute(UPSERT_FRANCHISE, (
+                franchise.id, franchise.name, franchise.address, franchise.city, franchise.postal_code,
+                franchise.max_capacity, str(franchise.standard_rate), str(franchise.peak_hour_rate),
+                franchise.open_time, franchise.close_time, json.dumps(franchise.operating_days),
+                int(franchise.is_active)
+            ))
+    
+    def get_by_id(self, franchise_id: str) -> Optional[Franchise]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_BY_ID, (franchise_id,)).fetchone()
+        return _from_row(row) if row else None
+    
+    def get_all_active(self) -> List[Franchise]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ACTIVE).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_active_page(self, after_id: Optional[str], limit: int) -> List[Franchise]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ACTIVE_PAGE, (after_id or "", limit)).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_all(self) -> List[Franchise]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ALL).fetchall()
+        return [_from_row(row) for row in rows]
+
+def _from_row(row: sqlite3.Row) -> Franchise:
+    franchise = Franchise(
+        name=row["name"],
+        address=row["address"],
+        city=row["city"],
+        postal_code=row["postal_code"],
+        max_capacity=row["max_capacity"],
+        standard_rate=Decimal(row["standard_rate"]),
+        peak_hour_rate=Decimal(row["peak_hour_rate"]),
+        open_time=row["open_time"],
+        close_time=row["close_time"],
+        operating_days=json.loads(row["operating_days"]),
+        id=row["id"],
+        is_active=bool(row["is_active"])
+    )
+    franchise.compile_schedule()
+    return franchise
\ No newline at end of file
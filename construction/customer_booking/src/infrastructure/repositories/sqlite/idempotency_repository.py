@@ -0,0 +1,34 @@
+import json
+from typing import Optional
+from ...idempotency.idempotency_store import StoredResponse
+from .connection_pool import SQLiteConnectionPool
+
+UPSERT_KEY = """
+INSERT INTO idempotency_keys (key, fingerprint, status_code, body, expires_at) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    fingerprint = excluded.fingerprint,
+    status_code = excluded.status_code,
+    body = excluded.body,
+    expires_at = excluded.expires_at
+"""
+SELECT_LIVE_KEY = "SELECT * FROM idempotency_keys WHERE key = ? AND expires_at > ?"
+DELETE_EXPIRED = "DELETE FROM idempotency_keys WHERE expires_at <= ?"
+
+class SQLiteIdempotencyRepository:
+    """Durable copy of IdempotencyStore's responses; expired keys are purged as new ones are saved"""
+    
+    def __init__(self, pool: SQLiteConnectionPool):
+        self.pool = pool
+    
+    def get(self, key: str, now: float) -> Optional[StoredResponse]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_LIVE_KEY, (key, now)).fetchone()
+        if not row:
+            return None
+        return StoredResponse(row["fingerprint"], row["status_code"], json.loads(row["body"]), row["expires_at"])
+    
+    def save(self, key: str, stored: StoredResponse, now: float) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(DELETE_EXPIRED, (now,))
+            conn.execute(UPSERT_KEY, (key, stored.fingerprint, stored.status_code, json.dumps(stored.body),
+                                      stored.expires_at))
\ No newline at end of file
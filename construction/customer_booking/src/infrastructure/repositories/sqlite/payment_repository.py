@@ -0,0 +1,71 @@
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+from ....domain.entities.payment import Payment, PaymentMethod, PaymentStatus
+from ....domain.value_objects.money import Money
+from .connection_pool import SQLiteConnectionPool, select_in
+
+UPSERT_PAYMENT = """
+INSERT INTO payments (
+    id, booking_id, amount, currency, payment_method, stripe_payment_id, payment_status, processed_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    booking_id = excluded.booking_id,
+    amount = excluded.amount,
+    currency = excluded.currency,
+    payment_method = excluded.payment_method,
+    stripe_payment_id = excluded.stripe_payment_id,
+    payment_status = excluded.payment_status,
+    processed_at = excluded.processed_at
+"""
+SELECT_BY_ID = "SELECT * FROM payments WHERE id = ?"
+SELECT_BY_BOOKING = "SELECT * FROM payments WHERE booking_id = ? ORDER BY rowid"
+SELECT_BY_BOOKINGS = "SELECT * FROM payments WHERE booking_id IN ({}) ORDER BY rowid"
+SELECT_ALL = "SELECT * FROM payments ORDER BY rowid"
+
+class SQLitePaymentRepository:
+    def __init__(self, pool: SQLiteConnectionPool):
+        self.pool = pool
+    
+    def save(self, payment: Payment) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(UPSERT_PAYMENT, (
+                payment.id, payment.booking_id, str(payment.amount.amount), payment.amount.currency,
+                payment.payment_method.value, payment.stripe_payment_id, payment.payment_status.value,
+                payment.processed_at.isoformat() if payment.processed_at else None
+            ))
+    
+    def get_by_id(self, payment_id: str) -> Optional[Payment]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_BY_ID, (payment_id,)).fetchone()
+        return _from_row(row) if row else None
+    
+    def get_by_booking_id(self, booking_id: str) -> List[Payment]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_BY_BOOKING, (booking_id,)).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_all(self) -> List[Payment]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ALL).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_by_booking_ids(self, booking_ids: List[str]) -> Dict[str, List[Payment]]:
+        payments: Dict[str, List[Payment]] = {booking_id: [] for booking_id in booking_ids}
+        with self.pool.connection() as conn:
+            rows = select_in(conn, SELECT_BY_BOOKINGS, list(payments))
+        for row in rows:
+            payments[row["booking_id"]].append(_from_row(row))
+        return payments
+
+def _from_row(row: sqlite3.Row) -> Payment:
+    return Payment(
+        booking_id=row["booking_id"],
+        amount=Money(amount=Decimal(row["amount"]), currency=row["currency"]),
+        payment_method=PaymentMethod(row["payment_method"]),
+        id=row["id"],
+        stripe_payment_id=row["stripe_payment_id"],
+        payment_status=PaymentStatus(row["payment_status"]),
+        processed_at=datetime.fromisoformat(row["processed_at"]) if row["processed_at"] else None
+    )
\ No newline at end of file
@@ -0,0 +1,83 @@
+from .connection_pool import SQLiteConnectionPool
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS franchises (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    city TEXT NOT NULL,
+    postal_code TEXT NOT NULL,
+    max_capacity INTEGER NOT NULL,
+    standard_rate TEXT NOT NULL,
+    peak_hour_rate TEXT NOT NULL,
+    open_time TEXT NOT NULL,
+    close_time TEXT NOT NULL,
+    operating_days TEXT NOT NULL,
+    is_active INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS bookings (
+    id TEXT PRIMARY KEY,
+    franchise_id TEXT NOT NULL,
+    booking_day TEXT NOT NULL,
+    start_datetime TEXT NOT NULL,
+    end_datetime TEXT NOT NULL,
+    booking_status TEXT NOT NULL,
+    payment_status TEXT NOT NULL,
+    total_amount TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    reference_number TEXT NOT NULL,
+    qr_code_url TEXT NOT NULL,
+    customer_name TEXT NOT NULL,
+    customer_email TEXT NOT NULL,
+    customer_phone TEXT NOT NULL,
+    emergency_contact TEXT NOT NULL,
+    child_name TEXT NOT NULL,
+    child_age INTEGER NOT NULL,
+    special_needs TEXT NOT NULL,
+    allergies TEXT NOT NULL,
+    pickup_authorization TEXT NOT NULL,
+    special_instructions TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bookings_franchise_day ON bookings (franchise_id, booking_day);
+CREATE INDEX IF NOT EXISTS idx_bookings_franchise_start ON bookings (franchise_id, start_datetime);
+
+CREATE TABLE IF NOT EXISTS payments (
+    id TEXT PRIMARY KEY,
+    booking_id TEXT NOT NULL,
+    amount TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    payment_method TEXT NOT NULL,
+    stripe_payment_id TEXT NOT NULL,
+    payment_status TEXT NOT NULL,
+    processed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_payments_booking ON payments (booking_id);
+
+CREATE TABLE IF NOT EXISTS booking_sessions (
+    id TEXT PRIMARY KEY,
+    booking_id TEXT NOT NULL,
+    staff_member_id TEXT NOT NULL,
+    session_status TEXT NOT NULL,
+    check_in_time TEXT,
+    check_out_time TEXT,
+    parent_photo TEXT,
+    additional_charges TEXT NOT NULL,
+    session_notes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_booking ON booking_sessions (booking_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_status ON booking_sessions (session_status);
+
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_idempotency_expires ON idempotency_keys (expires_at);
+"""
+
+def create_schema(pool: SQLiteConnectionPool) -> None:
+    with pool.connection() as conn:
+        conn.executescript(SCHEMA)
\ No newline at end of file
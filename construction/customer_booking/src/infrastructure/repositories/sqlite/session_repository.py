@@ -0,0 +1,109 @@
+import json
+import sqlite3
+from datetime import datetime
+from typing import List, Optional
+from ....domain.entities.booking_session import BookingSession, SessionStatus
+from ....domain.value_objects.admin_value_objects import ParentPhoto, AdditionalCharge, SessionNotes
+from .connection_pool import SQLiteConnectionPool
+
+UPSERT_SESSION = """
+INSERT INTO booking_sessions (
+    id, booking_id, staff_member_id, session_status, check_in_time, check_out_time,
+    parent_photo, additional_charges, session_notes
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    session_status = excluded.session_status,
+    check_in_time = excluded.check_in_time,
+    check_out_time = excluded.check_out_time,
+    parent_photo = excluded.parent_photo,
+    additional_charges = excluded.additional_charges,
+    session_notes = excluded.session_notes
+"""
+SELECT_BY_ID = "SELECT * FROM booking_sessions WHERE id = ?"
+SELECT_BY_BOOKING = "SELECT * FROM booking_sessions WHERE booking_id = ? ORDER BY rowid LIMIT 1"
+SELECT_BY_STATUS = "SELECT * FROM booking_sessions WHERE session_status = ? ORDER BY rowid"
+SELECT_ACTIVE = "SELECT * FROM booking_sessions WHERE session_status IN ('STARTED', 'CHECKED_IN') ORDER BY rowid"
+SELECT_ACTIVE_PAGE = """
+SELECT * FROM booking_sessions WHERE session_status IN ('STARTED', 'CHECKED_IN') AND id > ? ORDER BY id LIMIT ?
+"""
+SELECT_ALL = "SELECT * FROM booking_sessions ORDER BY rowid"
+
+class SQLiteBookingSessionRepository:
+    def __init__(self, pool: SQLiteConnectionPool):
+        self.pool = pool
+    
+    def save(self, session: BookingSession) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(UPSERT_SESSION, _to_row(session))
+    
+    def save_all(self, sessions: List[BookingSession]) -> None:
+        with self.pool.connection() as conn:
+            conn.executemany(UPSERT_SESSION, [_to_row(session) for session in sessions])
+    
+    def get_by_id(self, session_id: str) -> Optional[BookingSession]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_BY_ID, (session_id,)).fetchone()
+        return _from_row(row) if row else None
+    
+    def get_by_booking_id(self, booking_id: str) -> Optional[BookingSession]:
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_BY_BOOKING, (booking_id,)).fetchone()
+        return _from_row(row) if row else None
+    
+    def get_by_status(self, status: SessionStatus) -> List[BookingSession]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_BY_STATUS, (status.value,)).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_active_sessions(self) -> List[BookingSession]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ACTIVE).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_active_page(self, after_id: Optional[str], limit: int) -> List[BookingSession]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ACTIVE_PAGE, (after_id or "", limit)).fetchall()
+        return [_from_row(row) for row in rows]
+    
+    def get_all(self) -> List[BookingSession]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_ALL).fetchall()
+        return [_from_row(row) for row in rows]
+
+def _to_row(session: BookingSession) -> tuple:
+    photo, notes = session.parent_photo, session.session_notes
+    return (
+        session.id, session.booking_id, session.staff_member_id, session.session_status.value,
+        _format_datetime(session.check_in_time), _format_datetime(session.check_out_time),
+        json.dumps([photo.photo_data, photo.captured_at.isoformat(), photo.staff_member_id]) if photo else None,
+        json.dumps([[c.charge_type, c.amount, c.description, c.applied_at.isoformat()]
+                    for c in session.additional_charges]),
+        json.dumps([notes.content, notes.created_by, notes.created_at.isoformat()]) if notes else None
+    )
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+def _from_row(row: sqlite3.Row) -> BookingSession:
+    photo, notes = row["parent_photo"], row["session_notes"]
+    if photo:
+        photo_data, captured_at, staff_member_id = json.loads(photo)
+        photo = ParentPhoto(photo_data, datetime.fromisoformat(captured_at), staff_member_id)
+    if notes:
+        content, created_by, created_at = json.loads(notes)
+        notes = SessionNotes(content, created_by, datetime.fromisoformat(created_at))
+    return BookingSession(
+        booking_id=row["booking_id"],
+        staff_member_id=row["staff_member_id"],
+        id=row["id"],
+        session_status=SessionStatus(row["session_status"]),
+        check_in_time=_parse_datetime(row["check_in_time"]),
+        check_out_time=_parse_datetime(row["check_out_time"]),
+        parent_photo=photo,
+        additional_charges=[AdditionalCharge(charge_type, amount, description, datetime.fromisoformat(applied_at))
+                            for charge_type, amount, description, applied_at in json.loads(row["additional_charges"])],
+        session_notes=notes
+    )
\ No newline at end of file
@@ -0,0 +1,125 @@
+from decimal import Decimal
+from ...domain.entities.booking import Booking
+from ...domain.entities.booking_session import BookingSession, SessionStatus
+from ...domain.entities.payment import Payment, PaymentMethod, PaymentStatus
+from ...domain.events.base_event import BaseEvent
+from ...domain.events.booking_events import BookingCreated, PaymentProcessed, BookingCancelled
+from ...domain.events.admin_events import (SessionStarted, ChildCheckedIn, OvertimeChargeApplied,
+                                           ChildCheckedOut, SessionCompleted)
+from ...domain.value_objects.admin_value_objects import ParentPhoto, AdditionalCharge, SessionNotes
+from ...domain.value_objects.child_info import ChildInfo
+from ...domain.value_objects.customer_info import CustomerInfo
+from ...domain.value_objects.money import Money
+
+class EventReplayer:
+    """Applies published domain events to the repositories to roll state forward"""
+    
+    def __init__(self, booking_repo, payment_repo, session_repo):
+        self.booking_repo = booking_repo
+        self.payment_repo = payment_repo
+        self.session_repo = session_repo
+        self._handlers = {
+            BookingCreated: self._booking_created,
+            PaymentProcessed: self._payment_processed,
+            BookingCancelled: self._booking_cancelled,
+            SessionStarted: self._session_started,
+            ChildCheckedIn: self._child_checked_in,
+            OvertimeChargeApplied: self._overtime_charge_applied,
+            ChildCheckedOut: self._child_checked_out,
+            SessionCompleted: self._session_completed,
+        }
+    
+    def apply(self, event: BaseEvent) -> None:
+        handler = self._handlers.get(type(event))
+        if handler:
+            handler(event)
+    
+    def _booking_created(self, event: BookingCreated) -> None:
+        if self.booking_repo.get_by_id(event.booking_id):
+            return
+        self.booking_repo.save(Booking(
+            franchise_id=event.franchise_id,
+            start_datetime=event.start_datetime,
+            end_datetime=event.end_datetime,
+            customer_info=CustomerInfo(
+                name=event.customer_name,
+                email=event.customer_email,
+                phone=event.customer_phone,
+                emergency_contact=event.emergency_contact
+            ),
+            child_info=ChildInfo(
+                name=event.child_name,
+                age=event.child_age,
+                special_needs=event.special_needs,
+                allergies=event.allergies,
+                pickup_authorization=event.pickup_authorization,
+                special_instructions=event.special_instructions
+            ),
+            total_amount=Money(amount=Decimal(str(event.total_amount)), currency=event.currency),
+            id=event.booking_id,
+            reference_number=event.reference_number
+        ))
+    
+    def _payment_processed(self, event: PaymentProcessed) -> None:
+        booking = self.booking_repo.get_by_id(event.booking_id)
+        if not booking or self.payment_repo.get_by_id(event.payment_id):
+            return
+        self.payment_repo.save(Payment(
+            booking_id=event.booking_id,
+            amount=Money(amount=Decimal(str(event.amount)), currency=event.currency),
+            payment_method=PaymentMethod(event.payment_method or PaymentMethod.CREDIT_CARD.value),
+            id=event.payment_id,
+            stripe_payment_id=event.stripe_payment_id,
+            payment_status=PaymentStatus.COMPLETED,
+            processed_at=event.timestamp
+        ))
+        booking.mark_paid()
+        self.booking_repo.save(booking)
+    
+    def _booking_cancelled(self, event: BookingCancelled) -> None:
+        booking = self.booking_repo.get_by_id(event.booking_id)
+        if booking:
+            booking.cancel_booking()
+            self.booking_repo.save(booking)
+    
+    def _session_started(self, event: SessionStarted) -> None:
+        if not self.session_repo.get_by_id(event.session_id):
+            self.session_repo.save(BookingSession(
+                booking_id=event.booking_id,
+                staff_member_id=event.staff_member_id,
+                id=event.session_id
+            ))
+    
+    def _child_checked_in(self, event: ChildCheckedIn) -> None:
+        session = self.session_repo.get_by_id(event.session_id)
+        if session:
+            session.session_status = SessionStatus.CHECKED_IN
+            session.check_in_time = event.check_in_time
+            session.parent_photo = ParentPhoto(event.photo_id, event.timestamp, event.staff_member_id)
+            self.session_repo.save(session)
+    
+    def _overtime_charge_applied(self, event: OvertimeChargeApplied) -> None:
+        session = self.session_repo.get_by_id(event.session_id)
+        # The charge is stamped with its event's timestamp; skip it if a snapshot already holds it
+        if session and not any(charge.applied_at == event.timestamp for charge in session.additional_charges):
+            session.add_charge(AdditionalCharge(
+                charge_type="overtime",
+                amount=event.charge_amount,
+                description=f"{event.overtime_minutes} minutes overtime",
+                applied_at=event.timestamp
+            ))
+            self.session_repo.save(session)
+    
+    def _child_checked_out(self, event: ChildCheckedOut) -> None:
+        session = self.session_repo.get_by_id(event.session_id)
+        if session:
+            session.session_status = SessionStatus.CHECKED_OUT
+            session.check_out_time = event.check_out_time
+            session.session_notes = SessionNotes(event.notes, event.staff_member_id, event.timestamp)
+            self.session_repo.save(session)
+    
+    def _session_completed(self, event: SessionCompleted) -> None:
+        session = self.session_repo.get_by_id(event.session_id)
+        if session:
+            session.complete_session()
+            self.session_repo.save(session)
\ No newline at end of file
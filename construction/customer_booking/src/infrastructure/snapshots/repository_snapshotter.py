@@ -0,0 +1,164 @@
+import gc
+from decimal import Decimal
+from typing import Optional, Tuple
+from ...domain.entities.booking import Booking, BookingStatus, PaymentStatus as BookingPaymentStatus
+from ...domain.entities.booking_session import BookingSession, SessionStatus
+from ...domain.entities.franchise import Franchise
+from ...domain.entities.payment import Payment, PaymentMethod, PaymentStatus
+from ...domain.value_objects.admin_value_objects import ParentPhoto, AdditionalCharge, SessionNotes
+from ...domain.value_objects.child_info import ChildInfo
+from ...domain.value_objects.customer_info import CustomerInfo
+from ...domain.value_objects.money import Money
+from .event_replayer import EventReplayer
+from .snapshot_store import SnapshotStore
+
+STATE_VERSION = 1
+
+# Enum lookups by value; calling the enum class is a noticeable share of restore time
+_BOOKING_STATUSES = {status.value: status for status in BookingStatus}
+_BOOKING_PAYMENT_STATUSES = {status.value: status for status in BookingPaymentStatus}
+
+class RepositorySnapshotter:
+    """Snapshots the in-memory repositories and restores them as snapshot + newer events.
+    
+    Entities are captured as plain tuples, which pickle far more compactly than the
+    dataclasses. The snapshot records the event store's next sequence number, so a
+    restore only replays events published after it was taken.
+    """
+    
+    def __init__(self, snapshot_store: SnapshotStore, event_store, franchise_repo, booking_repo,
+                 payment_repo, session_repo):
+        self.snapshot_store = snapshot_store
+        self.event_store = event_store
+        self.franchise_repo = franchise_repo
+        self.booking_repo = booking_repo
+        self.payment_repo = payment_repo
+        self.session_repo = session_repo
+    
+    def capture(self) -> Tuple[dict, int]:
+        """Copy current state; call once all events published so far are flushed.
+        
+        Commands may keep running while it copies. The sequence is read first, so
+        whatever they change is also in the events replayed after the snapshot, and
+        replaying an event whose effect was already captured leaves state unchanged.
+        """
+        sequence = self.event_store.next_sequence
+        state = {
+            "version": STATE_VERSION,
+            "franchises": [_franchise_row(f) for f in self.franchise_repo.get_all()],
+            "bookings": [_booking_row(b) for b in self.booking_repo.get_all()],
+            "payments": [_payment_row(p) for p in self.payment_repo.get_all()],
+            "sessions": [_session_row(s) for s in self.session_repo.get_all()],
+        }
+        return state, sequence
+    
+    def take_snapshot(self) -> int:
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            state, sequence = self.capture()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self.snapshot_store.write(state, sequence)
+        return sequence
+    
+    def restore(self) -> Optional[int]:
+        """Load the latest snapshot and replay newer events; returns events replayed, None without a snapshot"""
+        # Millions of new, long-lived objects would otherwise trigger repeated full collections
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            snapshot = self.snapshot_store.latest()
+            if snapshot is None:
+                return None
+            self._load(snapshot.state)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        
+        replayer = EventReplayer(self.booking_repo, self.payment_repo, self.session_repo)
+        replayed = 0
+        for stored in self.event_store.stream(snapshot.sequence):
+            replayer.apply(stored.event)
+            replayed += 1
+        return replayed
+    
+    def _load(self, state: dict) -> None:
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {state.get('version')}")
+        for row in state["franchises"]:
+            self.franchise_repo.save(_franchise_from_row(row))
+        for row in state["bookings"]:
+            self.booking_repo.save(_booking_from_row(row))
+        for row in state["payments"]:
+            self.payment_repo.save(_payment_from_row(row))
+        for row in state["sessions"]:
+            self.session_repo.save(_session_from_row(row))
+
+def _franchise_row(f: Franchise) -> tuple:
+    return (f.id, f.name, f.address, f.city, f.postal_code, f.max_capacity, str(f.standard_rate),
+            str(f.peak_hour_rate), f.open_time, f.close_time, tuple(f.operating_days), f.is_active)
+
+def _franchise_from_row(row: tuple) -> Franchise:
+    (id, name, address, city, postal_code, max_capacity, standard_rate, peak_hour_rate,
+     open_time, close_time, operating_days, is_active) = row
+    return Franchise(name, address, city, postal_code, max_capacity, Decimal(standard_rate),
+                     Decimal(peak_hour_rate), open_time, close_time, list(operating_days), id, is_active)
+
+def _booking_row(b: Booking) -> tuple:
+    customer, child = b.customer_info, b.child_info
+    return (b.id, b.franchise_id, b.start_datetime, b.end_datetime, b.booking_status.value,
+            b.payment_status.value, str(b.total_amount.amount), b.total_amount.currency,
+            b.reference_number, b.qr_code_url,
+            customer.name, customer.email, customer.phone, customer.emergency_contact,
+            child.name, child.age, child.special_needs, child.allergies,
+            child.pickup_authorization, child.special_instructions)
+
+def _booking_from_row(row: tuple) -> Booking:
+    (id, franchise_id, start_datetime, end_datetime, booking_status, payment_status, amount, currency,
+     reference_number, qr_code_url, customer_name, email, phone, emergency_contact,
+     child_name, age, special_needs, allergies, pickup_authorization, special_instructions) = row
+    return Booking(
+        franchise_id=franchise_id,
+        start_datetime=start_datetime,
+        end_datetime=end_datetime,
+        customer_info=CustomerInfo(customer_name, email, phone, emergency_contact),
+        child_info=ChildInfo(child_name, age, special_needs, allergies, pickup_authorization, special_instructions),
+        total_amount=Money(Decimal(amount), currency),
+        id=id,
+        reference_number=reference_number,
+        booking_status=_BOOKING_STATUSES[booking_status],
+        payment_status=_BOOKING_PAYMENT_STATUSES[payment_status],
+        qr_code_url=qr_code_url
+    )
+
+def _payment_row(p: Payment) -> tuple:
+    return (p.id, p.booking_id, str(p.amount.amount), p.amount.currency, p.payment_method.value,
+            p.stripe_payment_id, p.payment_status.value, p.processed_at)
+
+def _payment_from_row(row: tuple) -> Payment:
+    id, booking_id, amount, currency, method, stripe_payment_id, status, processed_at = row
+    return Payment(booking_id, Money(Decimal(amount), currency), PaymentMethod(method), id,
+                   stripe_payment_id, PaymentStatus(status), processed_at)
+
+def _session_row(s: BookingSession) -> tuple:
+    photo, notes = s.parent_photo, s.session_notes
+    return (s.id, s.booking_id, s.staff_member_id, s.session_status.value, s.check_in_time, s.check_out_time,
+            (photo.photo_data, photo.captured_at, photo.staff_member_id) if photo else None,
+            tuple((c.charge_type, c.amount, c.description, c.applied_at) for c in s.additional_charges),
+            (notes.content, notes.created_by, notes.created_at) if notes else None)
+
+def _session_from_row(row: tuple) -> BookingSession:
+    id, booking_id, staff_member_id, status, check_in_time, check_out_time, photo, charges, notes = row
+    return BookingSession(
+        booking_id=booking_id,
+        staff_member_id=staff_member_id,
+        id=id,
+        session_status=SessionStatus(status),
+        check_in_time=check_in_time,
+        check_out_time=check_out_time,
+        parent_photo=ParentPhoto(*photo) if photo else None,
+        additional_charges=[AdditionalCharge(*charge) for charge in charges],
+        session_notes=SessionNotes(*notes) if notes else None
+    )
\ No newline at end of file
@@ -0,0 +1,64 @@
+import os
+import pickle
+import struct
+import zlib
+from typing import List, NamedTuple, Optional
+
+MAGIC = b"CBSNAP1\n"
+HEADER = struct.Struct("<Q")  # event sequence number the snapshot covers
+SNAPSHOT_SUFFIX = ".snap"
+
+class Snapshot(NamedTuple):
+    sequence: int  # events numbered below this are already reflected in state
+    state: dict
+
+class SnapshotStore:
+    """Writes repository state as compressed pickles named <write number>-<event sequence>.snap.
+    
+    Snapshots are ordered and pruned by write number, which only grows, not by event
+    sequence: a store that restarted numbering must not make newer snapshots look older.
+    """
+    
+    def __init__(self, directory: str, keep: int = 2, compression_level: int = 1):
+        self.directory = directory
+        self.keep = keep
+        self.compression_level = compression_level
+        os.makedirs(directory, exist_ok=True)
+    
+    def write(self, state: dict, sequence: int) -> str:
+        paths = self._paths()
+        number = _write_number(paths[-1]) + 1 if paths else 0
+        path = os.path.join(self.directory, f"{number:020d}-{sequence:020d}{SNAPSHOT_SUFFIX}")
+        payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), self.compression_level)
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(HEADER.pack(sequence))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+        for expired in self._paths()[:-self.keep]:
+            os.remove(expired)
+        return path
+    
+    def latest(self) -> Optional[Snapshot]:
+        paths = self._paths()
+        if not paths:
+            return None
+        with open(paths[-1], "rb") as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Not a snapshot file: {paths[-1]}")
+        (sequence,) = HEADER.unpack_from(data, len(MAGIC))
+        state = pickle.loads(zlib.decompress(data[len(MAGIC) + HEADER.size:]))
+        return Snapshot(sequence, state)
+    
+    def _paths(self) -> List[str]:
+        """Snapshot files, oldest write first"""
+        names = [name for name in os.listdir(self.directory) if name.endswith(SNAPSHOT_SUFFIX)]
+        return sorted((os.path.join(self.directory, name) for name in names), key=_write_number)
+
+def _write_number(path: str) -> int:
+    # Files from before write numbering are named <sequence>.snap; their sequence orders them
+    return int(os.path.basename(path)[:-len(SNAPSHOT_SUFFIX)].split("-")[0])
\ No newline at end of file